@@ -4,6 +4,7 @@
 """
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Dict, List
 
 
 class Settings(BaseSettings):
@@ -23,6 +24,52 @@ class Settings(BaseSettings):
 
     # Cache Settings
     cache_ttl: int = 3600  # 1시간 (초 단위)
+    history_cache_ttl: int = 86400  # 지난 구간(과거 10년 단위 청크) 캐시 시간 (초)
+    cache_backend: str = "file"  # file(워커 간 공유) | redis | memory(테스트용)
+    cache_dir: str = ""  # 비어 있으면 시스템 임시 디렉토리 사용
+    cache_stale_ttl: int = 86400  # 만료 후에도 stale 값으로 보관하는 시간 (초)
+    cache_lock_lease: int = 30  # 프로세스 간 fetch 잠금 lease (초)
+    redis_url: str = "redis://localhost:6379/0"
+    cache_memory_budget_mb: int = 256  # 프로세스 내부 캐시 전체의 메모리 예산 (MB, 넘으면 LRU 제거)
+    vintage_dir: str = ""  # ALFRED 빈티지 저장 경로 (비어 있으면 CACHE_DIR/vintages)
+
+    # Catalog Settings
+    metadata_ttl: int = 21600  # FRED 시리즈 메타데이터 캐시 시간 (초)
+    update_check_ttl: int = 300  # refresh 전 FRED last_updated 확인 결과 캐시 시간 (초)
+    catalog_sync_interval: int = 5  # 다른 워커의 카탈로그 등록 확인 주기 (초)
+    catalog_max_registered: int = 50  # 런타임에 등록할 수 있는 시리즈 수 (refresh/백분위/AI 비용 상한)
+
+    # Response Deadline Settings
+    category_deadline_ms: int = 0  # 카테고리 응답 마감 시간 (ms, 0이면 모두 기다림, X-Deadline-Ms 헤더로 변경 가능)
+    category_deadlines: Dict[str, int] = {}  # 카테고리별 마감 시간 (예: {"employment": 1500})
+
+    # Alert Settings
+    alert_max_rules: int = 500  # 등록할 수 있는 알림 규칙 수
+    alert_webhook_timeout: float = 5.0  # 웹훅 요청 타임아웃 (초)
+    alert_webhook_secret: str = ""  # 설정하면 X-Alert-Signature 헤더(HMAC-SHA256)로 본문 서명
+    alert_webhook_hosts: List[str] = []  # 웹훅 허용 호스트 (비어 있으면 공인 IP로 해석되는 호스트만 허용)
+
+    # Refresh Settings
+    refresh_interval: int = 300  # 백그라운드 refresh 주기 (초, 0이면 비활성화)
+
+    # AI Settings
+    insight_cache_ttl: int = 604800  # 빠른 인사이트 캐시 시간 (초, 값이 바뀌면 다시 생성)
+    insight_failure_ttl: int = 120  # 인사이트 생성 실패/생성 중 표시 유지 시간 (초, 이 동안 다시 생성하지 않음)
+    ai_context_token_budget: int = 1500  # 종합 분석 프롬프트의 지표 컨텍스트 토큰 예산 (추정치)
+
+    # Admission Control (워커 단위)
+    ai_max_concurrent: int = 2  # 동시에 실행하는 Gemini 호출 수
+    ai_queue_size: int = 4  # 대기열 크기 (넘치면 429)
+    ai_rate_limit: int = 10  # 클라이언트당 분당 AI 분석 요청 수
+    export_max_concurrent: int = 4  # 동시에 실행하는 내보내기 수
+    export_queue_size: int = 8
+    export_rate_limit: int = 30  # 클라이언트당 분당 내보내기 요청 수
+    admission_queue_timeout: float = 30.0  # 대기열 최대 대기 시간 (초)
+    trusted_proxy_hops: int = 0  # 앞단 신뢰 프록시 수 (X-Forwarded-For 오른쪽에서 이만큼 떨어진 주소를 클라이언트로 사용, 0이면 무시)
+
+    # Admin / Profiling
+    admin_token: str = ""  # 비어 있으면 관리자 엔드포인트와 프로파일링 비활성화
+    profile_keep: int = 20  # 보관할 프로파일 리포트 수
 
     # FRED API 설정
     fred_base_url: str = "https://api.stlouisfed.org/fred"
@@ -1,20 +1,47 @@
 """
 FastAPI 메인 애플리케이션
 """
-from fastapi import FastAPI
+import time
+
+_import_started = time.perf_counter()
+
+import asyncio
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import get_settings
-from app.routes import indicators, analysis
+from app.routes import indicators, analysis, analytics, stream, catalog, export, admin, alerts
+from app.services.alert_service import get_alert_engine
+from app.services.rolling_stats import get_rolling_registry
+from app.services.update_hub import get_update_hub
+from app.services.scheduler import start_scheduler, shutdown_scheduler
+from app.services.series_catalog import get_series_catalog
+from app.services.snapshot_service import get_indicator_snapshot
+from app.services.profiling_service import ProfilerBusy, RequestProfiler, get_profile_store
+from app.utils.admission import AdmissionRejected
+from app.utils.auth import is_admin_token
+from app.utils.timing import TimedJSONResponse, format_server_timing, start_request_timing
 
 settings = get_settings()
 
+# 시작 시간 측정 (import 완료 → 준비 완료)
+startup_timings = {
+    "import_ms": round((time.perf_counter() - _import_started) * 1000, 1),
+    "ready_ms": None
+}
+readiness = {
+    "startup": False,
+    "catalog": False
+}
+
 app = FastAPI(
     title="US Economic Dashboard API",
     description="미국 경제 지표 대시보드 - FRED API & AI 분석",
     version="1.0.0",
     debug=settings.debug,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=TimedJSONResponse
 )
 
 # CORS 미들웨어 - 프로덕션 환경 대응
@@ -38,10 +65,62 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "Retry-After", "X-Profile-Id"],
 )
 
+
+@app.middleware("http")
+async def timing_middleware(request: Request, call_next):
+    """
+    요청별 구간 시간(get_series, upstream, transform, serialize, llm)을 Server-Timing 헤더로 반환합니다.
+    관리자 토큰과 X-Profile: 1 헤더가 있으면 이 요청만 프로파일링해서 리포트를 저장합니다.
+    """
+    spans = start_request_timing()
+
+    profiler = None
+    if request.headers.get("x-profile") == "1" and is_admin_token(request.headers.get("x-admin-token")):
+        profiler = RequestProfiler()
+        try:
+            profiler.start()
+        except ProfilerBusy as e:
+            return JSONResponse(status_code=409, content={"detail": str(e)})
+
+    started = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        if profiler is not None:
+            profiler.stop()
+    total_ms = (time.perf_counter() - started) * 1000
+
+    response.headers["Server-Timing"] = format_server_timing(spans, total_ms)
+    if profiler is not None:
+        profile_id = await asyncio.to_thread(
+            get_profile_store().save, profiler, request.method, request.url.path, response.status_code, total_ms
+        )
+        response.headers["X-Profile-Id"] = profile_id
+
+    return response
+
+
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected_handler(request: Request, exc: AdmissionRejected):
+    """동시 실행/요청 빈도 제한 초과 → 429 + Retry-After"""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": exc.detail},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+
 app.include_router(indicators.router)
 app.include_router(analysis.router)
+app.include_router(analytics.router)
+app.include_router(stream.router)
+app.include_router(catalog.router)
+app.include_router(export.router)
+app.include_router(admin.router)
+app.include_router(alerts.router)
 
 
 @app.get("/", tags=["Root"])
@@ -57,16 +136,67 @@ async def root():
 
 @app.get("/health", tags=["Health"])
 async def health_check():
-    """헬스 체크 엔드포인트"""
+    """
+    헬스 체크 엔드포인트 (liveness)
+    프로세스가 응답만 하면 healthy이며, 준비 상태는 ready 필드와 /health/ready로 확인
+    """
     return {
         "status": "healthy",
+        "ready": all(readiness.values()),
         "debug_mode": settings.debug
     }
 
 
+@app.get("/health/ready", tags=["Health"])
+async def readiness_check():
+    """
+    준비 상태 체크 엔드포인트 (readiness)
+    시작 작업(카탈로그 로드 등)이 끝나기 전에는 503을 반환합니다.
+    """
+    ready = all(readiness.values())
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "starting",
+            "checks": readiness,
+            "startup": startup_timings
+        }
+    )
+
+
+async def warm_up():
+    """
+    요청 처리 전에 필요한 상태를 백그라운드에서 준비합니다.
+    liveness는 바로 응답하고, 끝나면 readiness가 true가 됩니다.
+    """
+    try:
+        await get_series_catalog().sync(force=True)
+        readiness["catalog"] = True
+    except Exception as e:
+        print(f"❌ 카탈로그 로드 실패: {str(e)}")
+        return
+
+    try:
+        await get_alert_engine().sync(force=True)
+    except Exception as e:
+        print(f"⚠️ 알림 규칙 로드 실패: {str(e)}")
+
+    startup_timings["ready_ms"] = round((time.perf_counter() - _import_started) * 1000, 1)
+    print(f"✅ 준비 완료 (import {startup_timings['import_ms']}ms, ready {startup_timings['ready_ms']}ms)")
+
+
 @app.on_event("startup")
 async def startup_event():
     """서버 시작 이벤트"""
+    # 시리즈 저장소 리스너 등록 (롤링 통계 증분 갱신 → 구독자 push, 최신 값 스냅샷, 알림 규칙 평가)
+    get_rolling_registry()
+    get_update_hub()
+    get_indicator_snapshot()
+    get_alert_engine()
+    start_scheduler()
+    readiness["startup"] = True
+    asyncio.create_task(warm_up())
+
     print("=" * 60)
     print("🚀 US Economic Dashboard API 서버 시작!")
     print(f"📊 Swagger UI: http://localhost:{settings.port}/docs")
@@ -78,6 +208,7 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """서버 종료 이벤트"""
+    shutdown_scheduler()
     print("\n" + "=" * 60)
     print("👋 US Economic Dashboard API 서버 종료 중...")
     print("=" * 60)
@@ -0,0 +1,24 @@
+"""
+알림 규칙 요청 모델
+"""
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class AlertRuleCreate(BaseModel):
+    """
+    알림 규칙 등록 요청
+
+    - threshold: 값이 기준선을 넘어가는/돌아오는 순간 (예: T10Y2Y < 0)
+    - rise_from_low: 최근 window_months 최저치 대비 threshold 이상 상승 (Sahm rule 방식, 예: UNRATE +0.5pp)
+    - jump: 직전 window개 평균 대비 threshold% 이상 변화 (예: ICSA 급증)
+    """
+    series_id: str = Field(..., description="FRED 시리즈 ID (예: 'T10Y2Y')")
+    kind: Literal["threshold", "rise_from_low", "jump"] = Field(..., description="규칙 종류")
+    name: Optional[str] = Field(None, description="표시 이름")
+    op: Literal["<", "<=", ">", ">="] = Field("<", description="threshold 비교 연산자")
+    threshold: float = Field(..., description="기준값 (threshold: 값, rise_from_low: 상승 폭, jump: 변화율 %)")
+    window: int = Field(1, ge=1, le=52, description="jump 비교 기준 (직전 관측값 개수)")
+    window_months: int = Field(12, ge=1, le=60, description="rise_from_low 최저치 기간 (개월)")
+    smooth: int = Field(1, ge=1, le=12, description="rise_from_low 이동평균 관측값 개수 (Sahm rule은 3)")
+    webhook_url: Optional[str] = Field(None, description="알림을 받을 웹훅 URL (http/https, 로컬 테스트는 local://receiver)")
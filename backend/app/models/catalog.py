@@ -0,0 +1,14 @@
+"""
+시리즈 카탈로그 요청 모델
+"""
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class SeriesRegistration(BaseModel):
+    """
+    런타임 시리즈 등록 요청
+    """
+    series_id: str = Field(..., description="FRED 시리즈 ID (예: 'UNEMPLOY')")
+    category: str = Field(..., description="카테고리 (예: 'employment', 또는 새 카테고리)")
+    name: Optional[str] = Field(None, description="표시 이름 (없으면 FRED 제목 사용)")
@@ -0,0 +1,69 @@
+"""
+관리자 API 라우터
+프로파일 리포트, 메모리 사용량 조회 등 운영용 엔드포인트 (X-Admin-Token 필요)
+"""
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import HTMLResponse, PlainTextResponse
+
+from app.services.percentile_index import get_percentile_registry
+from app.services.profiling_service import get_profile_store
+from app.services.series_store import get_series_store
+from app.utils.auth import require_admin
+from app.utils.cache import get_memory_budget
+
+try:
+    import resource
+except ImportError:  # Windows 등 resource 모듈이 없는 환경
+    resource = None
+
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin)]
+)
+
+
+@router.get("/profiles")
+async def list_profiles():
+    """
+    저장된 요청 프로파일 목록 (최신순)
+    요청에 X-Admin-Token과 X-Profile: 1 헤더를 붙이면 해당 요청이 프로파일링됩니다.
+    """
+    return {"profiles": get_profile_store().list()}
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(profile_id: str):
+    """
+    프로파일 리포트를 반환합니다. (pyinstrument: HTML, cProfile: 텍스트)
+    """
+    profile = get_profile_store().get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"프로파일을 찾을 수 없습니다: {profile_id}")
+
+    if profile["format"] == "html":
+        return HTMLResponse(profile["report"])
+    return PlainTextResponse(profile["report"])
+
+
+@router.get("/memory")
+async def get_memory_usage():
+    """
+    캐시 계층별 메모리 사용량 (워커 단위)
+
+    - cache.layers: 프로세스 내부 캐시별 바이트/엔트리 수/적중률/제거 수 (CACHE_MEMORY_BUDGET_MB 예산 공유)
+    - store: 시리즈 저장소 (예산 밖, 보고만)
+    - percentile_index: 백분위 인덱스의 전체 히스토리 (예산 밖, 보고만)
+    - process: 프로세스 최대 RSS
+    """
+    process = {}
+    if resource is not None:
+        # Linux는 KB 단위
+        process["max_rss_bytes"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    return {
+        "cache": get_memory_budget().stats(),
+        "store": get_series_store().memory_usage(),
+        "percentile_index": get_percentile_registry().memory_usage(),
+        "process": process
+    }
@@ -0,0 +1,129 @@
+"""
+알림 API 라우터
+알림 규칙 조회/등록/삭제와 최근 알림 조회(관리자 전용), 로컬 웹훅 수신기 엔드포인트
+"""
+from typing import Dict
+
+from fastapi import APIRouter, Depends, Query, HTTPException
+
+from app.config import get_settings
+from app.models.alerts import AlertRuleCreate
+from app.services.alert_service import LOCAL_RECEIVER_URL, get_alert_engine, validate_webhook_url
+from app.services.fred_service import get_fred_service
+from app.services.series_catalog import get_series_catalog
+from app.services.series_store import get_series_store
+from app.utils.auth import require_admin
+
+settings = get_settings()
+
+router = APIRouter(
+    prefix="/api/alerts",
+    tags=["Alerts"]
+)
+
+
+@router.get("", dependencies=[Depends(require_admin)])
+async def list_alert_rules():
+    """
+    등록된 알림 규칙과 규칙별 평가 상태를 보여줍니다. (관리자 전용 - 웹훅 URL 자체가 비밀 값)
+    """
+    engine = get_alert_engine()
+    await engine.sync()
+
+    rules = engine.rules()
+    return {
+        "rules": rules,
+        "count": len(rules)
+    }
+
+
+@router.post("", dependencies=[Depends(require_admin)])
+async def create_alert_rule(request: AlertRuleCreate):
+    """
+    알림 규칙을 등록합니다. (관리자 전용 - 서버가 웹훅으로 요청을 보내므로)
+    등록 이후 refresh에서 새로 들어온 관측값만 평가하며, 과거 조건으로는 알림을 보내지 않습니다.
+    """
+    catalog = get_series_catalog()
+    await catalog.sync()
+
+    series_id = request.series_id.strip().upper()
+    if not catalog.contains(series_id):
+        raise HTTPException(status_code=400, detail=f"카탈로그에 없는 시리즈: {series_id}")
+
+    webhook_url = request.webhook_url
+    if webhook_url and webhook_url != LOCAL_RECEIVER_URL:
+        try:
+            await validate_webhook_url(webhook_url)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    # 저장소에 데이터가 없으면 먼저 가져와서 평가 상태를 채움
+    if get_series_store().latest(series_id) is None:
+        fred_service = get_fred_service()
+        try:
+            await fred_service.get_series(series_id)
+        except Exception as e:
+            print(f"⚠️ 알림 규칙 초기 데이터 로드 실패: {str(e)} - {series_id}")
+        finally:
+            await fred_service.close()
+
+    engine = get_alert_engine()
+    await engine.sync(force=True)
+    try:
+        rule = await engine.add_rule({**request.model_dump(), "series_id": series_id})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    print(f"🔔 알림 규칙 등록: {rule['id']} ({series_id} {rule['kind']})")
+    return rule
+
+
+@router.delete("/{rule_id}", dependencies=[Depends(require_admin)])
+async def delete_alert_rule(rule_id: str):
+    """
+    알림 규칙을 삭제합니다. (관리자 전용)
+    """
+    engine = get_alert_engine()
+    if not await engine.remove_rule(rule_id):
+        raise HTTPException(status_code=404, detail=f"없는 알림 규칙: {rule_id}")
+    return {"deleted": rule_id}
+
+
+@router.get("/events", dependencies=[Depends(require_admin)])
+async def list_alert_events(
+        limit: int = Query(50, ge=1, le=200, description="최대 알림 수")
+):
+    """
+    이 워커에서 발생한 최근 알림을 최신순으로 보여줍니다. (관리자 전용)
+    """
+    events = get_alert_engine().events(limit)
+    return {
+        "events": events,
+        "count": len(events)
+    }
+
+
+@router.post("/receiver")
+async def receive_alert(payload: Dict):
+    """
+    웹훅 수신기 대체 엔드포인트 (DEBUG 모드 전용)
+    규칙의 webhook_url을 이 주소로 지정하면 실제 HTTP 발송 경로를 로컬에서 확인할 수 있습니다.
+    """
+    if not settings.debug:
+        raise HTTPException(status_code=404, detail="Not Found")
+    get_alert_engine().receiver.receive(payload)
+    return {"received": True}
+
+
+@router.get("/receiver")
+async def list_received_alerts():
+    """
+    로컬 수신기가 받은 알림을 보여줍니다. (DEBUG 모드 전용)
+    """
+    if not settings.debug:
+        raise HTTPException(status_code=404, detail="Not Found")
+    received = get_alert_engine().receiver.received()
+    return {
+        "received": received,
+        "count": len(received)
+    }
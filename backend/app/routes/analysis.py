@@ -2,62 +2,106 @@
 AI 분석 API 라우터
 Gemini를 사용한 경제 분석 엔드포인트
 """
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, HTTPException
 from app.services.gemini_service import get_gemini_service
 from app.services.fred_service import get_fred_service
-from app.utils.constants import INDICATOR_CATEGORIES
+from app.services.snapshot_service import get_indicator_snapshot
+from app.utils.admission import AdmissionRejected, rate_limit
+from app.utils.singleflight import SingleFlight
 
 router = APIRouter(
     prefix="/api/analysis",
     tags=["AI Analysis"]
 )
 
+# 같은 스냅샷에 대한 분석 요청은 하나로 합쳐 결과를 공유
+analysis_flight = SingleFlight()
 
-@router.post("/generate")
+
+@router.post("/generate", dependencies=[Depends(rate_limit("ai"))])
 async def generate_analysis():
     """
     현재 경제 상황에 대한 AI 분석을 생성합니다.
+    같은 스냅샷으로 진행 중인 분석이 있으면 새로 호출하지 않고 그 결과를 함께 받습니다.
     """
     gemini_service = get_gemini_service()
     fred_service = get_fred_service()
 
     try:
-        # 최신 경제 지표 수집
-        indicators = {}
-
-        for category, series_dict in INDICATOR_CATEGORIES.items():
-            indicators[category] = {}
-
-            for series_id, name in series_dict.items():
-                print(f"📊 {series_id} 최신 값 가져오는 중...")
-                latest = await fred_service.get_latest_value(series_id)
-
-                if latest:
-                    indicators[category][series_id] = {
-                        "name": name,
-                        "value": latest["value"],
-                        "date": latest["date"]
-                    }
-
+        # 최신 경제 지표 스냅샷 (이미 refresh된 값이면 FRED 호출 없음)
+        snapshot = await get_indicator_snapshot().get(fred_service)
         await fred_service.close()
 
         # AI 분석 생성
-        print("🤖 Gemini AI 분석 생성 중...")
-        analysis = await gemini_service.analyze_economy(indicators)
+        print(f"🤖 Gemini AI 분석 생성 중... (스냅샷 v{snapshot['version']})")
+        analysis = await analysis_flight.do(
+            f"analysis:{snapshot['version']}",
+            lambda: gemini_service.analyze_economy(snapshot)
+        )
 
         return {
             "analysis": analysis,
-            "indicators_used": indicators,
-            "model": "Google Gemini 1.5 Flash"
+            "indicators_used": snapshot["categories"],
+            "snapshot_version": snapshot["version"],
+            "model": gemini_service.model_name or "Google Gemini"
         }
 
+    except AdmissionRejected:
+        raise
     except Exception as e:
         await fred_service.close()
         print(f"❌ 분석 생성 에러: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/test")
+@router.get("/insights", dependencies=[Depends(rate_limit("ai"))])
+async def get_quick_insights(
+        series: Optional[str] = Query(None, description="쉼표로 구분된 시리즈 ID (없으면 전체)")
+):
+    """
+    지표별 한 문장 인사이트를 반환합니다. (IndicatorCard용)
+    모든 지표를 한 번의 AI 호출로 생성하고, 값이 바뀐 지표만 다시 생성합니다.
+    """
+    gemini_service = get_gemini_service()
+    fred_service = get_fred_service()
+
+    try:
+        snapshot = await get_indicator_snapshot().get(fred_service)
+        await fred_service.close()
+    except Exception as e:
+        await fred_service.close()
+        raise HTTPException(status_code=500, detail=str(e))
+
+    indicators = {
+        series_id: data
+        for category_data in snapshot["categories"].values()
+        for series_id, data in category_data.items()
+    }
+    if series:
+        requested = [s.strip().upper() for s in series.split(",") if s.strip()]
+        unknown = [s for s in requested if s not in indicators]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 시리즈: {', '.join(unknown)}")
+        indicators = {series_id: indicators[series_id] for series_id in requested}
+
+    insights = await gemini_service.generate_quick_insights(indicators)
+
+    return {
+        "insights": {
+            series_id: {
+                "name": data["name"],
+                "value": data["value"],
+                "date": data["date"],
+                "insight": insights[series_id]
+            }
+            for series_id, data in indicators.items()
+        },
+        "snapshot_version": snapshot["version"]
+    }
+
+
+@router.get("/test", dependencies=[Depends(rate_limit("ai"))])
 async def test_gemini():
     """
     Gemini API 연결 테스트
@@ -66,17 +110,20 @@ async def test_gemini():
 
     try:
         # 간단한 테스트
-        test_indicators = {
-            "interest_rates": {
-                "DFF": {
-                    "name": "Federal Funds Rate",
-                    "value": 5.5,
-                    "date": "2024-12-01"
+        test_snapshot = {
+            "version": None,
+            "categories": {
+                "interest_rates": {
+                    "DFF": {
+                        "name": "Federal Funds Rate",
+                        "value": 5.5,
+                        "date": "2024-12-01"
+                    }
                 }
             }
         }
 
-        analysis = await gemini_service.analyze_economy(test_indicators)
+        analysis = await gemini_service.analyze_economy(test_snapshot)
 
         return {
             "status": "success",
@@ -84,6 +131,8 @@ async def test_gemini():
             "test_analysis": analysis
         }
 
+    except AdmissionRejected:
+        raise
     except Exception as e:
         return {
             "status": "error",
@@ -0,0 +1,113 @@
+"""
+지표 분석(Analytics) API 라우터
+여러 지표 간 상관관계 및 선행/후행 관계를 계산하는 엔드포인트
+"""
+from fastapi import APIRouter, Query, HTTPException
+from app.services.fred_service import get_fred_service
+from app.services.series_catalog import get_series_catalog
+from app.utils.date_utils import PERIOD_DAYS
+
+router = APIRouter(
+    prefix="/api/analytics",
+    tags=["Analytics"]
+)
+
+
+@router.get("/correlation")
+async def get_correlation(
+        series: str = Query(..., description="쉼표로 구분된 시리즈 ID (예: T10Y2Y,UNRATE)"),
+        window: str = Query("5y", description="분석 기간: 1y, 3y, 5y, 10y, 20y"),
+        freq: str = Query("M", description="공통 주기: W, M, Q, A"),
+        max_lag: int = Query(12, ge=0, le=36, description="최대 시차 (주기 단위)"),
+        transform: str = Query("level", description="변환: level, diff, pct")
+):
+    """
+    지표 간 상관행렬과 시차별 교차상관(lead/lag)을 계산합니다.
+
+    - lag > 0에서 상관이 높으면 series_a가 series_b를 lag 기간만큼 선행
+    - 예: T10Y2Y,UNRATE / PERMIT,GDPC1
+    """
+    # numpy 기반 서비스라서 처음 요청할 때 로드 (서버 시작 시간 단축)
+    from app.services.correlation_service import get_correlation_service, SUPPORTED_TRANSFORMS
+    from app.services.resample_service import SUPPORTED_FREQUENCIES
+
+    catalog = get_series_catalog()
+    await catalog.sync()
+
+    series_ids = [s.strip().upper() for s in series.split(",") if s.strip()]
+
+    # 파라미터 검증
+    unknown = [s for s in series_ids if not catalog.contains(s)]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 시리즈: {', '.join(unknown)}")
+    if len(set(series_ids)) < 2:
+        raise HTTPException(status_code=400, detail="2개 이상의 시리즈가 필요합니다.")
+    if window not in PERIOD_DAYS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 기간: {window}")
+    if freq not in SUPPORTED_FREQUENCIES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 주기: {freq}")
+    if transform not in SUPPORTED_TRANSFORMS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 변환: {transform}")
+
+    fred_service = get_fred_service()
+    correlation_service = get_correlation_service(fred_service)
+
+    try:
+        result = await correlation_service.analyze(series_ids, window, freq, max_lag, transform)
+        await fred_service.close()
+
+        return {
+            **result,
+            "names": {series_id: catalog.name(series_id) for series_id in result["series_ids"]},
+            "metadata": {
+                "source": "FRED"
+            }
+        }
+
+    except ValueError as e:
+        await fred_service.close()
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        await fred_service.close()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/expression")
+async def evaluate_expression(
+        expr: str = Query(..., description="수식 (예: DGS10 - DFF, DGS10 - yoy(CPIAUCSL), JTSJOL / UNEMPLOY)"),
+        period: str = Query("5y", description="기간: 1y, 3y, 5y, 10y, 20y")
+):
+    """
+    카탈로그 시리즈로 만든 수식(파생 시리즈)을 계산합니다.
+
+    - 연산자: +, -, *, /
+    - 함수: yoy(x), mom(x), ma(x, n), lag(x, n), resample(x, freq, agg)
+    - 주기가 다른 시리즈는 날짜별 직전 값으로 정렬해서 계산
+    - 입력 시리즈 데이터가 바뀌지 않으면 캐시된 결과를 반환
+    """
+    # numpy 기반 서비스라서 처음 요청할 때 로드 (서버 시작 시간 단축)
+    from app.services.expression_service import get_expression_service
+
+    if period not in PERIOD_DAYS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 기간: {period}")
+
+    fred_service = get_fred_service()
+    expression_service = get_expression_service(fred_service)
+
+    try:
+        result = await expression_service.evaluate(expr, period)
+        await fred_service.close()
+
+        return {
+            **result,
+            "metadata": {
+                "source": "FRED"
+            }
+        }
+
+    except ValueError as e:
+        await fred_service.close()
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        await fred_service.close()
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,135 @@
+"""
+시리즈 카탈로그 API 라우터
+런타임 시리즈 등록(관리자 전용)과 로컬 인덱스 기반 메타데이터 검색 엔드포인트
+"""
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, HTTPException
+
+from app.models.catalog import SeriesRegistration
+from app.services.fred_service import get_fred_service
+from app.services.series_catalog import get_series_catalog
+from app.utils.auth import require_admin
+
+router = APIRouter(
+    prefix="/api/catalog",
+    tags=["Catalog"]
+)
+
+
+@router.get("")
+async def list_catalog(
+        category: Optional[str] = Query(None, description="카테고리 필터")
+):
+    """
+    카탈로그에 등록된 시리즈 목록을 보여줍니다.
+    """
+    catalog = get_series_catalog()
+    await catalog.sync()
+
+    entries = catalog.entries(category)
+    return {
+        "series": entries,
+        "count": len(entries),
+        "categories": sorted(catalog.categories().keys()),
+        "version": catalog.version
+    }
+
+
+@router.get("/search")
+async def search_catalog(
+        q: str = Query(..., description="시리즈 ID 또는 제목 키워드 (예: 'treasury', 'UNRATE')"),
+        category: Optional[str] = Query(None, description="카테고리 필터"),
+        limit: int = Query(20, ge=1, le=200, description="최대 결과 수")
+):
+    """
+    로컬 인메모리 인덱스로 시리즈를 검색합니다. (FRED 검색 호출 없음)
+    """
+    catalog = get_series_catalog()
+    await catalog.sync()
+
+    results = catalog.search(q, category, limit)
+    return {
+        "query": q,
+        "results": results,
+        "count": len(results)
+    }
+
+
+@router.get("/{series_id}")
+async def get_catalog_entry(series_id: str):
+    """
+    시리즈 한 개의 카탈로그 정보를 보여줍니다.
+    메타데이터가 아직 없으면 FRED에서 가져와 로컬에 캐시합니다.
+    """
+    catalog = get_series_catalog()
+    await catalog.sync()
+
+    series_id = series_id.upper()
+    if not catalog.contains(series_id):
+        raise HTTPException(status_code=404, detail=f"카탈로그에 없는 시리즈: {series_id}")
+
+    if not catalog.get(series_id).get("last_updated"):
+        fred_service = get_fred_service()
+        try:
+            await catalog.enrich(fred_service, [series_id])
+        finally:
+            await fred_service.close()
+
+    return catalog.get(series_id)
+
+
+@router.post("/series", dependencies=[Depends(require_admin)])
+async def register_series(registration: SeriesRegistration):
+    """
+    시리즈를 런타임에 등록합니다. (관리자 전용 - 등록 시리즈마다 refresh/AI 호출이 늘어남)
+    FRED 메타데이터로 존재 여부를 확인한 뒤 모든 워커의 카탈로그에 반영됩니다.
+    """
+    catalog = get_series_catalog()
+    await catalog.sync(force=True)
+
+    series_id = registration.series_id.strip().upper()
+    existing = catalog.get(series_id)
+    if existing and existing.get("builtin"):
+        raise HTTPException(status_code=409, detail=f"이미 기본 지표로 등록된 시리즈: {series_id}")
+
+    fred_service = get_fred_service()
+
+    try:
+        metadata = await fred_service.get_series_info(series_id)
+        await fred_service.close()
+    except Exception as e:
+        await fred_service.close()
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if metadata is None:
+        raise HTTPException(status_code=404, detail=f"FRED에서 시리즈를 찾을 수 없습니다: {series_id}")
+
+    try:
+        entry = await catalog.register(series_id, registration.category.strip(), registration.name, metadata)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {
+        "status": "registered",
+        "series": entry,
+        "version": catalog.version
+    }
+
+
+@router.delete("/series/{series_id}", dependencies=[Depends(require_admin)])
+async def unregister_series(series_id: str):
+    """
+    런타임에 등록한 시리즈를 제거합니다. (관리자 전용, 기본 지표는 제거할 수 없습니다)
+    """
+    catalog = get_series_catalog()
+    await catalog.sync(force=True)
+
+    series_id = series_id.upper()
+    if not await catalog.unregister(series_id):
+        raise HTTPException(status_code=404, detail=f"런타임 등록 시리즈가 아닙니다: {series_id}")
+
+    return {
+        "status": "unregistered",
+        "series_id": series_id,
+        "version": catalog.version
+    }
@@ -0,0 +1,105 @@
+"""
+데이터 내보내기 API 라우터
+여러 시리즈의 전체 히스토리를 CSV / NDJSON / Parquet 스트림으로 내려받는 엔드포인트
+"""
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from app.services.export_service import (
+    EXPORT_FORMATS,
+    STREAMERS,
+    iter_export_chunks,
+    parquet_available
+)
+from app.services.fred_service import get_fred_service
+from app.services.series_catalog import get_series_catalog
+from app.utils.admission import AdmissionRejected, get_concurrency_limiter, rate_limit
+from app.utils.date_utils import HISTORY_START, validate_date
+
+router = APIRouter(
+    prefix="/api/export",
+    tags=["Export"]
+)
+
+
+@router.get("", dependencies=[Depends(rate_limit("export"))])
+async def export_series(
+        series: str = Query(..., description="쉼표로 구분된 시리즈 ID (예: DFF,DGS10)"),
+        format: str = Query("csv", description="포맷: csv, ndjson, parquet"),
+        start: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD, 없으면 관측 시작일)"),
+        end: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD, 없으면 오늘)")
+):
+    """
+    시리즈 전체 히스토리를 스트리밍으로 내보냅니다.
+    10년 단위 청크를 공유 캐시에서 읽어 바로 인코딩하므로
+    DFF 일별 데이터처럼 수십 년치를 요청해도 메모리 사용량이 일정합니다.
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 포맷: {format}")
+    if format == "parquet" and not parquet_available():
+        raise HTTPException(status_code=501, detail="Parquet 내보내기에는 pyarrow 패키지가 필요합니다.")
+    # 스트리밍이 시작되면 상태 코드를 바꿀 수 없으므로 날짜는 응답 전에 검증
+    validate_date(start, "start")
+    validate_date(end, "end")
+    if start and end and start > end:
+        raise HTTPException(status_code=400, detail=f"start({start})가 end({end})보다 늦습니다.")
+
+    catalog = get_series_catalog()
+    await catalog.sync()
+
+    series_ids = list(dict.fromkeys(s.strip().upper() for s in series.split(",") if s.strip()))
+    unknown = [s for s in series_ids if not catalog.contains(s)]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 시리즈: {', '.join(unknown)}")
+
+    fred_service = get_fred_service()
+
+    # 시작 날짜가 없으면 메타데이터의 관측 시작일부터 (빈 청크 요청 방지)
+    if not start:
+        await catalog.enrich(fred_service, [s for s in series_ids if not catalog.get(s).get("observation_start")])
+
+    series_ranges = [
+        (series_id, start or catalog.get(series_id).get("observation_start") or HISTORY_START, end)
+        for series_id in series_ids
+    ]
+
+    # 스트리밍이 끝날 때까지 슬롯 유지 (대기열이 가득 차면 응답 시작 전에 429)
+    limiter = get_concurrency_limiter("export")
+    try:
+        started = await limiter.acquire()
+    except AdmissionRejected:
+        await fred_service.close()
+        raise
+    released = False
+
+    def release():
+        nonlocal released
+        if not released:
+            released = True
+            limiter.release(started)
+
+    async def body():
+        try:
+            async for data in STREAMERS[format](iter_export_chunks(fred_service, series_ranges)):
+                yield data
+        except Exception as e:
+            print(f"❌ 내보내기 에러: {str(e)}")
+            raise
+        finally:
+            release()
+            await fred_service.close()
+
+    media_type, extension = EXPORT_FORMATS[format]
+    filename = f"fred_{'_'.join(series_ids)}_{datetime.now().strftime('%Y%m%d')}.{extension}"
+
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        # 스트림이 시작되지 않고 끝난 경우(연결 끊김 등)에도 슬롯 반환
+        background=BackgroundTask(release)
+    )
@@ -2,11 +2,20 @@
 경제 지표 API 라우터
 FRED 데이터를 조회하는 엔드포인트들을 정의합니다.
 """
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Header, Query, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import datetime
+import json
+from app.config import get_settings
 from app.services.fred_service import get_fred_service
-from app.utils.constants import INDICATOR_CATEGORIES, ALL_INDICATORS
+from app.services.percentile_index import LOOKBACKS
+from app.services.rolling_stats import get_rolling_registry
+from app.services.series_catalog import get_series_catalog
+from app.services.snapshot_service import get_indicator_snapshot
+from app.utils.date_utils import HISTORY_START, MAX_PERIOD, get_date_range, validate_date
+
+settings = get_settings()
 
 router = APIRouter(
     prefix="/api/indicators",
@@ -14,61 +23,104 @@ router = APIRouter(
 )
 
 
-def get_date_range(period: str):
+def validate_resample(freq: Optional[str], agg: str) -> None:
     """
-    기간 문자열을 날짜 범위로 변환합니다.
+    리샘플링 파라미터 검증
     """
-    period_days = {
-        "1m": 30,
-        "3m": 90,
-        "6m": 180,
-        "1y": 365,
-        "3y": 365 * 3,
-        "5y": 365 * 5
-    }
+    if freq is None:
+        return
+    # numpy 기반 서비스라서 리샘플링 요청이 들어올 때 로드
+    from app.services.resample_service import SUPPORTED_FREQUENCIES, SUPPORTED_AGGREGATIONS
+    if freq not in SUPPORTED_FREQUENCIES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 주기: {freq}")
+    if agg not in SUPPORTED_AGGREGATIONS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 집계 방식: {agg}")
 
-    days = period_days.get(period, 365)
-    end_date = datetime.now().strftime("%Y-%m-%d")
-    start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
 
-    return start_date, end_date
+def apply_resample(series_data: dict, freq: Optional[str], agg: str, as_of: Optional[str] = None) -> dict:
+    """
+    freq가 지정되면 서버에서 리샘플링한 데이터로 바꿉니다. (시리즈/주기/집계 단위 캐시)
+    """
+    if freq is None:
+        return series_data
+    from app.services.resample_service import resample_series_data
+    return resample_series_data(series_data, freq, agg, as_of)
 
 
-@router.get("/interest-rates")
-async def get_interest_rates(
-        period: str = Query("1y", description="기간: 1m, 3m, 6m, 1y, 3y, 5y")
-):
+def resolve_deadline(category: str, deadline_ms: Optional[int]) -> Optional[float]:
     """
-    금리 관련 지표를 가져옵니다.
-    - Federal Funds Rate (기준금리)
-    - 10-Year Treasury Rate
-    - 2-Year Treasury Rate
-    - 10Y-2Y Spread
-    - 30-Year Mortgage Rate
+    응답 마감 시간(초)을 정합니다.
+    X-Deadline-Ms 헤더 > 카테고리별 설정(CATEGORY_DEADLINES) > 기본값(CATEGORY_DEADLINE_MS), 0이면 마감 없음
+    """
+    if deadline_ms is None:
+        deadline_ms = settings.category_deadlines.get(category, settings.category_deadline_ms)
+    if deadline_ms < 0:
+        raise HTTPException(status_code=400, detail="X-Deadline-Ms는 0 이상이어야 합니다.")
+    return deadline_ms / 1000 if deadline_ms > 0 else None
+
+
+async def get_category_data(
+        category: str,
+        period: str,
+        freq: Optional[str] = None,
+        agg: str = "last",
+        deadline_ms: Optional[int] = None
+) -> dict:
     """
+    카탈로그에 등록된 카테고리의 시리즈 데이터를 가져옵니다.
+    freq를 지정하면 각 시리즈를 해당 주기로 리샘플링합니다.
+
+    마감 시간 안에 끝나지 않은 시리즈(예: 느린 JTSJOL)는 마지막으로 캐시된 값(stale)이나 pending으로 반환하고,
+    가져오기는 백그라운드에서 계속해서 캐시를 채웁니다. 어떤 시리즈가 그랬는지(에러가 난 시리즈는 failed)는 status에 표시합니다.
+    """
+    validate_resample(freq, agg)
+    deadline = resolve_deadline(category, deadline_ms)
+    # 카테고리는 여러 시리즈를 한 번에 반환하므로 전체 기간은 리샘플링할 때만 허용
+    if period == MAX_PERIOD and freq is None:
+        raise HTTPException(
+            status_code=400,
+            detail="period=max는 freq와 함께 사용하거나 /api/indicators/series/{id}의 페이지 조회를 사용해주세요."
+        )
+
+    catalog = get_series_catalog()
+    await catalog.sync()
+
+    series_ids = catalog.series_ids(category)
+    if not series_ids:
+        raise HTTPException(status_code=404, detail=f"카탈로그에 없는 카테고리: {category}")
+
     fred_service = get_fred_service()
 
     try:
         start_date, end_date = get_date_range(period)
 
-        # 금리 지표 가져오기
-        series_ids = list(INDICATOR_CATEGORIES["interest_rates"].keys())
-        data = await fred_service.get_multiple_series(
+        data, status = await fred_service.get_multiple_series_within(
             series_ids,
             start_date,
-            end_date
+            end_date,
+            deadline
         )
 
+        # 백그라운드 fetch가 남아 있으면 끝난 뒤에 종료됨
         await fred_service.close()
 
         return {
-            "category": "interest_rates",
+            "category": category,
             "period": period,
-            "data": data,
+            "data": {series_id: apply_resample(series_data, freq, agg) for series_id, series_data in data.items()},
             "metadata": {
                 "start_date": start_date,
                 "end_date": end_date,
+                "freq": freq,
+                "agg": agg if freq else None,
                 "source": "FRED"
+            },
+            "status": {
+                "complete": not status["stale"] and not status["pending"] and not status["failed"],
+                "stale": status["stale"],
+                "pending": status["pending"],
+                "failed": status["failed"],
+                "deadline_ms": round(deadline * 1000) if deadline else None
             }
         }
 
@@ -77,50 +129,153 @@ async def get_interest_rates(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/inflation")
-async def get_inflation(
-        period: str = Query("1y", description="기간: 1m, 3m, 6m, 1y, 3y, 5y")
+async def get_series_history(
+        series_id: str,
+        period: str,
+        start: Optional[str],
+        end: Optional[str],
+        cursor: Optional[str],
+        limit: int,
+        stream: bool,
+        freq: Optional[str],
+        agg: str
 ):
     """
-    물가 지표를 가져옵니다.
-    - Consumer Price Index (CPI)
-    - Core CPI (식품/에너지 제외)
-    - PCE Price Index
-    - Core PCE
+    긴 기간 시리즈를 커서 페이지(또는 스트림)로 반환합니다.
+    10년 단위 청크를 최신 청크부터 필요한 만큼만 읽으므로 페이지 크기만큼만 메모리를 사용합니다.
     """
+    from app.services.history_service import (
+        CursorError,
+        day_before,
+        decode_cursor,
+        encode_cursor,
+        iter_history,
+        read_page
+    )
+
+    validate_date(start, "start")
+    validate_date(end, "end")
+    today = datetime.now().strftime("%Y-%m-%d")
+    end_date = min(end or today, today)
+
+    catalog = get_series_catalog()
     fred_service = get_fred_service()
 
-    try:
-        start_date, end_date = get_date_range(period)
+    # 시작 날짜가 없으면 메타데이터의 관측 시작일부터 (빈 청크 요청 방지)
+    if start:
+        start_date = start
+    else:
+        if not catalog.get(series_id).get("observation_start"):
+            await catalog.enrich(fred_service, [series_id])
+        start_date = catalog.get(series_id).get("observation_start") or HISTORY_START
+
+    metadata = {
+        "start_date": start_date,
+        "end_date": end_date,
+        "freq": freq,
+        "agg": agg if freq else None,
+        "order": "desc",
+        "source": "FRED"
+    }
+    period = "custom" if (start or end) else period
+
+    if stream:
+        def encode(value) -> str:
+            return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+        async def body():
+            try:
+                header = {"series_id": series_id, "name": catalog.name(series_id), "period": period, "metadata": metadata}
+                yield (encode(header)[:-1] + ',"data":[').encode("utf-8")
+                first = True
+                async for part in iter_history(fred_service, series_id, start_date, end_date, freq, agg):
+                    items = ",".join(encode(obs) for obs in part)
+                    yield (items if first else "," + items).encode("utf-8")
+                    first = False
+                yield b"]}"
+            except Exception as e:
+                print(f"❌ 히스토리 스트리밍 에러: {str(e)} - {series_id}")
+                raise
+            finally:
+                await fred_service.close()
+
+        return StreamingResponse(body(), media_type="application/json")
 
-        series_ids = list(INDICATOR_CATEGORIES["inflation"].keys())
-        data = await fred_service.get_multiple_series(
-            series_ids,
-            start_date,
-            end_date
-        )
+    try:
+        # 커서는 요청에 지정한 start 기준으로 검증 (메타데이터가 나중에 채워져도 유지)
+        page_end = end_date
+        if cursor:
+            page_end = day_before(decode_cursor(cursor, series_id, start or ""))
 
+        page, before = await read_page(fred_service, series_id, start_date, page_end, limit, freq, agg)
         await fred_service.close()
-
-        return {
-            "category": "inflation",
-            "period": period,
-            "data": data,
-            "metadata": {
-                "start_date": start_date,
-                "end_date": end_date,
-                "source": "FRED"
-            }
-        }
-
+    except CursorError as e:
+        await fred_service.close()
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         await fred_service.close()
         raise HTTPException(status_code=500, detail=str(e))
 
+    return {
+        "series_id": series_id,
+        "name": catalog.name(series_id),
+        "period": period,
+        "data": {
+            "series_id": series_id,
+            "data": page,
+            "count": len(page),
+            "start_date": start_date,
+            "end_date": end_date
+        },
+        "metadata": metadata,
+        "pagination": {
+            "limit": limit,
+            "next_cursor": encode_cursor(series_id, start or "", before) if before else None
+        }
+    }
+
+
+@router.get("/interest-rates")
+async def get_interest_rates(
+        period: str = Query("1y", description="기간: 1m, 3m, 6m, 1y, 3y, 5y"),
+        freq: Optional[str] = Query(None, description="리샘플링 주기: W, M, Q, A (없으면 원래 주기)"),
+        agg: str = Query("last", description="집계 방식: last, mean, sum, max"),
+        x_deadline_ms: Optional[int] = Header(None, description="응답 마감 시간 (ms, 0이면 모두 기다림)")
+):
+    """
+    금리 관련 지표를 가져옵니다.
+    - Federal Funds Rate (기준금리)
+    - 10-Year Treasury Rate
+    - 2-Year Treasury Rate
+    - 10Y-2Y Spread
+    - 30-Year Mortgage Rate
+    """
+    return await get_category_data("interest_rates", period, freq, agg, x_deadline_ms)
+
+
+@router.get("/inflation")
+async def get_inflation(
+        period: str = Query("1y", description="기간: 1m, 3m, 6m, 1y, 3y, 5y"),
+        freq: Optional[str] = Query(None, description="리샘플링 주기: W, M, Q, A (없으면 원래 주기)"),
+        agg: str = Query("last", description="집계 방식: last, mean, sum, max"),
+        x_deadline_ms: Optional[int] = Header(None, description="응답 마감 시간 (ms, 0이면 모두 기다림)")
+):
+    """
+    물가 지표를 가져옵니다.
+    - Consumer Price Index (CPI)
+    - Core CPI (식품/에너지 제외)
+    - PCE Price Index
+    - Core PCE
+    """
+    return await get_category_data("inflation", period, freq, agg, x_deadline_ms)
+
 
 @router.get("/employment")
 async def get_employment(
-        period: str = Query("1y", description="기간: 1m, 3m, 6m, 1y, 3y, 5y")
+        period: str = Query("1y", description="기간: 1m, 3m, 6m, 1y, 3y, 5y"),
+        freq: Optional[str] = Query(None, description="리샘플링 주기: W, M, Q, A (없으면 원래 주기)"),
+        agg: str = Query("last", description="집계 방식: last, mean, sum, max"),
+        x_deadline_ms: Optional[int] = Header(None, description="응답 마감 시간 (ms, 0이면 모두 기다림)")
 ):
     """
     고용 지표를 가져옵니다.
@@ -129,39 +284,15 @@ async def get_employment(
     - Initial Jobless Claims (신규 실업수당 청구)
     - Job Openings (구인)
     """
-    fred_service = get_fred_service()
-
-    try:
-        start_date, end_date = get_date_range(period)
-
-        series_ids = list(INDICATOR_CATEGORIES["employment"].keys())
-        data = await fred_service.get_multiple_series(
-            series_ids,
-            start_date,
-            end_date
-        )
-
-        await fred_service.close()
-
-        return {
-            "category": "employment",
-            "period": period,
-            "data": data,
-            "metadata": {
-                "start_date": start_date,
-                "end_date": end_date,
-                "source": "FRED"
-            }
-        }
-
-    except Exception as e:
-        await fred_service.close()
-        raise HTTPException(status_code=500, detail=str(e))
+    return await get_category_data("employment", period, freq, agg, x_deadline_ms)
 
 
 @router.get("/gdp")
 async def get_gdp(
-        period: str = Query("5y", description="기간: 1m, 3m, 6m, 1y, 3y, 5y")
+        period: str = Query("5y", description="기간: 1m, 3m, 6m, 1y, 3y, 5y"),
+        freq: Optional[str] = Query(None, description="리샘플링 주기: W, M, Q, A (없으면 원래 주기)"),
+        agg: str = Query("last", description="집계 방식: last, mean, sum, max"),
+        x_deadline_ms: Optional[int] = Header(None, description="응답 마감 시간 (ms, 0이면 모두 기다림)")
 ):
     """
     GDP 및 경제 성장 지표를 가져옵니다.
@@ -170,29 +301,64 @@ async def get_gdp(
     - Real GDP Growth Rate
     - Industrial Production Index
     """
-    fred_service = get_fred_service()
+    return await get_category_data("gdp", period, freq, agg, x_deadline_ms)
 
-    try:
-        start_date, end_date = get_date_range(period)
 
-        series_ids = list(INDICATOR_CATEGORIES["gdp"].keys())
-        data = await fred_service.get_multiple_series(
-            series_ids,
-            start_date,
-            end_date
-        )
+@router.get("/leading")
+async def get_leading_indicators(
+        period: str = Query("1y", description="기간: 1m, 3m, 6m, 1y, 3y, 5y"),
+        freq: Optional[str] = Query(None, description="리샘플링 주기: W, M, Q, A (없으면 원래 주기)"),
+        agg: str = Query("last", description="집계 방식: last, mean, sum, max"),
+        x_deadline_ms: Optional[int] = Header(None, description="응답 마감 시간 (ms, 0이면 모두 기다림)")
+):
+    """
+    경기선행지수를 가져옵니다.
+    - Leading Index for US
+    - Consumer Sentiment
+    - New Housing Permits
+    - Retail Sales
+    """
+    return await get_category_data("leading", period, freq, agg, x_deadline_ms)
+
+
+@router.get("/category/{category}")
+async def get_category(
+        category: str,
+        period: str = Query("1y", description="기간: 1m, 3m, 6m, 1y, 3y, 5y"),
+        freq: Optional[str] = Query(None, description="리샘플링 주기: W, M, Q, A (없으면 원래 주기)"),
+        agg: str = Query("last", description="집계 방식: last, mean, sum, max"),
+        x_deadline_ms: Optional[int] = Header(None, description="응답 마감 시간 (ms, 0이면 모두 기다림)")
+):
+    """
+    카탈로그의 임의 카테고리 지표를 가져옵니다.
+    런타임에 등록한 시리즈/카테고리도 재시작 없이 조회할 수 있습니다.
+    """
+    return await get_category_data(category, period, freq, agg, x_deadline_ms)
+
+
+@router.get("/summary")
+async def get_summary(
+        lookback: Optional[str] = Query(None, description="백분위/z-score 비교 기간: 10y, 30y, full (없으면 모두)")
+):
+    """
+    모든 주요 지표의 최신 값을 요약해서 보여줍니다.
+    대시보드의 Quick Metrics용입니다.
+
+    각 지표의 history에는 최신 값이 과거 기간 대비 어느 수준인지(percentile, z_score)가 포함됩니다.
+    """
+    if lookback is not None and lookback not in LOOKBACKS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 비교 기간: {lookback} (10y, 30y, full)")
 
+    fred_service = get_fred_service()
+
+    try:
+        snapshot = await get_indicator_snapshot().get(fred_service, lookback)
         await fred_service.close()
 
         return {
-            "category": "gdp",
-            "period": period,
-            "data": data,
-            "metadata": {
-                "start_date": start_date,
-                "end_date": end_date,
-                "source": "FRED"
-            }
+            "summary": snapshot["categories"],
+            "version": snapshot["version"],
+            "updated_at": snapshot["updated_at"] or datetime.now().isoformat()
         }
 
     except Exception as e:
@@ -200,39 +366,108 @@ async def get_gdp(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/leading")
-async def get_leading_indicators(
-        period: str = Query("1y", description="기간: 1m, 3m, 6m, 1y, 3y, 5y")
+@router.get("/stats")
+async def get_rolling_stats(
+        series: Optional[str] = Query(None, description="쉼표로 구분된 시리즈 ID (없으면 전체)")
 ):
     """
-    경기선행지수를 가져옵니다.
-    - Leading Index for US
-    - Consumer Sentiment
-    - New Housing Permits
-    - Retail Sales
+    시리즈별 롤링 통계를 보여줍니다.
+    refresh 때 증분으로 미리 계산된 값을 그대로 반환합니다.
+    - 최신 값, 직전 대비 변화, 전년 동기 대비(YoY), 추세
+    - 이동 윈도우(3, 12) 평균/표준편차/최솟값/최댓값
     """
+    catalog = get_series_catalog()
+    await catalog.sync()
+
+    if series:
+        series_ids = [s.strip().upper() for s in series.split(",") if s.strip()]
+    else:
+        series_ids = catalog.series_ids()
+
+    unknown = [s for s in series_ids if not catalog.contains(s)]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 시리즈: {', '.join(unknown)}")
+
+    registry = get_rolling_registry()
+
+    # 아직 한 번도 refresh되지 않은 시리즈만 가져와서 엔진을 채움
+    missing = [s for s in series_ids if registry.get(s) is None]
+    if missing:
+        fred_service = get_fred_service()
+        try:
+            await fred_service.get_multiple_series(missing)
+        finally:
+            await fred_service.close()
+
+    return {
+        "stats": {
+            series_id: {
+                "name": catalog.name(series_id),
+                **(registry.get(series_id) or {})
+            }
+            for series_id in series_ids
+        },
+        "updated_at": datetime.now().isoformat()
+    }
+
+
+@router.get("/series/{series_id}")
+async def get_single_series(
+        series_id: str,
+        period: str = Query("1y", description="기간: 1m, 3m, 6m, 1y, 3y, 5y, 10y, 20y, max"),
+        as_of: Optional[str] = Query(None, description="기준 시점 (YYYY-MM-DD) - 그 시점에 알려진 빈티지 값"),
+        freq: Optional[str] = Query(None, description="리샘플링 주기: W, M, Q, A (없으면 원래 주기)"),
+        agg: str = Query("last", description="집계 방식: last, mean, sum, max"),
+        start: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD, 지정하면 period 대신 사용)"),
+        end: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD, 없으면 오늘)"),
+        cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 pagination.next_cursor)"),
+        limit: int = Query(1000, ge=1, le=10000, description="페이지 크기 (관측값 또는 버킷 수)"),
+        stream: bool = Query(False, description="전체 범위를 페이지 없이 스트리밍")
+):
+    """
+    단일 지표 데이터를 가져옵니다.
+    as_of를 지정하면 ALFRED 빈티지 기준으로 당시 발표된 값을 반환합니다.
+    (PAYEMS, GDP, GDPC1 등 발표 후 수정되는 시리즈의 백테스트용)
+    freq를 지정하면 서버에서 해당 주기로 리샘플링합니다. (예: DFF 20년치 → freq=M)
+
+    period=max 또는 start/end를 지정하면 길이 제한 없이 최신 날짜부터 limit개씩 페이지로 반환하며,
+    응답의 pagination.next_cursor로 다음 페이지를 요청합니다. stream=true면 전체 범위를 청크 단위로 스트리밍합니다.
+    """
+    validate_resample(freq, agg)
+    validate_date(as_of, "as_of")
+
+    catalog = get_series_catalog()
+    await catalog.sync()
+
+    series_id = series_id.upper()
+    if not catalog.contains(series_id):
+        raise HTTPException(status_code=404, detail=f"지원하지 않는 시리즈: {series_id}")
+
+    if period == MAX_PERIOD or start or end or cursor or stream:
+        if as_of:
+            raise HTTPException(status_code=400, detail="as_of는 전체 히스토리/기간 지정 조회와 함께 사용할 수 없습니다.")
+        return await get_series_history(series_id, period, start, end, cursor, limit, stream, freq, agg)
+
     fred_service = get_fred_service()
 
     try:
         start_date, end_date = get_date_range(period)
-
-        series_ids = list(INDICATOR_CATEGORIES["leading"].keys())
-        data = await fred_service.get_multiple_series(
-            series_ids,
-            start_date,
-            end_date
-        )
-
+        data = await fred_service.get_series(series_id, start_date, end_date, as_of=as_of)
+        data = apply_resample(data, freq, agg, as_of)
         await fred_service.close()
 
         return {
-            "category": "leading",
+            "series_id": series_id,
+            "name": catalog.name(series_id),
             "period": period,
             "data": data,
             "metadata": {
                 "start_date": start_date,
                 "end_date": end_date,
-                "source": "FRED"
+                "as_of": as_of,
+                "freq": freq,
+                "agg": agg if freq else None,
+                "source": "ALFRED" if as_of else "FRED"
             }
         }
 
@@ -241,36 +476,34 @@ async def get_leading_indicators(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/summary")
-async def get_summary():
+@router.get("/series/{series_id}/revisions")
+async def get_series_revisions(
+        series_id: str,
+        date: str = Query(..., description="관측 날짜 (YYYY-MM-DD)")
+):
     """
-    모든 주요 지표의 최신 값을 요약해서 보여줍니다.
-    대시보드의 Quick Metrics용입니다.
+    관측값 하나의 빈티지별 수정 이력을 보여줍니다.
     """
+    validate_date(date, "date")
+
+    catalog = get_series_catalog()
+    await catalog.sync()
+
+    series_id = series_id.upper()
+    if not catalog.contains(series_id):
+        raise HTTPException(status_code=404, detail=f"지원하지 않는 시리즈: {series_id}")
+
     fred_service = get_fred_service()
 
     try:
-        summary = {}
-
-        # 카테고리별로 최신 값 가져오기
-        for category, indicators in INDICATOR_CATEGORIES.items():
-            summary[category] = {}
-
-            for series_id, name in indicators.items():
-                print(f"📊 {series_id} 최신 값 가져오는 중...")
-                latest = await fred_service.get_latest_value(series_id)
-                if latest:
-                    summary[category][series_id] = {
-                        "name": name,
-                        "value": latest["value"],
-                        "date": latest["date"]
-                    }
-
+        revisions = await fred_service.get_revision_history(series_id, date)
         await fred_service.close()
 
         return {
-            "summary": summary,
-            "updated_at": datetime.now().isoformat()
+            "series_id": series_id,
+            "date": date,
+            "revisions": revisions,
+            "revision_count": max(len(revisions) - 1, 0)
         }
 
     except Exception as e:
@@ -0,0 +1,125 @@
+"""
+실시간 업데이트 API 라우터
+SSE / WebSocket으로 새로 추가되거나 수정된 관측값만 push합니다.
+"""
+import asyncio
+import json
+from typing import Optional
+
+from fastapi import APIRouter, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.services.update_hub import get_update_hub, resolve_series_ids
+
+router = APIRouter(
+    prefix="/api/stream",
+    tags=["Stream"]
+)
+
+# 연결 유지를 위한 heartbeat 주기 (초)
+HEARTBEAT_INTERVAL = 15
+
+
+def _split(value: Optional[str]):
+    return [v.strip() for v in value.split(",") if v.strip()] if value else []
+
+
+def _subscribed_message(hub, series_ids) -> dict:
+    """구독 직후 보내는 현재 요약 (이후에는 변경분만 전송)"""
+    return {
+        "type": "subscribed",
+        "series_ids": sorted(series_ids),
+        "summary": {
+            series_id: summary
+            for series_id in sorted(series_ids)
+            if (summary := hub.summary(series_id)) is not None
+        }
+    }
+
+
+@router.get("/sse")
+async def stream_updates(
+        request: Request,
+        series: Optional[str] = Query(None, description="쉼표로 구분된 시리즈 ID"),
+        categories: Optional[str] = Query(None, description="쉼표로 구분된 카테고리 (예: inflation,employment)")
+):
+    """
+    Server-Sent Events로 지표 변경분을 구독합니다.
+    series, categories를 모두 생략하면 전체 지표를 구독합니다.
+    """
+    hub = get_update_hub()
+    series_ids = resolve_series_ids(_split(series), _split(categories))
+    subscription = hub.subscribe(series_ids)
+
+    async def event_stream():
+        try:
+            message = _subscribed_message(hub, series_ids)
+            yield f"event: {message['type']}\ndata: {json.dumps(message)}\n\n"
+
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(subscription.queue.get(), timeout=HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: {message['type']}\ndata: {json.dumps(message)}\n\n"
+        finally:
+            hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/ws")
+async def websocket_updates(websocket: WebSocket):
+    """
+    WebSocket으로 지표 변경분을 구독합니다.
+
+    클라이언트 메시지:
+        {"action": "subscribe", "series": [...], "categories": [...]}
+        {"action": "unsubscribe", "series": [...], "categories": [...]}
+    """
+    await websocket.accept()
+    hub = get_update_hub()
+    subscription = hub.subscribe(set())
+
+    async def receive_commands():
+        while True:
+            command = await websocket.receive_json()
+            series_ids = resolve_series_ids(command.get("series"), command.get("categories"))
+
+            if command.get("action") == "unsubscribe":
+                subscription.series_ids -= series_ids
+            else:
+                subscription.series_ids |= series_ids
+                await websocket.send_json(_subscribed_message(hub, subscription.series_ids))
+
+    async def send_updates():
+        while True:
+            message = await subscription.queue.get()
+            await websocket.send_json(message)
+
+    tasks = [asyncio.create_task(receive_commands()), asyncio.create_task(send_updates())]
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        # 먼저 끝난 작업의 예외를 꺼내서 기록 (연결 종료는 정상)
+        for task in done:
+            error = None if task.cancelled() else task.exception()
+            if error is not None and not isinstance(error, WebSocketDisconnect):
+                print(f"⚠️ WebSocket 구독 에러: {type(error).__name__}: {str(error)}")
+                # 남은 연결을 닫아 클라이언트가 응답을 기다리며 멈추지 않도록 함
+                try:
+                    await websocket.close(code=1011)
+                except Exception:
+                    pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        hub.unsubscribe(subscription)
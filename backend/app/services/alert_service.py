@@ -0,0 +1,468 @@
+"""
+증분 알림 엔진
+사용자가 등록한 규칙을 SeriesStore 리스너로 새 관측값에만 적용합니다.
+
+- 규칙마다 평가 상태(직전 조건, 이동 최저치 deque, 이동 평균 합계)를 유지하므로
+  refresh 비용은 O(새 포인트 × 해당 시리즈 규칙 수)이며 히스토리를 다시 훑지 않습니다.
+- 규칙 정의는 공유 캐시에 저장해서 모든 워커가 같은 규칙을 평가하고,
+  같은 알림은 공유 캐시 잠금으로 한 번만 웹훅으로 보냅니다.
+- 웹훅 URL이 local://receiver면 HTTP 없이 LocalReceiver에 전달합니다. (테스트용)
+- 웹훅 호스트는 등록/발송 때마다 주소를 해석해서 내부망(사설/루프백/링크로컬) 주소면 거부합니다.
+"""
+import asyncio
+import hashlib
+import hmac
+import ipaddress
+import json
+import socket
+import time
+import uuid
+from collections import deque
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from app.config import get_settings
+from app.services.cache_service import SharedCache, get_shared_cache
+from app.services.series_store import SeriesStore, get_series_store
+
+settings = get_settings()
+
+# 규칙 정의를 워커 간 공유하는 캐시 키 (메모리 예산으로 제거되지 않는 영구 엔트리)
+RULES_CACHE_KEY = "alerts:rules"
+
+# 같은 알림 중복 발송 방지 기록 보관 시간 (초)
+DELIVERY_DEDUP_TTL = 86400 * 30
+
+# 과거 구간 보충/수정 시 상태를 다시 만들 때 읽는 기간 (일, 최대 규칙 윈도우보다 길게)
+REBUILD_LOOKBACK_DAYS = 365 * 6
+
+# 최근 알림 보관 개수
+EVENT_HISTORY_SIZE = 200
+
+# 로컬 수신기 URL (테스트용 웹훅 대체)
+LOCAL_RECEIVER_URL = "local://receiver"
+
+_OPERATORS = {
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b
+}
+
+
+async def validate_webhook_url(url: str) -> None:
+    """
+    웹훅 URL 검증 (SSRF 방지)
+
+    http(s) 주소만 허용하고, ALERT_WEBHOOK_HOSTS가 설정되어 있으면 그 호스트만,
+    아니면 모든 해석 결과가 공인 주소인 호스트만 허용합니다.
+
+    Raises:
+        ValueError: 허용되지 않는 URL
+    """
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not parsed.hostname:
+        raise ValueError("웹훅 URL은 http(s) 주소 또는 local://receiver여야 합니다.")
+
+    host = parsed.hostname.lower()
+    if settings.alert_webhook_hosts:
+        if host not in settings.alert_webhook_hosts:
+            raise ValueError(f"허용되지 않은 웹훅 호스트: {host}")
+        return
+
+    try:
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except (OSError, ValueError):
+        raise ValueError(f"웹훅 호스트를 찾을 수 없습니다: {host}")
+
+    for info in infos:
+        address = ipaddress.ip_address(info[4][0].split("%")[0])
+        if not address.is_global or address.is_multicast:
+            raise ValueError(f"내부 주소로 연결되는 웹훅은 사용할 수 없습니다: {host} ({address})")
+
+
+class RuleEvaluator:
+    """
+    규칙 하나의 증분 평가 상태
+
+    feed()에 날짜 오름차순 새 관측값을 넣으면 last_date 이후 포인트만 반영하고 발생한 알림을 반환합니다.
+    처음 들어온 묶음은 상태를 채우는 데만 사용합니다. (과거 조건으로 알림을 보내지 않음)
+    """
+
+    def __init__(self):
+        self.last_date: Optional[str] = None
+        self.last_value: Optional[float] = None
+        self.active: Optional[bool] = None
+        self.primed = False
+
+    def feed(self, points: List[Dict]) -> List[Dict]:
+        emit = self.primed
+        events = []
+        for point in points:
+            if self.last_date is not None and point["date"] <= self.last_date:
+                continue
+            event = self._step(point)
+            self.last_date = point["date"]
+            self.last_value = point["value"]
+            if event is not None and emit:
+                events.append({"date": point["date"], "value": point["value"], **event})
+        self.primed = self.primed or self.last_date is not None
+        return events
+
+    def _step(self, point: Dict) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def _transition(self, condition: bool, detail: Dict) -> Optional[Dict]:
+        """
+        조건이 바뀌는 순간만 알림 (False → True: triggered, True → False: resolved)
+        """
+        previous, self.active = self.active, condition
+        if previous is None or previous == condition:
+            return None
+        return {"status": "triggered" if condition else "resolved", "detail": detail}
+
+    def state(self) -> Dict:
+        return {"last_date": self.last_date, "last_value": self.last_value, "active": self.active}
+
+
+class ThresholdEvaluator(RuleEvaluator):
+    """
+    값이 기준선을 넘어가는 순간 (예: T10Y2Y < 0 → 장단기 금리 역전)
+    """
+
+    def __init__(self, op: str, threshold: float):
+        super().__init__()
+        self.compare = _OPERATORS[op]
+        self.op = op
+        self.threshold = threshold
+
+    def _step(self, point: Dict) -> Optional[Dict]:
+        condition = self.compare(point["value"], self.threshold)
+        return self._transition(condition, {"op": self.op, "threshold": self.threshold})
+
+
+class RiseFromLowEvaluator(RuleEvaluator):
+    """
+    최근 window_months 동안의 최저치 대비 threshold 이상 상승 (Sahm rule 방식)
+
+    - smooth개 관측값 이동평균: 누적 합계 (O(1))
+    - 기간 최저치: 날짜 기준 단조 deque (상각 O(1))
+    """
+
+    def __init__(self, threshold: float, window_months: int, smooth: int):
+        super().__init__()
+        self.threshold = threshold
+        self.window_days = round(window_months * 365 / 12)
+        self.smooth = smooth
+        self._recent: Deque[float] = deque()
+        self._recent_sum = 0.0
+        self._lows: Deque[Tuple[str, float]] = deque()  # (date, 이동평균) 값 오름차순
+
+    def _step(self, point: Dict) -> Optional[Dict]:
+        self._recent.append(point["value"])
+        self._recent_sum += point["value"]
+        if len(self._recent) > self.smooth:
+            self._recent_sum -= self._recent.popleft()
+        if len(self._recent) < self.smooth:
+            return None
+        level = self._recent_sum / self.smooth
+
+        # 기간을 벗어난 최저치 후보 제거 후, 현재 값 이전 기간의 최저치와 비교
+        cutoff = (date.fromisoformat(point["date"]) - timedelta(days=self.window_days)).isoformat()
+        while self._lows and self._lows[0][0] < cutoff:
+            self._lows.popleft()
+
+        event = None
+        if self._lows:
+            low = self._lows[0][1]
+            rise = level - low
+            event = self._transition(
+                rise >= self.threshold,
+                {"level": round(level, 4), "low": round(low, 4), "rise": round(rise, 4), "threshold": self.threshold}
+            )
+
+        while self._lows and self._lows[-1][1] >= level:
+            self._lows.pop()
+        self._lows.append((point["date"], level))
+        return event
+
+
+class JumpEvaluator(RuleEvaluator):
+    """
+    직전 window개 관측값 평균 대비 threshold% 이상 변화 (예: ICSA 급증)
+    조건이 유지되는 동안에도 관측값마다 알림을 보냅니다.
+    """
+
+    def __init__(self, threshold: float, window: int):
+        super().__init__()
+        self.threshold = threshold
+        self.window = window
+        self._previous: Deque[float] = deque()
+        self._previous_sum = 0.0
+
+    def _step(self, point: Dict) -> Optional[Dict]:
+        event = None
+        if len(self._previous) == self.window:
+            baseline = self._previous_sum / self.window
+            if baseline != 0:
+                change_percent = (point["value"] - baseline) / abs(baseline) * 100
+                self.active = change_percent >= self.threshold
+                if self.active:
+                    event = {
+                        "status": "triggered",
+                        "detail": {
+                            "baseline": round(baseline, 4),
+                            "change_percent": round(change_percent, 2),
+                            "threshold": self.threshold
+                        }
+                    }
+
+        self._previous.append(point["value"])
+        self._previous_sum += point["value"]
+        if len(self._previous) > self.window:
+            self._previous_sum -= self._previous.popleft()
+        return event
+
+
+def build_evaluator(rule: Dict) -> RuleEvaluator:
+    """
+    규칙 정의에 맞는 평가기를 만듭니다.
+    """
+    if rule["kind"] == "threshold":
+        return ThresholdEvaluator(rule["op"], rule["threshold"])
+    if rule["kind"] == "rise_from_low":
+        return RiseFromLowEvaluator(rule["threshold"], rule["window_months"], rule["smooth"])
+    if rule["kind"] == "jump":
+        return JumpEvaluator(rule["threshold"], rule["window"])
+    raise ValueError(f"지원하지 않는 규칙 종류입니다: {rule['kind']}")
+
+
+class LocalReceiver:
+    """
+    웹훅 수신기 대체 구현 (local://receiver, POST /api/alerts/receiver)
+    받은 알림을 메모리에 보관해서 테스트/개발 중에 확인할 수 있게 합니다.
+    """
+
+    def __init__(self, size: int = EVENT_HISTORY_SIZE):
+        self._received: Deque[Dict] = deque(maxlen=size)
+
+    def receive(self, payload: Dict) -> None:
+        self._received.append({**payload, "received_at": datetime.now().isoformat()})
+
+    def received(self) -> List[Dict]:
+        return list(self._received)
+
+    def clear(self) -> None:
+        self._received.clear()
+
+
+class AlertEngine:
+    """
+    알림 규칙 관리 + 증분 평가 + 웹훅 발송
+
+    SeriesStore 리스너로 등록되어 시리즈별로 해당 규칙만 평가합니다.
+    """
+
+    def __init__(self, store: SeriesStore, cache: SharedCache):
+        self.store = store
+        self.cache = cache
+        self.receiver = LocalReceiver()
+        self._rules: Dict[str, Dict] = {}
+        self._evaluators: Dict[str, RuleEvaluator] = {}
+        self._by_series: Dict[str, List[str]] = {}
+        self._events: Deque[Dict] = deque(maxlen=EVENT_HISTORY_SIZE)
+        self._last_sync = 0.0
+        self._deliveries: set = set()
+        store.add_listener(self.on_update)
+
+    # ---------- 규칙 관리 ----------
+
+    async def sync(self, force: bool = False) -> None:
+        """
+        다른 워커가 등록/삭제한 규칙을 공유 캐시에서 반영합니다.
+        (catalog_sync_interval 간격으로만 확인)
+        """
+        now = time.monotonic()
+        if not force and now - self._last_sync < settings.catalog_sync_interval:
+            return
+        self._last_sync = now
+
+        rules = await self.cache.get(RULES_CACHE_KEY) or {}
+        if rules != self._rules:
+            self._apply_rules(rules)
+
+    def _apply_rules(self, rules: Dict[str, Dict]) -> None:
+        # 바뀌지 않은 규칙은 평가 상태를 그대로 유지
+        for rule_id in list(self._evaluators):
+            if rules.get(rule_id) != self._rules.get(rule_id):
+                del self._evaluators[rule_id]
+
+        self._rules = dict(rules)
+        self._by_series = {}
+        for rule_id, rule in self._rules.items():
+            self._by_series.setdefault(rule["series_id"], []).append(rule_id)
+            if rule_id not in self._evaluators:
+                self._evaluators[rule_id] = self._build(rule)
+
+    async def add_rule(self, rule: Dict) -> Dict:
+        """
+        규칙을 등록합니다. (모든 워커에 반영)
+        저장소에 있는 최근 관측값으로 상태를 채우므로 과거 조건으로는 알림을 보내지 않습니다.
+        """
+        rule = {
+            **rule,
+            "id": uuid.uuid4().hex[:12],
+            "created_at": datetime.now().isoformat()
+        }
+        build_evaluator(rule)  # 정의 검증
+
+        async with self.cache.lock(RULES_CACHE_KEY):
+            rules = dict(await self.cache.get(RULES_CACHE_KEY) or {})
+            if len(rules) >= settings.alert_max_rules:
+                raise ValueError(f"알림 규칙은 최대 {settings.alert_max_rules}개까지 등록할 수 있습니다.")
+            rules[rule["id"]] = rule
+            await self.cache.set_durable(RULES_CACHE_KEY, rules)
+
+        self._apply_rules(rules)
+        return rule
+
+    async def remove_rule(self, rule_id: str) -> bool:
+        async with self.cache.lock(RULES_CACHE_KEY):
+            rules = dict(await self.cache.get(RULES_CACHE_KEY) or {})
+            if rule_id not in rules:
+                return False
+            del rules[rule_id]
+            await self.cache.set_durable(RULES_CACHE_KEY, rules)
+
+        self._apply_rules(rules)
+        return True
+
+    def rules(self) -> List[Dict]:
+        return [
+            {**rule, "state": self._evaluators[rule_id].state()}
+            for rule_id, rule in self._rules.items()
+        ]
+
+    def events(self, limit: int = 50) -> List[Dict]:
+        """
+        최근 알림 (최신순)
+        """
+        return list(self._events)[::-1][:limit]
+
+    # ---------- 증분 평가 ----------
+
+    def _build(self, rule: Dict, until: Optional[str] = None) -> RuleEvaluator:
+        """
+        저장소의 최근 구간(until까지)으로 평가 상태를 새로 만듭니다. (알림 없이 상태만 채움)
+        """
+        evaluator = build_evaluator(rule)
+        latest = self.store.latest(rule["series_id"])
+        if latest is not None:
+            end = until or latest["date"]
+            cutoff = (date.fromisoformat(end) - timedelta(days=REBUILD_LOOKBACK_DAYS)).isoformat()
+            evaluator.feed(self.store.get_history(rule["series_id"], start_date=cutoff, end_date=end))
+        return evaluator
+
+    def on_update(self, series_id: str, new_points: List[Dict], changed_points: List[Dict]) -> None:
+        """
+        SeriesStore 변경 알림 → 해당 시리즈 규칙에 새 관측값만 적용
+        """
+        for rule_id in self._by_series.get(series_id, []):
+            rule = self._rules[rule_id]
+            evaluator = self._evaluators[rule_id]
+
+            # 평가 상태가 참조하는 구간의 보충/수정 → 그 구간까지 상태만 다시 계산한 뒤 새 관측값 평가
+            if evaluator.last_date is not None:
+                cutoff = (
+                    date.fromisoformat(evaluator.last_date) - timedelta(days=REBUILD_LOOKBACK_DAYS)
+                ).isoformat()
+                affected = any(
+                    cutoff <= point["date"] <= evaluator.last_date
+                    for point in (*new_points, *changed_points)
+                )
+                if affected:
+                    primed = evaluator.primed
+                    evaluator = self._build(rule, until=evaluator.last_date)
+                    evaluator.primed = primed
+                    self._evaluators[rule_id] = evaluator
+
+            for event in evaluator.feed(new_points):
+                self._emit(rule, event)
+
+    def _emit(self, rule: Dict, event: Dict) -> None:
+        payload = {
+            "rule_id": rule["id"],
+            "name": rule.get("name") or f"{rule['series_id']} {rule['kind']}",
+            "series_id": rule["series_id"],
+            "kind": rule["kind"],
+            **event,
+            "fired_at": datetime.now().isoformat()
+        }
+        self._events.append(payload)
+        print(f"🔔 알림: {payload['name']} {payload['status']} ({payload['date']}, {payload['value']})")
+
+        if not rule.get("webhook_url"):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._deliver(rule["webhook_url"], payload))
+        # 가비지 컬렉션 방지용 참조
+        self._deliveries.add(task)
+        task.add_done_callback(self._deliveries.discard)
+
+    # ---------- 발송 ----------
+
+    async def _deliver(self, url: str, payload: Dict) -> None:
+        """
+        알림을 웹훅으로 보냅니다. 여러 워커가 같은 알림을 평가해도 한 번만 보냅니다.
+        """
+        dedup_key = f"alerts:sent:{payload['rule_id']}:{payload['date']}:{payload['status']}"
+        try:
+            async with self.cache.lock(dedup_key):
+                if await self.cache.get(dedup_key):
+                    return
+                await self._send(url, payload)
+                await self.cache.set(dedup_key, True, DELIVERY_DEDUP_TTL)
+        except Exception as e:
+            print(f"❌ 알림 발송 실패: {str(e)} - {payload['rule_id']}")
+
+    async def _send(self, url: str, payload: Dict) -> None:
+        if url == LOCAL_RECEIVER_URL:
+            self.receiver.receive(payload)
+            return
+
+        # 등록 이후 DNS가 내부 주소로 바뀌었을 수 있으므로 발송할 때마다 다시 확인
+        await validate_webhook_url(url)
+
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if settings.alert_webhook_secret:
+            signature = hmac.new(settings.alert_webhook_secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+            headers["X-Alert-Signature"] = f"sha256={signature}"
+
+        async with httpx.AsyncClient(timeout=settings.alert_webhook_timeout) as client:
+            for attempt in range(3):
+                try:
+                    response = await client.post(url, content=body, headers=headers)
+                    response.raise_for_status()
+                    return
+                except httpx.HTTPError:
+                    if attempt == 2:
+                        raise
+                    await asyncio.sleep(2 ** attempt)
+
+
+@lru_cache()
+def get_alert_engine() -> AlertEngine:
+    """
+    AlertEngine 인스턴스를 반환합니다.
+    프로세스당 하나만 생성하며, 생성 시 SeriesStore 리스너로 등록됩니다.
+    """
+    return AlertEngine(get_series_store(), get_shared_cache())
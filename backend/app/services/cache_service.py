@@ -0,0 +1,499 @@
+"""
+공유 캐시 서비스
+같은 호스트의 여러 워커(gunicorn) 프로세스가 함께 사용하는 캐시 계층
+
+- FileCacheBackend: 로컬 디렉토리 기반 (기본값, 워커 간 공유)
+- RedisCacheBackend: Redis 호환 서버 기반 (선택)
+- MemoryCacheBackend: 단일 프로세스용 인메모리 대체 구현 (테스트용)
+"""
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+import uuid
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.config import get_settings
+from app.utils.cache import TTLCache
+from app.utils.singleflight import SingleFlight
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 fcntl이 없는 환경
+    fcntl = None
+
+settings = get_settings()
+
+# 영구 엔트리(규칙, 등록 정보 등)의 만료 시각 계산용 TTL (10년)
+DURABLE_TTL = 86400 * 365 * 10
+
+
+class CacheBackend:
+    """
+    캐시 백엔드 공통 인터페이스
+
+    엔트리는 {"value": ..., "expires_at": epoch초} 형태로 저장합니다.
+    만료된 엔트리도 stale 보관 기간 동안은 get()으로 조회할 수 있으며,
+    신선도 판단은 SharedCache가 담당합니다.
+    """
+
+    async def get(self, key: str) -> Optional[Dict]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        raise NotImplementedError
+
+    async def set_durable(self, key: str, value: Any) -> None:
+        """
+        만료되거나 메모리 예산 때문에 제거되면 안 되는 엔트리를 저장합니다.
+        """
+        await self.set(key, value, DURABLE_TTL)
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def acquire_lock(self, key: str, lease: int) -> Optional[Any]:
+        """
+        프로세스 간 잠금을 시도합니다. (논블로킹)
+
+        Returns:
+            잠금 토큰 (획득 실패 시 None)
+        """
+        raise NotImplementedError
+
+    async def release_lock(self, key: str, token: Any) -> None:
+        raise NotImplementedError
+
+    async def renew_lock(self, key: str, token: Any, lease: int) -> bool:
+        """
+        보유 중인 잠금의 lease를 연장합니다. (lease가 없는 백엔드는 항상 True)
+
+        Returns:
+            연장 성공 여부 (이미 만료되어 다른 쪽이 가져갔으면 False)
+        """
+        return True
+
+
+class LockTimeout(TimeoutError):
+    """
+    잠금을 기다리다 시간 초과
+    """
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    인메모리 캐시 백엔드
+    워커 간 공유는 되지 않으므로 테스트나 단일 프로세스 실행용입니다.
+    엔트리는 TTLCache에 보관하므로 프로세스 메모리 예산에 함께 합산됩니다.
+    (set_durable()로 저장한 엔트리는 예산 LRU로 제거되지 않도록 따로 보관)
+    """
+
+    def __init__(self, stale_ttl: int = 86400):
+        self.stale_ttl = stale_ttl
+        self._entries = TTLCache(max_entries=100000, ttl=stale_ttl, name="shared:memory")
+        self._durable: Dict[str, Dict] = {}
+        self._locks: Dict[str, tuple] = {}  # key -> (token, lease 만료 시각)
+
+    async def get(self, key: str) -> Optional[Dict]:
+        entry = self._durable.get(key)
+        return entry if entry is not None else self._entries.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        entry = {"value": value, "expires_at": time.time() + ttl}
+        self._durable.pop(key, None)
+        # stale 조회를 위해 TTL보다 stale 보관 기간만큼 더 보관
+        self._entries.set(key, entry, ttl=ttl + self.stale_ttl)
+
+    async def set_durable(self, key: str, value: Any) -> None:
+        self._entries.delete(key)
+        self._durable[key] = {"value": value, "expires_at": time.time() + DURABLE_TTL}
+
+    async def delete(self, key: str) -> None:
+        self._durable.pop(key, None)
+        self._entries.delete(key)
+
+    async def acquire_lock(self, key: str, lease: int) -> Optional[Any]:
+        now = time.time()
+        holder = self._locks.get(key)
+        if holder and holder[1] > now:
+            return None
+
+        token = uuid.uuid4().hex
+        self._locks[key] = (token, now + lease)
+        return token
+
+    async def release_lock(self, key: str, token: Any) -> None:
+        holder = self._locks.get(key)
+        if holder and holder[0] == token:
+            del self._locks[key]
+
+    async def renew_lock(self, key: str, token: Any, lease: int) -> bool:
+        holder = self._locks.get(key)
+        if not holder or holder[0] != token:
+            return False
+        self._locks[key] = (token, time.time() + lease)
+        return True
+
+
+class FileCacheBackend(CacheBackend):
+    """
+    파일 기반 캐시 백엔드
+
+    키마다 JSON 파일 하나를 두고 os.replace로 원자적으로 교체하므로
+    여러 워커가 동시에 읽고 써도 깨진 파일을 읽지 않습니다.
+    잠금은 fcntl.flock을 사용하며, 프로세스가 죽으면 OS가 자동으로 해제합니다.
+    """
+
+    def __init__(self, cache_dir: str, stale_ttl: int = 86400):
+        self.cache_dir = cache_dir
+        self.lock_dir = os.path.join(cache_dir, "locks")
+        self.stale_ttl = stale_ttl
+        self._set_count = 0
+        self._purging = False
+        os.makedirs(self.lock_dir, exist_ok=True)
+
+    def _path(self, key: str, directory: Optional[str] = None) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(directory or self.cache_dir, f"{digest}.json")
+
+    async def get(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        # 해시 충돌 방지용 키 확인
+        if entry.get("key") != key:
+            return None
+        return entry
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        entry = {"key": key, "value": value, "expires_at": time.time() + ttl}
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, separators=(",", ":"))
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        # 가끔씩 오래된 엔트리 정리 (디렉터리 전체를 읽으므로 이벤트 루프 밖에서)
+        self._set_count += 1
+        if self._set_count % 100 == 0 and not self._purging:
+            self._purging = True
+            try:
+                await asyncio.to_thread(self.purge_expired)
+            finally:
+                self._purging = False
+
+    async def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    async def acquire_lock(self, key: str, lease: int) -> Optional[Any]:
+        if fcntl is None:
+            # fcntl이 없으면 프로세스 간 잠금 없이 진행 (단일 워커 개발 환경)
+            return -1
+
+        fd = os.open(self._path(key, self.lock_dir), os.O_CREAT | os.O_RDWR)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        return fd
+
+    async def release_lock(self, key: str, token: Any) -> None:
+        if fcntl is None or token is None or token < 0:
+            return
+        try:
+            fcntl.flock(token, fcntl.LOCK_UN)
+        finally:
+            os.close(token)
+
+    def purge_expired(self) -> int:
+        """
+        stale 보관 기간까지 지난 엔트리 파일을 삭제합니다.
+
+        Returns:
+            삭제한 파일 수
+        """
+        cutoff = time.time() - self.stale_ttl
+        removed = 0
+
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    expires_at = json.load(f).get("expires_at", 0)
+                if expires_at < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except (FileNotFoundError, ValueError):
+                continue
+
+        return removed
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis 호환 캐시 백엔드 (선택)
+    redis 패키지가 설치되어 있어야 합니다: pip install redis
+    """
+
+    # 토큰이 일치할 때만 잠금을 해제하는 스크립트
+    _RELEASE_SCRIPT = """
+    if redis.call("get", KEYS[1]) == ARGV[1] then
+        return redis.call("del", KEYS[1])
+    end
+    return 0
+    """
+
+    # 토큰이 일치할 때만 lease를 연장하는 스크립트
+    _RENEW_SCRIPT = """
+    if redis.call("get", KEYS[1]) == ARGV[1] then
+        return redis.call("expire", KEYS[1], ARGV[2])
+    end
+    return 0
+    """
+
+    def __init__(self, redis_url: str, stale_ttl: int = 86400):
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError:
+            raise RuntimeError("CACHE_BACKEND=redis를 사용하려면 redis 패키지를 설치해주세요.")
+
+        self.client = redis_asyncio.from_url(redis_url)
+        self.stale_ttl = stale_ttl
+
+    async def get(self, key: str) -> Optional[Dict]:
+        raw = await self.client.get(key)
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        entry = {"value": value, "expires_at": time.time() + ttl}
+        # stale 조회를 위해 TTL보다 stale 보관 기간만큼 더 보관
+        await self.client.set(key, json.dumps(entry, separators=(",", ":")), ex=ttl + self.stale_ttl)
+
+    async def set_durable(self, key: str, value: Any) -> None:
+        # 만료 시간 없이 저장 (volatile-* 제거 정책의 대상이 되지 않음)
+        entry = {"value": value, "expires_at": time.time() + DURABLE_TTL}
+        await self.client.set(key, json.dumps(entry, separators=(",", ":")))
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(key)
+
+    async def acquire_lock(self, key: str, lease: int) -> Optional[Any]:
+        token = uuid.uuid4().hex
+        acquired = await self.client.set(f"lock:{key}", token, nx=True, ex=lease)
+        return token if acquired else None
+
+    async def release_lock(self, key: str, token: Any) -> None:
+        await self.client.eval(self._RELEASE_SCRIPT, 1, f"lock:{key}", token)
+
+    async def renew_lock(self, key: str, token: Any, lease: int) -> bool:
+        return bool(await self.client.eval(self._RENEW_SCRIPT, 1, f"lock:{key}", token, lease))
+
+
+class SharedCache:
+    """
+    공유 캐시 + 프로세스 간 fetch 조율
+
+    캐시 미스가 나면 프로세스 내부에서는 SingleFlight로, 프로세스 간에는
+    백엔드 잠금(lease)으로 조율해서 N개의 워커가 있어도
+    같은 키에 대한 upstream 호출은 한 번만 일어나도록 합니다.
+    """
+
+    def __init__(self, backend: CacheBackend, lock_lease: int = 30, poll_interval: float = 0.1):
+        self.backend = backend
+        self.lock_lease = lock_lease
+        self.poll_interval = poll_interval
+        self._singleflight = SingleFlight()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        만료되지 않은 값을 반환합니다. (없으면 None)
+        """
+        entry = await self.backend.get(key)
+        if entry is None or entry["expires_at"] <= time.time():
+            return None
+        return entry["value"]
+
+    async def get_stale(self, key: str) -> Optional[Dict]:
+        """
+        만료되었더라도 stale 보관 기간 안의 엔트리를 반환합니다. (upstream이 늦을 때의 대체 값)
+
+        Returns:
+            {"value": ..., "expires_at": epoch초} (없으면 None)
+        """
+        entry = await self.backend.get(key)
+        if entry is None:
+            return None
+        return {"value": entry["value"], "expires_at": entry["expires_at"]}
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        await self.backend.set(key, value, ttl)
+
+    async def set_durable(self, key: str, value: Any) -> None:
+        """
+        만료되지 않고 메모리 예산 LRU로도 제거되지 않는 엔트리를 저장합니다. (알림 규칙, 시리즈 등록 정보)
+        """
+        await self.backend.set_durable(key, value)
+
+    @asynccontextmanager
+    async def lock(self, key: str, timeout: Optional[float] = None):
+        """
+        프로세스 간 잠금을 획득할 때까지 기다린 뒤 블록을 실행합니다.
+        블록이 lease보다 오래 걸려도(예: ALFRED 전체 동기화) 잠금을 보유하는 동안 lease를 계속 연장합니다.
+
+        Args:
+            key: 잠금 키
+            timeout: 최대 대기 시간 (초, None이면 획득할 때까지 대기)
+
+        Raises:
+            LockTimeout: timeout 안에 잠금을 얻지 못한 경우
+
+        사용 예시:
+            async with cache.lock("vintage:PAYEMS"):
+                ...
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            token = await self.backend.acquire_lock(key, self.lock_lease)
+            if token is not None:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                raise LockTimeout(f"잠금 대기 시간 초과: {key}")
+            await asyncio.sleep(self.poll_interval)
+
+        keep_alive = asyncio.create_task(self._keep_lock_alive(key, token))
+        try:
+            yield
+        finally:
+            keep_alive.cancel()
+            await self.backend.release_lock(key, token)
+
+    async def _keep_lock_alive(self, key: str, token: Any) -> None:
+        """
+        lease의 1/3마다 잠금을 연장합니다. (잠금 블록이 끝나면 취소됨)
+        """
+        while True:
+            await asyncio.sleep(self.lock_lease / 3)
+            try:
+                if not await self.backend.renew_lock(key, token, self.lock_lease):
+                    print(f"⚠️ 잠금 lease 연장 실패 (이미 만료됨): {key}")
+                    return
+            except Exception as e:
+                print(f"⚠️ 잠금 lease 연장 에러: {str(e)} - {key}")
+
+    async def get_or_fetch(
+            self,
+            key: str,
+            fetcher: Callable[[], Awaitable[Any]],
+            ttl: int,
+            is_fresh: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        캐시에 값이 있으면 반환하고, 없으면 한 프로세스만 fetcher를 실행합니다.
+        fetcher에서 예외가 나면 캐시하지 않고 그대로 전파합니다.
+
+        Args:
+            key: 캐시 키
+            fetcher: 캐시 미스 시 값을 가져올 코루틴 함수
+            ttl: 캐시 유지 시간 (초)
+            is_fresh: TTL 안의 값이라도 False를 반환하면 다시 가져옴 (예: upstream 갱신 시각 비교)
+
+        Returns:
+            캐시된 값 또는 새로 가져온 값
+        """
+        value = await self._get_fresh(key, is_fresh)
+        if value is not None:
+            return value
+
+        return await self._singleflight.do(
+            key,
+            lambda: self._fetch_coordinated(key, fetcher, ttl, is_fresh)
+        )
+
+    async def _get_fresh(self, key: str, is_fresh: Optional[Callable[[Any], bool]]) -> Optional[Any]:
+        value = await self.get(key)
+        if value is not None and is_fresh is not None and not is_fresh(value):
+            return None
+        return value
+
+    async def _fetch_coordinated(
+            self,
+            key: str,
+            fetcher: Callable[[], Awaitable[Any]],
+            ttl: int,
+            is_fresh: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        프로세스 간 잠금을 잡은 워커만 upstream을 호출하고,
+        나머지 워커는 그 결과가 캐시에 기록될 때까지 기다립니다.
+        """
+        while True:
+            token = await self.backend.acquire_lock(key, self.lock_lease)
+
+            if token is not None:
+                try:
+                    # 잠금을 기다리는 사이 다른 워커가 채웠을 수 있음
+                    value = await self._get_fresh(key, is_fresh)
+                    if value is not None:
+                        return value
+
+                    value = await fetcher()
+                    await self.backend.set(key, value, ttl)
+                    return value
+                finally:
+                    await self.backend.release_lock(key, token)
+
+            # 다른 워커가 가져오는 중 → 결과를 기다림
+            # (잠금 보유 워커가 죽으면 flock 자동 해제 / lease 만료 후 재시도)
+            await asyncio.sleep(self.poll_interval)
+            value = await self._get_fresh(key, is_fresh)
+            if value is not None:
+                return value
+
+
+def resolve_cache_dir() -> str:
+    """
+    로컬 캐시 디렉토리 경로 (CACHE_DIR이 비어 있으면 시스템 임시 디렉토리)
+    """
+    return settings.cache_dir or os.path.join(tempfile.gettempdir(), "us-economic-dashboard-cache")
+
+
+def create_cache_backend(backend_name: str) -> CacheBackend:
+    """
+    설정 값에 맞는 캐시 백엔드를 생성합니다.
+    """
+    if backend_name == "memory":
+        return MemoryCacheBackend(settings.cache_stale_ttl)
+    if backend_name == "redis":
+        return RedisCacheBackend(settings.redis_url, settings.cache_stale_ttl)
+
+    return FileCacheBackend(resolve_cache_dir(), settings.cache_stale_ttl)
+
+
+@lru_cache()
+def get_shared_cache() -> SharedCache:
+    """
+    SharedCache 인스턴스를 반환합니다.
+    프로세스당 하나만 생성해서 재사용합니다.
+    """
+    backend = create_cache_backend(settings.cache_backend)
+    return SharedCache(backend, lock_lease=settings.cache_lock_lease)
@@ -0,0 +1,281 @@
+"""
+지표 간 상관관계 분석 서비스
+여러 시리즈를 공통 주기로 정렬한 뒤 상관행렬과 시차(lead/lag) 상관을 계산합니다.
+"""
+import asyncio
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.config import get_settings
+from app.services.fred_service import FREDService
+from app.services.resample_service import bucket, period_start_dates
+from app.utils.cache import TTLCache
+from app.utils.date_utils import get_date_range
+from app.utils.timing import timed
+
+settings = get_settings()
+
+# 지원하는 변환 방식
+SUPPORTED_TRANSFORMS = ("level", "diff", "pct")
+
+# (시리즈 조합, 기간, 주기, 시차, 변환) 단위 결과 캐시
+_result_cache = TTLCache(max_entries=128, ttl=settings.cache_ttl, name="derived:correlation")
+
+
+def bucket_last(observations: List[Dict], freq: str):
+    """
+    관측값을 주기 버킷별 마지막 값으로 축약합니다.
+
+    Returns:
+        (버킷 번호 배열, 값 배열) - 버킷 오름차순
+    """
+    dates = np.array([obs["date"] for obs in observations], dtype="datetime64[D]")
+    values = np.array([obs["value"] for obs in observations], dtype="float64")
+
+    order = np.argsort(dates, kind="stable")
+    return bucket(dates[order], values[order], freq, "last")
+
+
+def align_series(series_data: Dict[str, List[Dict]], freq: str):
+    """
+    여러 시리즈를 공통 주기 그리드에 정렬합니다.
+    저주기 시리즈(예: 분기 GDP)는 다음 관측 전까지 마지막 값을 유지(forward fill)합니다.
+
+    Returns:
+        (버킷 번호 배열, T x N 값 행렬)
+    """
+    bucketed = [bucket_last(observations, freq) for observations in series_data.values()]
+
+    start = min(periods[0] for periods, _ in bucketed)
+    end = max(periods[-1] for periods, _ in bucketed)
+    grid = np.arange(start, end + 1)
+
+    matrix = np.full((len(grid), len(bucketed)), np.nan)
+    for col, (periods, values) in enumerate(bucketed):
+        matrix[periods - start, col] = values
+
+    # 열 단위 forward fill (마지막 유효 행 인덱스를 누적 최대값으로 전파)
+    rows = np.arange(len(grid))[:, None]
+    valid_rows = np.where(~np.isnan(matrix), rows, 0)
+    last_valid = np.maximum.accumulate(valid_rows, axis=0)
+    matrix = matrix[last_valid, np.arange(matrix.shape[1])]
+
+    # 모든 시리즈 값이 존재하는 구간만 사용
+    complete = ~np.isnan(matrix).any(axis=1)
+    return grid[complete], matrix[complete]
+
+
+def apply_transform(matrix: np.ndarray, transform: str) -> np.ndarray:
+    """
+    정렬된 행렬에 변환(수준/차분/변화율)을 적용합니다.
+    변화율을 계산할 수 없는 칸(직전 값이 0)은 NaN으로 남기고 상관 계산에서 제외합니다.
+    """
+    if transform == "diff":
+        return np.diff(matrix, axis=0)
+    if transform == "pct":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct = np.diff(matrix, axis=0) / matrix[:-1] * 100
+        return np.where(np.isfinite(pct), pct, np.nan)
+    return matrix
+
+
+def _pairwise_correlation(lead: np.ndarray, follow: np.ndarray) -> np.ndarray:
+    """
+    lead의 각 열과 follow의 각 열 사이 피어슨 상관 (N x N)
+    두 열이 모두 유효한 행만 사용하며(pairwise deletion), 유효한 행이 3개 미만이면 NaN입니다.
+    표준편차가 0인 열과의 상관은 0입니다.
+    """
+    lead_valid = np.isfinite(lead).astype("float64")
+    follow_valid = np.isfinite(follow).astype("float64")
+    x = np.where(lead_valid > 0, lead, 0.0)
+    y = np.where(follow_valid > 0, follow, 0.0)
+
+    # 쌍별 합계를 행렬 곱으로 한 번에 계산
+    count = lead_valid.T @ follow_valid
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_x = (x.T @ follow_valid) / count
+        mean_y = (lead_valid.T @ y) / count
+        var_x = (x.T ** 2 @ follow_valid) / count - mean_x ** 2
+        var_y = (lead_valid.T @ y ** 2) / count - mean_y ** 2
+        cov = (x.T @ y) / count - mean_x * mean_y
+
+        # 부동소수점 오차로 생기는 아주 작은 분산은 0으로 처리
+        scale_x = (x.T ** 2 @ follow_valid) / count
+        scale_y = (lead_valid.T @ y ** 2) / count
+        flat = (var_x <= scale_x * 1e-12) | (var_y <= scale_y * 1e-12)
+        corr = np.where(flat, 0.0, cov / np.sqrt(np.abs(var_x * var_y)))
+
+    corr[count < 3] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+
+def correlation_matrix(matrix: np.ndarray) -> np.ndarray:
+    """N x N 피어슨 상관행렬 (쌍별 유효 행 기준)"""
+    return _pairwise_correlation(matrix, matrix)
+
+
+def lagged_correlations(matrix: np.ndarray, max_lag: int) -> np.ndarray:
+    """
+    시차별 교차상관을 계산합니다.
+
+    result[k + max_lag, i, j] = corr(x_i[t], x_j[t + k])
+    즉 k > 0에서 상관이 높으면 i가 j를 k기간 선행합니다.
+
+    Returns:
+        (2 * max_lag + 1) x N x N 배열
+    """
+    periods, n = matrix.shape
+    result = np.full((2 * max_lag + 1, n, n), np.nan)
+
+    for lag in range(-max_lag, max_lag + 1):
+        overlap = periods - abs(lag)
+        if overlap < 3:
+            continue
+
+        if lag >= 0:
+            lead, follow = matrix[:overlap], matrix[lag:]
+        else:
+            lead, follow = matrix[-lag:], matrix[:overlap]
+
+        result[lag + max_lag] = _pairwise_correlation(lead, follow)
+
+    return result
+
+
+def _round(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 4)
+
+
+@timed("transform")
+def compute_correlations(
+        series_data: Dict[str, List[Dict]],
+        freq: str,
+        max_lag: int,
+        transform: str
+) -> Dict:
+    """
+    정렬 → 변환 → 상관행렬/시차 상관 계산 (CPU 작업, 스레드에서 실행)
+    """
+    series_ids = list(series_data.keys())
+    periods, matrix = align_series(series_data, freq)
+    matrix = apply_transform(matrix, transform)
+
+    if len(matrix) < 3:
+        raise ValueError("공통 구간의 데이터가 부족합니다. 기간(window)을 늘려주세요.")
+
+    max_lag = min(max_lag, len(matrix) - 3)
+    corr = correlation_matrix(matrix)
+    lagged = lagged_correlations(matrix, max_lag)
+    lags = list(range(-max_lag, max_lag + 1))
+
+    lead_lag = []
+    for i, lead_id in enumerate(series_ids):
+        for j, follow_id in enumerate(series_ids):
+            if i >= j:
+                continue
+
+            curve = lagged[:, i, j]
+            best = int(np.nanargmax(np.abs(curve))) if not np.isnan(curve).all() else max_lag
+            lead_lag.append({
+                "series_a": lead_id,
+                "series_b": follow_id,
+                "best_lag": lags[best],
+                "best_correlation": _round(curve[best]),
+                "correlations": [
+                    {"lag": lag, "correlation": _round(value)}
+                    for lag, value in zip(lags, curve)
+                ]
+            })
+
+    # 정렬된 구간의 시작/끝 날짜 (버킷의 첫날 기준)
+    start = _period_start(periods[0], freq)
+    end = _period_start(periods[-1], freq)
+
+    return {
+        "series_ids": series_ids,
+        "observations": len(matrix),
+        "aligned_start": start,
+        "aligned_end": end,
+        "correlation": {
+            a: {b: _round(corr[i, j]) for j, b in enumerate(series_ids)}
+            for i, a in enumerate(series_ids)
+        },
+        "lead_lag": lead_lag
+    }
+
+
+def _period_start(period: int, freq: str) -> str:
+    """버킷 번호를 해당 버킷 시작 날짜 문자열로 변환"""
+    return str(period_start_dates(np.array([period]), freq)[0])
+
+
+class CorrelationService:
+    """
+    지표 간 상관관계 분석 서비스 클래스
+    """
+
+    def __init__(self, fred_service: FREDService):
+        self.fred_service = fred_service
+
+    async def analyze(
+            self,
+            series_ids: List[str],
+            window: str = "5y",
+            freq: str = "M",
+            max_lag: int = 12,
+            transform: str = "level"
+    ) -> Dict:
+        """
+        상관행렬과 시차 상관을 계산합니다.
+
+        Args:
+            series_ids: FRED 시리즈 ID 리스트 (2개 이상)
+            window: 분석 기간 (1y, 3y, 5y, 10y, 20y)
+            freq: 공통 주기 (W, M, Q, A)
+            max_lag: 최대 시차 (주기 단위)
+            transform: level(수준), diff(차분), pct(변화율 %)
+
+        Returns:
+            상관 분석 결과
+        """
+        # 같은 시리즈 조합이면 순서와 무관하게 같은 결과를 사용
+        series_ids = sorted(set(series_ids))
+        cache_key = (tuple(series_ids), window, freq, max_lag, transform)
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        start_date, end_date = get_date_range(window)
+        results = await asyncio.gather(*[
+            self.fred_service.get_series(series_id, start_date, end_date)
+            for series_id in series_ids
+        ])
+
+        series_data = {}
+        for result in results:
+            if not result.get("data"):
+                raise ValueError(f"{result['series_id']} 데이터를 가져올 수 없습니다.")
+            series_data[result["series_id"]] = result["data"]
+
+        # 무거운 계산은 이벤트 루프를 막지 않도록 스레드에서 실행
+        analysis = await asyncio.to_thread(
+            compute_correlations, series_data, freq, max_lag, transform
+        )
+        analysis.update({
+            "window": window,
+            "freq": freq,
+            "transform": transform,
+            "start_date": start_date,
+            "end_date": end_date
+        })
+
+        _result_cache.set(cache_key, analysis)
+        return analysis
+
+
+def get_correlation_service(fred_service: FREDService) -> CorrelationService:
+    """
+    CorrelationService 인스턴스를 반환합니다.
+    """
+    return CorrelationService(fred_service)
@@ -3,7 +3,7 @@
 경제 지표 데이터를 가공 및 계산
 """
 from typing import List, Dict
-import pandas as pd
+from app.utils.timing import timed
 
 
 class DataProcessor:
@@ -12,6 +12,7 @@ class DataProcessor:
     """
 
     @staticmethod
+    @timed("transform")
     def calculate_change(data: List[Dict]) -> Dict:
         """
         전월 대비 변화율을 계산합니다.
@@ -47,6 +48,7 @@ class DataProcessor:
         }
 
     @staticmethod
+    @timed("transform")
     def calculate_yoy_change(data: List[Dict]) -> Dict:
         """
         전년 동기 대비 변화율을 계산합니다 (YoY: Year over Year).
@@ -77,6 +79,7 @@ class DataProcessor:
         }
 
     @staticmethod
+    @timed("transform")
     def calculate_moving_average(data: List[Dict], window: int = 3) -> List[Dict]:
         """
         이동평균을 계산합니다.
@@ -91,6 +94,9 @@ class DataProcessor:
         if len(data) < window:
             return data
 
+        # pandas는 import가 무거워서 필요할 때만 로드
+        import pandas as pd
+
         # pandas DataFrame으로 변환
         df = pd.DataFrame(data)
         df['date'] = pd.to_datetime(df['date'])
@@ -111,6 +117,7 @@ class DataProcessor:
         return result
 
     @staticmethod
+    @timed("transform")
     def get_trend(data: List[Dict], periods: int = 3) -> str:
         """
         최근 추세를 판단합니다.
@@ -140,6 +147,7 @@ class DataProcessor:
             return "stable"
 
     @staticmethod
+    @timed("transform")
     def normalize_data(data: List[Dict]) -> List[Dict]:
         """
         데이터를 0-100 범위로 정규화합니다.
@@ -0,0 +1,130 @@
+"""
+시리즈 내보내기 서비스
+여러 시리즈의 전체 히스토리를 청크 단위로 CSV / NDJSON / Parquet 스트림으로 변환합니다.
+전체 데이터를 메모리에 올리지 않고 청크 하나씩 인코딩해서 바로 흘려보냅니다.
+"""
+import json
+from typing import AsyncIterator, Dict, List, Tuple
+
+from app.services.fred_service import FREDService
+
+# 포맷별 (미디어 타입, 확장자)
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "parquet": ("application/vnd.apache.parquet", "parquet")
+}
+
+
+async def iter_export_chunks(
+        fred_service: FREDService,
+        series_ranges: List[Tuple[str, str, str]]
+) -> AsyncIterator[Tuple[str, List[Dict]]]:
+    """
+    (series_id, 청크) 쌍을 시리즈 순서대로, 각 시리즈는 날짜 오름차순으로 만듭니다.
+
+    Args:
+        fred_service: FREDService 인스턴스
+        series_ranges: [(series_id, start_date, end_date), ...]
+    """
+    for series_id, start_date, end_date in series_ranges:
+        async for chunk in fred_service.iter_series_chunks(series_id, start_date, end_date):
+            yield series_id, chunk
+
+
+async def stream_csv(chunks: AsyncIterator[Tuple[str, List[Dict]]]) -> AsyncIterator[bytes]:
+    """
+    series_id,date,value 형식의 CSV 스트림
+    """
+    yield b"series_id,date,value\n"
+    async for series_id, chunk in chunks:
+        yield "".join(f"{series_id},{obs['date']},{obs['value']!r}\n" for obs in chunk).encode("utf-8")
+
+
+async def stream_ndjson(chunks: AsyncIterator[Tuple[str, List[Dict]]]) -> AsyncIterator[bytes]:
+    """
+    한 줄에 관측값 하나인 NDJSON 스트림
+    """
+    async for series_id, chunk in chunks:
+        yield "".join(
+            json.dumps({"series_id": series_id, "date": obs["date"], "value": obs["value"]}) + "\n"
+            for obs in chunk
+        ).encode("utf-8")
+
+
+class _ChunkSink:
+    """
+    ParquetWriter가 쓴 바이트를 모아두었다가 청크마다 꺼내가는 파일 객체
+    """
+
+    def __init__(self):
+        self._buffer: List[bytes] = []
+        self.closed = False
+
+    def write(self, data) -> int:
+        self._buffer.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+async def stream_parquet(chunks: AsyncIterator[Tuple[str, List[Dict]]]) -> AsyncIterator[bytes]:
+    """
+    청크마다 row group 하나를 쓰는 Parquet 스트림 (pyarrow 필요)
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("series_id", pa.string()),
+        ("date", pa.date32()),
+        ("value", pa.float64())
+    ])
+
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema)
+
+    try:
+        async for series_id, chunk in chunks:
+            table = pa.table({
+                "series_id": pa.array([series_id] * len(chunk), pa.string()),
+                "date": pa.array([obs["date"] for obs in chunk], pa.string()).cast(pa.date32()),
+                "value": pa.array([obs["value"] for obs in chunk], pa.float64())
+            }, schema=schema)
+            writer.write_table(table)
+
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        # 푸터(메타데이터)까지 기록
+        writer.close()
+
+    yield sink.drain()
+
+
+def parquet_available() -> bool:
+    """
+    Parquet 내보내기에 필요한 pyarrow 설치 여부
+    """
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+STREAMERS = {
+    "csv": stream_csv,
+    "ndjson": stream_ndjson,
+    "parquet": stream_parquet
+}
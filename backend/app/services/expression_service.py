@@ -0,0 +1,469 @@
+"""
+파생 시리즈 수식 엔진
+카탈로그 시리즈 ID로 만든 간단한 수식을 계산합니다.
+
+    DGS10 - DFF                    (장단기 금리차)
+    DGS10 - yoy(CPIAUCSL)          (실질 10년 금리)
+    JTSJOL / UNEMPLOY              (실업자 1인당 구인 수)
+
+- 파서: Python ast로 파싱 후 허용된 노드(사칙연산, 숫자, 시리즈 ID, 함수 호출)만 통과
+- 주기가 다른 시리즈끼리 연산하면 날짜 합집합 위에서 as-of(직전 값) 정렬
+- 모든 연산은 numpy 배열 단위로 계산
+- 결과는 (수식, 기간, 입력 시리즈 데이터 버전) 단위로 캐시 → 입력이 바뀔 때만 다시 계산
+"""
+import ast
+import asyncio
+import operator
+from datetime import datetime, timedelta
+from math import ceil
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from app.config import get_settings
+from app.services.fred_service import FREDService
+from app.services.resample_service import SUPPORTED_AGGREGATIONS, SUPPORTED_FREQUENCIES, resample_arrays
+from app.services.series_catalog import get_series_catalog
+from app.utils.cache import TTLCache
+from app.utils.date_utils import get_date_range
+from app.utils.timing import timed
+
+settings = get_settings()
+
+# 수식 제한
+MAX_EXPRESSION_LENGTH = 200
+MAX_EXPRESSION_NODES = 60
+MAX_WINDOW = 260  # ma/lag의 최대 관측값 수
+
+# FRED frequency_short(와 resample 주기) → 관측 간격 (일, 일별 시리즈는 영업일 기준)
+FREQUENCY_DAYS = {
+    "D": 1.5,
+    "W": 7,
+    "BW": 14,
+    "M": 31,
+    "Q": 92,
+    "SA": 183,
+    "A": 366
+}
+
+# 주기를 모르는 시리즈는 월별로 간주
+DEFAULT_PERIOD_DAYS = 31
+
+# 함수 이름 → (최소 인자 수, 최대 인자 수)
+FUNCTIONS = {
+    "yoy": (1, 1),       # 전년 동기 대비 변화율 (%)
+    "mom": (1, 1),       # 전월 대비 변화율 (%)
+    "ma": (2, 2),        # 이동평균 (관측값 n개)
+    "lag": (2, 2),       # n개 관측값만큼 뒤로 밀기
+    "resample": (2, 3)   # 주기 변환 (W/M/Q/A, last/mean/sum/max)
+}
+
+BINARY_OPERATORS: Dict[type, Callable] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv
+}
+
+# (정규화된 수식, 시작, 종료, 입력 버전) 단위 결과 캐시
+_result_cache = TTLCache(max_entries=256, ttl=settings.cache_ttl, name="derived:expression")
+
+# (날짜 배열, 값 배열) - 날짜 오름차순, 유한한 값만
+Series = Tuple[np.ndarray, np.ndarray]
+Value = Union[Series, float]
+
+
+class ExpressionError(ValueError):
+    """
+    수식 문법/검증 오류 (400 응답)
+    """
+
+
+class ParsedExpression:
+    """
+    검증된 수식 트리와 계산에 필요한 정보
+    """
+
+    def __init__(self, tree: ast.Expression, series_ids: List[str]):
+        self.tree = tree
+        self.series_ids = series_ids
+        self.normalized = ast.unparse(tree)
+
+
+# ---------- 파싱 ----------
+
+class _Validator(ast.NodeTransformer):
+    """
+    허용된 노드만 남기고 이름을 정규화합니다. (시리즈 ID는 대문자, 함수 이름은 소문자)
+    """
+
+    def __init__(self, is_known_series: Callable[[str], bool]):
+        self.is_known_series = is_known_series
+        self.series_ids: Set[str] = set()
+
+    def generic_visit(self, node):
+        raise ExpressionError(f"허용되지 않는 구문입니다: {type(node).__name__}")
+
+    def visit_Expression(self, node: ast.Expression):
+        node.body = self.visit(node.body)
+        return node
+
+    def visit_BinOp(self, node: ast.BinOp):
+        if type(node.op) not in BINARY_OPERATORS:
+            raise ExpressionError("연산자는 +, -, *, / 만 사용할 수 있습니다.")
+        node.left = self.visit(node.left)
+        node.right = self.visit(node.right)
+        return node
+
+    def visit_UnaryOp(self, node: ast.UnaryOp):
+        if not isinstance(node.op, (ast.USub, ast.UAdd)):
+            raise ExpressionError("허용되지 않는 단항 연산자입니다.")
+        node.operand = self.visit(node.operand)
+        return node
+
+    def visit_Constant(self, node: ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ExpressionError("숫자 상수만 사용할 수 있습니다.")
+        return node
+
+    def visit_Name(self, node: ast.Name):
+        series_id = node.id.upper()
+        if not self.is_known_series(series_id):
+            raise ExpressionError(f"지원하지 않는 시리즈: {series_id}")
+        self.series_ids.add(series_id)
+        return ast.copy_location(ast.Name(id=series_id, ctx=ast.Load()), node)
+
+    def visit_Call(self, node: ast.Call):
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            raise ExpressionError("함수는 name(인자, ...) 형태로만 호출할 수 있습니다.")
+
+        name = node.func.id.lower()
+        if name not in FUNCTIONS:
+            raise ExpressionError(f"지원하지 않는 함수: {node.func.id} (사용 가능: {', '.join(FUNCTIONS)})")
+
+        min_args, max_args = FUNCTIONS[name]
+        if not min_args <= len(node.args) <= max_args:
+            raise ExpressionError(f"{name} 함수의 인자 수가 올바르지 않습니다.")
+
+        args = [self.visit(node.args[0])]
+        if name in ("ma", "lag"):
+            args.append(self._window_arg(name, node.args[1]))
+        elif name == "resample":
+            args.append(self._choice_arg(node.args[1], SUPPORTED_FREQUENCIES, upper=True))
+            if len(node.args) > 2:
+                args.append(self._choice_arg(node.args[2], SUPPORTED_AGGREGATIONS, upper=False))
+
+        return ast.copy_location(ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=args, keywords=[]), node)
+
+    @staticmethod
+    def _window_arg(name: str, node: ast.AST) -> ast.Constant:
+        if not isinstance(node, ast.Constant) or isinstance(node.value, bool) or not isinstance(node.value, int):
+            raise ExpressionError(f"{name} 함수의 두 번째 인자는 정수여야 합니다.")
+        if not 1 <= node.value <= MAX_WINDOW:
+            raise ExpressionError(f"{name} 함수의 기간은 1~{MAX_WINDOW} 사이여야 합니다.")
+        return node
+
+    @staticmethod
+    def _choice_arg(node: ast.AST, choices: Tuple[str, ...], upper: bool) -> ast.Constant:
+        # 따옴표 없이 resample(ICSA, M)처럼 써도 허용
+        if isinstance(node, ast.Name):
+            value = node.id
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            value = node.value
+        else:
+            raise ExpressionError(f"resample 인자는 {', '.join(choices)} 중 하나여야 합니다.")
+
+        value = value.upper() if upper else value.lower()
+        if value not in choices:
+            raise ExpressionError(f"resample 인자는 {', '.join(choices)} 중 하나여야 합니다.")
+        return ast.Constant(value=value)
+
+
+def _period_days(node: ast.AST, frequency_of: Callable[[str], Optional[str]]) -> float:
+    """
+    노드 결과 시리즈의 관측 간격 (일) - 주기가 다른 시리즈끼리의 연산은 더 긴 쪽 기준
+    """
+    if isinstance(node, ast.Expression):
+        return _period_days(node.body, frequency_of)
+    if isinstance(node, ast.BinOp):
+        return max(_period_days(node.left, frequency_of), _period_days(node.right, frequency_of))
+    if isinstance(node, ast.UnaryOp):
+        return _period_days(node.operand, frequency_of)
+    if isinstance(node, ast.Name):
+        return FREQUENCY_DAYS.get(frequency_of(node.id), DEFAULT_PERIOD_DAYS)
+    if isinstance(node, ast.Call):
+        if node.func.id == "resample":
+            return FREQUENCY_DAYS[node.args[1].value]
+        return _period_days(node.args[0], frequency_of)
+    return 0
+
+
+def lookback_days(node: ast.AST, frequency_of: Callable[[str], Optional[str]]) -> int:
+    """
+    함수 계산에 필요한 추가 조회 기간 (일) - 중첩된 함수는 누적
+    ma/lag는 입력 시리즈 주기(frequency_of: 시리즈 ID → FRED frequency_short)로 기간을 환산합니다.
+    """
+    if isinstance(node, ast.Expression):
+        return lookback_days(node.body, frequency_of)
+    if isinstance(node, ast.BinOp):
+        return max(lookback_days(node.left, frequency_of), lookback_days(node.right, frequency_of))
+    if isinstance(node, ast.UnaryOp):
+        return lookback_days(node.operand, frequency_of)
+    if isinstance(node, ast.Call):
+        inner = lookback_days(node.args[0], frequency_of)
+        name = node.func.id
+        if name == "yoy":
+            return inner + 370
+        if name == "mom":
+            return inner + 35
+        if name in ("ma", "lag"):
+            return inner + ceil(node.args[1].value * _period_days(node.args[0], frequency_of))
+        return inner
+    return 0
+
+
+def parse_expression(expression: str, is_known_series: Callable[[str], bool]) -> ParsedExpression:
+    """
+    수식을 파싱하고 검증합니다.
+
+    Raises:
+        ExpressionError: 문법 오류, 허용되지 않는 구문, 알 수 없는 시리즈/함수
+    """
+    expression = expression.strip()
+    if not expression:
+        raise ExpressionError("수식이 비어 있습니다.")
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise ExpressionError(f"수식이 너무 깁니다. (최대 {MAX_EXPRESSION_LENGTH}자)")
+
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as e:
+        raise ExpressionError(f"수식 문법 오류: {e.msg}")
+
+    if sum(1 for _ in ast.walk(tree)) > MAX_EXPRESSION_NODES:
+        raise ExpressionError("수식이 너무 복잡합니다.")
+
+    validator = _Validator(is_known_series)
+    tree = validator.visit(tree)
+    if not validator.series_ids:
+        raise ExpressionError("수식에 시리즈가 하나 이상 필요합니다.")
+
+    return ParsedExpression(tree, sorted(validator.series_ids))
+
+
+# ---------- 벡터 연산 ----------
+
+def to_series(observations: List[Dict]) -> Series:
+    """
+    [{date, value}, ...] → (날짜 배열, 값 배열) 날짜 오름차순
+    """
+    dates = np.array([obs["date"] for obs in observations], dtype="datetime64[D]")
+    values = np.array([obs["value"] for obs in observations], dtype="float64")
+    order = np.argsort(dates, kind="stable")
+    return dates[order], values[order]
+
+
+def _finite(dates: np.ndarray, values: np.ndarray) -> Series:
+    mask = np.isfinite(values)
+    return dates[mask], values[mask]
+
+
+def asof(dates: np.ndarray, values: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    각 target 날짜 시점의 직전(같은 날 포함) 관측값 (없으면 NaN)
+    """
+    index = np.searchsorted(dates, targets, side="right") - 1
+    return np.where(index >= 0, values[np.maximum(index, 0)], np.nan)
+
+
+def _shift_months(dates: np.ndarray, months: int) -> np.ndarray:
+    # 같은 일자의 months개월 전 날짜 (말일 초과분은 다음 달로 넘어감)
+    month_start = dates.astype("datetime64[M]")
+    offset = dates - month_start.astype("datetime64[D]")
+    return (month_start - months).astype("datetime64[D]") + offset
+
+
+def pct_change_months(series: Series, months: int) -> Series:
+    """
+    months개월 전 값 대비 변화율 (%)
+    """
+    dates, values = series
+    previous = asof(dates, values, _shift_months(dates, months))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = (values / previous - 1) * 100
+    return _finite(dates, pct)
+
+
+def moving_average(series: Series, window: int) -> Series:
+    """
+    관측값 window개 단순 이동평균 (누적합으로 계산)
+    """
+    dates, values = series
+    if len(values) < window:
+        return dates[:0], values[:0]
+    cumsum = np.concatenate(([0.0], np.cumsum(values)))
+    return dates[window - 1:], (cumsum[window:] - cumsum[:-window]) / window
+
+
+def lag(series: Series, periods: int) -> Series:
+    """
+    각 날짜에 periods개 이전 관측값을 배치
+    """
+    dates, values = series
+    if len(values) <= periods:
+        return dates[:0], values[:0]
+    return dates[periods:], values[:len(values) - periods]
+
+
+def combine(left: Value, right: Value, op: Callable) -> Value:
+    """
+    두 값(시리즈 또는 상수)에 연산을 적용합니다.
+    시리즈끼리는 날짜 합집합 위에서 as-of 정렬 (둘 다 시작된 이후 구간만)
+    """
+    left_is_series = isinstance(left, tuple)
+    right_is_series = isinstance(right, tuple)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if not left_is_series and not right_is_series:
+            return float(op(left, right))
+        if not right_is_series:
+            return _finite(left[0], op(left[1], right))
+        if not left_is_series:
+            return _finite(right[0], op(left, right[1]))
+
+        (left_dates, left_values), (right_dates, right_values) = left, right
+        if len(left_dates) == 0 or len(right_dates) == 0:
+            return left_dates[:0], left_values[:0]
+
+        dates = np.union1d(left_dates, right_dates)
+        dates = dates[dates >= max(left_dates[0], right_dates[0])]
+        values = op(asof(left_dates, left_values, dates), asof(right_dates, right_values, dates))
+        return _finite(dates, values)
+
+
+def evaluate(node: ast.AST, inputs: Dict[str, Series]) -> Value:
+    """
+    검증된 수식 트리를 계산합니다.
+    """
+    if isinstance(node, ast.Expression):
+        return evaluate(node.body, inputs)
+    if isinstance(node, ast.Constant):
+        return float(node.value)
+    if isinstance(node, ast.Name):
+        return inputs[node.id]
+    if isinstance(node, ast.UnaryOp):
+        operand = evaluate(node.operand, inputs)
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        return (operand[0], -operand[1]) if isinstance(operand, tuple) else -operand
+    if isinstance(node, ast.BinOp):
+        return combine(evaluate(node.left, inputs), evaluate(node.right, inputs), BINARY_OPERATORS[type(node.op)])
+
+    # 함수 호출 (첫 번째 인자는 시리즈여야 함)
+    name = node.func.id
+    series = evaluate(node.args[0], inputs)
+    if not isinstance(series, tuple):
+        raise ExpressionError(f"{name} 함수에는 시리즈를 넘겨야 합니다.")
+
+    if name == "yoy":
+        return pct_change_months(series, 12)
+    if name == "mom":
+        return pct_change_months(series, 1)
+    if name == "ma":
+        return moving_average(series, node.args[1].value)
+    if name == "lag":
+        return lag(series, node.args[1].value)
+    return resample_arrays(*series, *(arg.value for arg in node.args[1:]))
+
+
+@timed("transform")
+def compute_expression(parsed: ParsedExpression, series_data: Dict[str, List[Dict]], start_date: str) -> List[Dict]:
+    """
+    입력 시리즈로 수식을 계산해 [{date, value}, ...] 날짜 내림차순으로 반환합니다. (스레드에서 실행)
+    """
+    inputs = {series_id: to_series(observations) for series_id, observations in series_data.items()}
+    result = evaluate(parsed.tree, inputs)
+    if not isinstance(result, tuple):
+        raise ExpressionError("수식 결과가 시리즈가 아닙니다.")
+
+    dates, values = result
+    keep = dates >= np.datetime64(start_date)
+    dates, values = dates[keep][::-1], values[keep][::-1]
+
+    return [
+        {"date": str(date), "value": round(float(value), 4)}
+        for date, value in zip(dates, values)
+    ]
+
+
+class ExpressionService:
+    """
+    파생 시리즈 계산 서비스 클래스
+    """
+
+    def __init__(self, fred_service: FREDService):
+        self.fred_service = fred_service
+
+    async def evaluate(self, expression: str, period: str = "5y") -> Dict:
+        """
+        수식을 계산합니다.
+
+        Args:
+            expression: 수식 (예: "DGS10 - yoy(CPIAUCSL)")
+            period: 결과 기간 (1y, 3y, 5y, 10y, 20y)
+
+        Returns:
+            {expression, series_ids, data, count, input_versions, ...}
+        """
+        catalog = get_series_catalog()
+        await catalog.sync()
+        parsed = parse_expression(expression, catalog.contains)
+
+        # 주기를 모르는 시리즈는 메타데이터를 먼저 가져옴 (ma/lag 추가 조회 기간 계산용)
+        await catalog.enrich(self.fred_service, [
+            series_id for series_id in parsed.series_ids if not catalog.get(series_id).get("frequency_short")
+        ])
+        extra_days = lookback_days(parsed.tree, lambda series_id: catalog.get(series_id).get("frequency_short"))
+
+        start_date, end_date = get_date_range(period)
+        fetch_start = (datetime.strptime(start_date, "%Y-%m-%d") - timedelta(days=extra_days)).strftime("%Y-%m-%d")
+
+        results = await asyncio.gather(*[
+            self.fred_service.get_series(series_id, fetch_start, end_date)
+            for series_id in parsed.series_ids
+        ])
+
+        series_data = {}
+        for result in results:
+            if not result.get("data"):
+                raise ValueError(f"{result['series_id']} 데이터를 가져올 수 없습니다.")
+            series_data[result["series_id"]] = result["data"]
+
+        # 입력 데이터 버전이 같으면 이전 계산 결과를 그대로 사용
+        versions = {series_id: self.fred_service.store.version(series_id) for series_id in parsed.series_ids}
+        cache_key = (parsed.normalized, start_date, end_date, tuple(versions.items()))
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        data = await asyncio.to_thread(compute_expression, parsed, series_data, start_date)
+
+        response = {
+            "expression": parsed.normalized,
+            "series_ids": parsed.series_ids,
+            "period": period,
+            "start_date": start_date,
+            "end_date": end_date,
+            "input_versions": versions,
+            "data": data,
+            "count": len(data)
+        }
+        _result_cache.set(cache_key, response)
+        return response
+
+
+def get_expression_service(fred_service: FREDService) -> ExpressionService:
+    """
+    ExpressionService 인스턴스를 반환합니다.
+    """
+    return ExpressionService(fred_service)
@@ -2,13 +2,41 @@
 FRED API 서비스
 세인트루이스 연방준비은행의 경제 데이터
 """
+import asyncio
 import httpx
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from app.config import get_settings
+from app.services.cache_service import get_shared_cache
+from app.services.series_store import get_series_store
+from app.services.vintage_store import SeriesVintages, get_vintage_store, EARLIEST_REALTIME
+from app.utils.timing import timed
 
 settings = get_settings()
 
+# ALFRED real-time 조회 시 페이지 크기 (FRED 최대값)
+REALTIME_PAGE_SIZE = 100000
+
+# 전체 기간 조회 시 청크 크기 (년)
+EXPORT_CHUNK_YEARS = 10
+
+# 응답 마감 뒤에도 진행 중인 fetch 작업 (가비지 컬렉션 방지용 참조)
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def is_entry_current(entry: Dict, upstream_updated: str) -> bool:
+    """
+    캐시 엔트리가 FRED last_updated 이후의 데이터인지 확인합니다.
+    같은 last_updated로 가져왔거나, last_updated보다 나중에 가져온 엔트리면 최신입니다.
+    """
+    if entry.get("last_updated") == upstream_updated:
+        return True
+    try:
+        # fetched_at은 서버 로컬 시각, last_updated는 "2024-06-07 07:46:02-05" 형식
+        return datetime.fromisoformat(entry["fetched_at"]).astimezone() >= datetime.fromisoformat(upstream_updated)
+    except (KeyError, TypeError, ValueError):
+        return False
+
 
 class FREDService:
     """
@@ -18,20 +46,44 @@ class FREDService:
     def __init__(self):
         self.base_url = settings.fred_base_url
         self.api_key = settings.fred_api_key
-        # 비동기 HTTP 클라이언트 생성
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # 비동기 HTTP 클라이언트 (캐시 히트만으로 끝나는 요청이 많아 처음 호출할 때 생성)
+        self._client: Optional[httpx.AsyncClient] = None
+        # 워커 간 공유 캐시
+        self.cache = get_shared_cache()
+        # 프로세스 내부 시리즈 저장소 (변경분 계산 및 리스너 알림)
+        self.store = get_series_store()
+        # ALFRED 빈티지 저장소 (델타 저장)
+        self.vintage_store = get_vintage_store()
+        # 마감 시간 뒤에도 계속 가져오는 중인 작업 (끝난 뒤에 클라이언트 종료)
+        self._background: Optional[asyncio.Task] = None
+        self._close_requested = False
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=30.0)
+        return self._client
 
     async def close(self):
         """
         HTTP 클라이언트 종료
+        (마감 시간 뒤 백그라운드로 가져오는 중이면 그 작업이 끝난 뒤 종료)
         """
-        await self.client.aclose()
+        if self._background is not None and not self._background.done():
+            self._close_requested = True
+            return
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
+    @timed("get_series")
     async def get_series(
             self,
             series_id: str,
             start_date: Optional[str] = None,
-            end_date: Optional[str] = None
+            end_date: Optional[str] = None,
+            as_of: Optional[str] = None,
+            upstream_updated: Optional[str] = None
     ) -> Dict:
         """
         단일 경제 지표 데이터를 가져옵니다.
@@ -40,6 +92,8 @@ class FREDService:
             series_id: FRED 시리즈 ID (예: 'DFF', 'CPIAUCSL')
             start_date: 시작 날짜 (YYYY-MM-DD)
             end_date: 종료 날짜 (YYYY-MM-DD)
+            as_of: 기준 시점 (YYYY-MM-DD) - 지정하면 그 시점에 알려진 빈티지 값을 반환
+            upstream_updated: FRED last_updated (refresh 경로) - 캐시 엔트리가 이보다 이전 데이터면 다시 가져옴
 
         Returns:
             경제 지표 데이터
@@ -50,6 +104,75 @@ class FREDService:
         if not start_date:
             start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
 
+        if as_of:
+            return await self.get_series_as_of(series_id, as_of, start_date, end_date)
+
+        cache_key = f"fred:observations:{series_id}:{start_date}:{end_date}"
+
+        try:
+            # 공유 캐시 조회 (미스 시 워커 중 하나만 FRED 호출)
+            cached = await self.cache.get_or_fetch(
+                cache_key,
+                lambda: self._fetch_cache_entry(series_id, start_date, end_date, upstream_updated),
+                ttl=settings.cache_ttl,
+                is_fresh=(lambda entry: is_entry_current(entry, upstream_updated)) if upstream_updated else None
+            )
+            valid_observations = cached["observations"]
+
+            # refresh 경로: 저장소에 반영 (이미 반영한 캐시 엔트리는 건너뜀)
+            self.store.ingest(series_id, valid_observations, source=f"{cache_key}@{cached['fetched_at']}")
+
+            return {
+                "series_id": series_id,
+                "data": valid_observations,
+                "count": len(valid_observations),
+                "start_date": start_date,
+                "end_date": end_date
+            }
+
+        except httpx.HTTPStatusError as e:
+            print(f"❌ HTTP 에러: {e.response.status_code} - {series_id}")
+            return {
+                "series_id": series_id,
+                "data": [],
+                "error": f"HTTP {e.response.status_code}"
+            }
+        except Exception as e:
+            print(f"❌ 에러 발생: {str(e)} - {series_id}")
+            return {
+                "series_id": series_id,
+                "data": [],
+                "error": str(e)
+            }
+
+    async def _fetch_cache_entry(
+            self,
+            series_id: str,
+            start_date: str,
+            end_date: str,
+            last_updated: Optional[str] = None
+    ) -> Dict:
+        """
+        캐시에 저장할 엔트리를 만듭니다. (관측값 + 가져온 시각 + 알고 있던 FRED last_updated)
+        """
+        observations = await self._fetch_observations(series_id, start_date, end_date)
+        return {
+            "observations": observations,
+            "fetched_at": datetime.now().isoformat(),
+            "last_updated": last_updated
+        }
+
+    @timed("fred")
+    async def _fetch_observations(
+            self,
+            series_id: str,
+            start_date: str,
+            end_date: str
+    ) -> List[Dict]:
+        """
+        FRED API에서 관측값을 직접 가져옵니다. (캐시 미사용)
+        에러는 캐시되지 않도록 예외로 전파합니다.
+        """
         # API 엔드포인트
         url = f"{self.base_url}/series/observations"
 
@@ -63,54 +186,223 @@ class FREDService:
             "sort_order": "desc"  # 최신 데이터부터
         }
 
-        try:
-            # API 호출
-            response = await self.client.get(url, params=params)
-            response.raise_for_status()  # 에러 발생 시 예외 처리
+        # API 호출
+        print(f"🌐 FRED 호출: {series_id} ({start_date} ~ {end_date})")
+        response = await self.client.get(url, params=params)
+        response.raise_for_status()  # 에러 발생 시 예외 처리
 
-            data = response.json()
+        data = response.json()
+
+        # 데이터 가공
+        observations = data.get("observations", [])
+
+        # '.'은 데이터 없음을 의미하므로 필터링
+        return [
+            {
+                "date": obs["date"],
+                "value": float(obs["value"])
+            }
+            for obs in observations
+            if obs["value"] != "."
+        ]
+
+    async def iter_series_chunks(
+            self,
+            series_id: str,
+            start_date: str,
+            end_date: Optional[str] = None,
+            chunk_years: int = EXPORT_CHUNK_YEARS,
+            descending: bool = False
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        긴 기간의 관측값을 달력 기준 chunk_years 단위 청크로 나눠 오름차순으로 가져옵니다.
+        descending=True면 최신 청크부터 내림차순으로 가져옵니다. (최신 페이지는 최근 청크만 읽음)
+
+        청크 경계가 고정되어 있어 요청이 달라도 같은 캐시 엔트리를 재사용하며,
+        SeriesStore에는 반영하지 않으므로 메모리 사용량은 청크 하나 크기로 제한됩니다.
 
-            # 데이터 가공
-            observations = data.get("observations", [])
-
-            # '.'은 데이터 없음을 의미하므로 필터링
-            valid_observations = [
-                {
-                    "date": obs["date"],
-                    "value": float(obs["value"])
-                }
-                for obs in observations
-                if obs["value"] != "."
+        Args:
+            series_id: FRED 시리즈 ID
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (기본값: 오늘)
+            chunk_years: 청크 크기 (년)
+            descending: 최신 청크부터 내림차순으로 가져올지 여부
+
+        Yields:
+            [{date, value}, ...] 날짜 오름차순(descending이면 내림차순) 청크
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        end_date = min(end_date or today, today)
+        if start_date > end_date:
+            return
+
+        first_year = int(start_date[:4])
+        first_year -= first_year % chunk_years
+        last_year = int(end_date[:4])
+        last_year -= last_year % chunk_years
+
+        years = range(first_year, last_year + 1, chunk_years)
+        for year in (reversed(years) if descending else years):
+            chunk_start = f"{year}-01-01"
+            chunk_end = f"{year + chunk_years - 1}-12-31"
+
+            # 진행 중인 구간은 오늘까지만, 지난 구간은 더 오래 캐시
+            is_open = chunk_end >= today
+            if is_open:
+                chunk_end = today
+
+            cached = await self.cache.get_or_fetch(
+                f"fred:observations:{series_id}:{chunk_start}:{chunk_end}",
+                lambda: self._fetch_cache_entry(series_id, chunk_start, chunk_end),
+                ttl=settings.cache_ttl if is_open else settings.history_cache_ttl
+            )
+
+            # 캐시 엔트리는 날짜 내림차순
+            observations = cached["observations"] if descending else reversed(cached["observations"])
+            chunk = [
+                obs for obs in observations
+                if start_date <= obs["date"] <= end_date
             ]
+            if chunk:
+                yield chunk
+
+    async def get_series_as_of(
+            self,
+            series_id: str,
+            as_of: str,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None
+    ) -> Dict:
+        """
+        as_of 시점에 알려진 값(빈티지)으로 시리즈를 가져옵니다.
+        빈티지가 이미 동기화되어 있으면 FRED 호출 없이 로컬 인덱스에서 조회합니다.
+
+        Args:
+            series_id: FRED 시리즈 ID
+            as_of: 기준 시점 (YYYY-MM-DD)
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+
+        Returns:
+            경제 지표 데이터 (get_series와 같은 형식 + as_of)
+        """
+        try:
+            vintages = await self.sync_vintages(series_id, as_of)
+            observations = vintages.series_as_of(as_of, start_date, end_date)
 
             return {
                 "series_id": series_id,
-                "data": valid_observations,
-                "count": len(valid_observations),
+                "data": observations,
+                "count": len(observations),
                 "start_date": start_date,
-                "end_date": end_date
+                "end_date": end_date,
+                "as_of": as_of,
+                "vintage_date": vintages.vintage_as_of(as_of)
             }
 
         except httpx.HTTPStatusError as e:
-            print(f"❌ HTTP 에러: {e.response.status_code} - {series_id}")
+            print(f"❌ HTTP 에러: {e.response.status_code} - {series_id} (as_of={as_of})")
             return {
                 "series_id": series_id,
                 "data": [],
+                "as_of": as_of,
                 "error": f"HTTP {e.response.status_code}"
             }
         except Exception as e:
-            print(f"❌ 에러 발생: {str(e)} - {series_id}")
+            print(f"❌ 에러 발생: {str(e)} - {series_id} (as_of={as_of})")
             return {
                 "series_id": series_id,
                 "data": [],
+                "as_of": as_of,
                 "error": str(e)
             }
 
+    async def sync_vintages(self, series_id: str, through: Optional[str] = None) -> SeriesVintages:
+        """
+        through 시점까지의 빈티지가 로컬에 없으면 ALFRED에서 가져와 델타로 저장합니다.
+        이미 동기화된 구간 이후의 빈티지만 추가로 가져옵니다.
+
+        Args:
+            series_id: FRED 시리즈 ID
+            through: 필요한 마지막 real-time 날짜 (기본값: 오늘)
+
+        Returns:
+            시리즈 빈티지 인덱스
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        through = min(through or today, today)
+
+        vintages = self.vintage_store.load(series_id)
+        if vintages.synced_through and vintages.synced_through >= through:
+            return vintages
+
+        # 워커 간 중복 동기화 방지
+        async with self.cache.lock(f"vintage:{series_id}"):
+            vintages = self.vintage_store.load(series_id)
+            if vintages.synced_through and vintages.synced_through >= through:
+                return vintages
+
+            realtime_start = vintages.synced_through or EARLIEST_REALTIME
+            print(f"🕰️ ALFRED 빈티지 동기화: {series_id} ({realtime_start} ~ {today})")
+            rows = await self._fetch_realtime_rows(series_id, realtime_start, today)
+
+            added = self.vintage_store.ingest_realtime_rows(series_id, rows, today)
+            self.vintage_store.save(series_id)
+            print(f"✅ 빈티지 델타 {added}건 저장: {series_id}")
+
+        return self.vintage_store.load(series_id)
+
+    @timed("fred")
+    async def _fetch_realtime_rows(
+            self,
+            series_id: str,
+            realtime_start: str,
+            realtime_end: str
+    ) -> List[Dict]:
+        """
+        ALFRED real-time 관측값을 페이지 단위로 모두 가져옵니다.
+        각 행은 값이 유효했던 real-time 구간(realtime_start ~ realtime_end)을 가집니다.
+        """
+        url = f"{self.base_url}/series/observations"
+        rows = []
+        offset = 0
+
+        while True:
+            params = {
+                "series_id": series_id,
+                "api_key": self.api_key,
+                "file_type": "json",
+                "realtime_start": realtime_start,
+                "realtime_end": realtime_end,
+                "sort_order": "asc",
+                "limit": REALTIME_PAGE_SIZE,
+                "offset": offset
+            }
+
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
+
+            page = data.get("observations", [])
+            rows.extend(page)
+            offset += len(page)
+
+            if len(page) < REALTIME_PAGE_SIZE or offset >= data.get("count", offset):
+                return rows
+
+    async def get_revision_history(self, series_id: str, obs_date: str) -> List[Dict]:
+        """
+        관측 날짜 하나의 빈티지별 수정 이력을 반환합니다.
+        """
+        vintages = await self.sync_vintages(series_id)
+        return vintages.revision_history(obs_date)
+
     async def get_multiple_series(
             self,
             series_ids: List[str],
             start_date: Optional[str] = None,
-            end_date: Optional[str] = None
+            end_date: Optional[str] = None,
+            upstream_updated: Optional[Dict[str, Optional[str]]] = None
     ) -> Dict[str, Dict]:
         """
         여러 경제 지표를 한 번에 가져옵니다.
@@ -119,20 +411,220 @@ class FREDService:
             series_ids: FRED 시리즈 ID 리스트
             start_date: 시작 날짜
             end_date: 종료 날짜
+            upstream_updated: {series_id: FRED last_updated} (refresh 경로, get_last_updated 결과)
 
         Returns:
             {series_id: data} 형태의 딕셔너리
         """
         results = {}
+        upstream_updated = upstream_updated or {}
 
         # 각 시리즈를 순차적으로 가져오기
         for series_id in series_ids:
             print(f"📊 데이터 가져오는 중: {series_id}")
-            data = await self.get_series(series_id, start_date, end_date)
+            data = await self.get_series(series_id, start_date, end_date, upstream_updated=upstream_updated.get(series_id))
             results[series_id] = data
 
         return results
 
+    async def get_multiple_series_within(
+            self,
+            series_ids: List[str],
+            start_date: str,
+            end_date: str,
+            deadline: Optional[float]
+    ) -> Tuple[Dict[str, Dict], Dict[str, List[str]]]:
+        """
+        여러 시리즈를 동시에 가져오되 deadline(초) 안에 끝난 것만 기다립니다.
+
+        마감까지 끝나지 않았거나 에러가 난 시리즈는 마지막으로 캐시된 값(stale)으로 대체하고,
+        캐시된 값도 없으면 끝나지 않은 시리즈는 pending, 에러가 난 시리즈는 failed로 표시합니다.
+        끝나지 않은 작업은 백그라운드에서 계속 진행되어 캐시를 채웁니다.
+
+        Args:
+            series_ids: FRED 시리즈 ID 리스트
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            deadline: 최대 대기 시간 (초, None이면 모두 기다림)
+
+        Returns:
+            ({series_id: data}, {"stale": [...], "pending": [...], "failed": [...]})
+        """
+        tasks = {
+            series_id: asyncio.create_task(self.get_series(series_id, start_date, end_date))
+            for series_id in series_ids
+        }
+        _, unfinished = await asyncio.wait(tasks.values(), timeout=deadline)
+
+        results = {}
+        status = {"stale": [], "pending": [], "failed": []}
+        for series_id, task in tasks.items():
+            data = self._task_result(series_id, task)
+            if data is not None and not data.get("error"):
+                results[series_id] = data
+                continue
+
+            fallback = await self.get_stale_series(series_id, start_date, end_date)
+            if fallback is not None:
+                results[series_id] = fallback
+                status["stale"].append(series_id)
+            elif data is not None:
+                # 에러가 났고 대체할 값도 없음
+                results[series_id] = data
+                status["failed"].append(series_id)
+            else:
+                results[series_id] = {"series_id": series_id, "data": [], "count": 0, "pending": True}
+                status["pending"].append(series_id)
+
+        if unfinished:
+            print(f"⏳ 마감 시간 초과, 백그라운드에서 계속 가져옴: {', '.join(s for s, t in tasks.items() if t in unfinished)}")
+            self._finish_in_background(unfinished)
+
+        return results, status
+
+    @staticmethod
+    def _task_result(series_id: str, task: asyncio.Task) -> Optional[Dict]:
+        """
+        끝난 작업의 결과 (끝나지 않았으면 None, 취소되었거나 예외가 났으면 에러 결과)
+        """
+        if not task.done():
+            return None
+        if task.cancelled():
+            error = "요청이 취소되었습니다."
+        elif task.exception() is not None:
+            error = str(task.exception())
+        else:
+            return task.result()
+        print(f"❌ 에러 발생: {error} - {series_id}")
+        return {"series_id": series_id, "data": [], "count": 0, "error": error}
+
+    async def get_stale_series(self, series_id: str, start_date: str, end_date: str) -> Optional[Dict]:
+        """
+        마지막으로 알고 있던 관측값을 반환합니다. (없으면 None)
+        같은 기간의 만료된 캐시 엔트리를 먼저 보고, 없으면 SeriesStore에 누적된 값을 사용합니다.
+        """
+        fetched_at = None
+        entry = await self.cache.get_stale(f"fred:observations:{series_id}:{start_date}:{end_date}")
+        if entry is not None:
+            observations = entry["value"]["observations"]
+            fetched_at = entry["value"]["fetched_at"]
+        else:
+            observations = self.store.get_history(series_id, start_date, end_date)[::-1]
+
+        if not observations:
+            return None
+        return {
+            "series_id": series_id,
+            "data": observations,
+            "count": len(observations),
+            "start_date": start_date,
+            "end_date": end_date,
+            "stale": True,
+            "fetched_at": fetched_at
+        }
+
+    def _finish_in_background(self, tasks) -> None:
+        """
+        남은 작업이 끝날 때까지 기다렸다가, 그사이 close()가 요청되었으면 클라이언트를 종료합니다.
+        """
+        async def finish():
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._background = None
+            if self._close_requested:
+                self._close_requested = False
+                await self.close()
+
+        background = asyncio.create_task(finish())
+        _background_tasks.add(background)
+        background.add_done_callback(_background_tasks.discard)
+        self._background = background
+
+    async def get_series_info(self, series_id: str) -> Optional[Dict]:
+        """
+        시리즈 메타데이터(제목, 주기, 단위, last_updated 등)를 가져옵니다.
+        공유 캐시에 metadata_ttl 동안 보관합니다.
+
+        Args:
+            series_id: FRED 시리즈 ID
+
+        Returns:
+            FRED 시리즈 메타데이터 (없으면 None)
+        """
+        try:
+            return await self.cache.get_or_fetch(
+                f"fred:series_info:{series_id}",
+                lambda: self._fetch_series_info(series_id),
+                ttl=settings.metadata_ttl
+            )
+        except httpx.HTTPStatusError as e:
+            print(f"❌ HTTP 에러: {e.response.status_code} - {series_id} 메타데이터")
+            return None
+        except Exception as e:
+            print(f"❌ 에러 발생: {str(e)} - {series_id} 메타데이터")
+            return None
+
+    @timed("fred")
+    async def _fetch_series_info(self, series_id: str) -> Dict:
+        """
+        FRED API에서 시리즈 메타데이터를 직접 가져옵니다. (캐시 미사용)
+        """
+        params = {
+            "series_id": series_id,
+            "api_key": self.api_key,
+            "file_type": "json"
+        }
+
+        print(f"🌐 FRED 메타데이터 호출: {series_id}")
+        response = await self.client.get(f"{self.base_url}/series", params=params)
+        response.raise_for_status()
+
+        series_list = response.json().get("seriess", [])
+        if not series_list:
+            raise ValueError(f"시리즈를 찾을 수 없습니다: {series_id}")
+        return series_list[0]
+
+    async def get_multiple_series_info(self, series_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        여러 시리즈의 메타데이터를 동시에 가져옵니다.
+
+        Returns:
+            {series_id: 메타데이터} 형태의 딕셔너리
+        """
+        results = await asyncio.gather(*[self.get_series_info(series_id) for series_id in series_ids])
+        return dict(zip(series_ids, results))
+
+    async def get_last_updated(self, series_ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        여러 시리즈의 FRED last_updated를 한 번에 확인합니다. (refresh 전 변경 여부 확인용)
+
+        FRED에는 여러 ID를 한 번에 조회하는 엔드포인트가 없으므로 시리즈별 메타데이터 호출을 동시에 보내고,
+        결과는 공유 캐시에 update_check_ttl 동안 보관해서 워커가 여러 개여도 주기당 한 번만 호출합니다.
+
+        Returns:
+            {series_id: last_updated} (확인 실패 시 None)
+        """
+        async def check(series_id: str) -> Optional[str]:
+            try:
+                return await self.cache.get_or_fetch(
+                    f"fred:last_updated:{series_id}",
+                    lambda: self._fetch_last_updated(series_id),
+                    ttl=settings.update_check_ttl
+                )
+            except Exception as e:
+                print(f"❌ 갱신 시각 확인 에러: {str(e)} - {series_id}")
+                return None
+
+        results = await asyncio.gather(*[check(series_id) for series_id in series_ids])
+        return dict(zip(series_ids, results))
+
+    async def _fetch_last_updated(self, series_id: str) -> str:
+        info = await self._fetch_series_info(series_id)
+        # 같은 응답이므로 메타데이터 캐시도 갱신 (카탈로그 enrich 시 중복 호출 방지)
+        await self.cache.set(f"fred:series_info:{series_id}", info, settings.metadata_ttl)
+        if not info.get("last_updated"):
+            raise ValueError(f"last_updated가 없습니다: {series_id}")
+        return info["last_updated"]
+
     async def get_latest_value(self, series_id: str) -> Optional[Dict]:
         """
         특정 지표의 최신 값을 가져옵니다.
@@ -2,113 +2,139 @@
 Google Gemini AI 서비스
 경제 지표를 분석하고 요약합니다.
 """
-import google.generativeai as genai
+import asyncio
+import json
+import threading
+from functools import lru_cache
 from typing import Dict, List, Optional
 from app.config import get_settings
+from app.services.cache_service import LockTimeout, get_shared_cache
+from app.services.prompt_context import estimate_tokens, get_context_builder
+from app.utils.admission import AdmissionRejected, get_concurrency_limiter
+from app.utils.timing import timed
 
 settings = get_settings()
 
+# 인사이트 배치 잠금 최대 대기 시간 (초, 잠금은 캐시 조회/표시 동안만 보유)
+INSIGHT_LOCK_TIMEOUT = 5.0
+
+# 생성 중이거나 생성에 실패한 인사이트 표시 (insight_failure_ttl 동안 다시 생성하지 않음)
+INSIGHT_UNAVAILABLE = {"unavailable": True}
+
+# 최신 모델 우선 순위 (처음 사용 시 모델 목록에서 앞쪽부터 사용 가능한 모델을 고름)
+MODEL_OPTIONS = [
+    'models/gemini-2.5-flash',  # 최신 (로그에서 확인됨)
+    'models/gemini-2.0-flash-exp',  # 실험 버전
+    'models/gemini-2.0-flash',  # 2.0 버전
+    'models/gemini-1.5-flash',  # 1.5 버전
+    'models/gemini-1.5-pro',
+    'models/gemini-pro',
+    'gemini-2.5-flash',  # models/ 없는 버전도 시도
+    'gemini-2.0-flash',
+    'gemini-1.5-flash',
+    'gemini-pro'
+]
+
+
+@lru_cache()
+def _genai():
+    """
+    google.generativeai 모듈 (import가 무거워서 처음 사용할 때 로드)
+    """
+    import google.generativeai as genai
+    genai.configure(api_key=settings.gemini_api_key)
+    return genai
+
 
 class GeminiService:
     """
     Google Gemini AI 서비스 클래스
+
+    생성 시에는 SDK를 import하거나 네트워크 호출을 하지 않고,
+    첫 생성 요청에서 모델 목록(과금되지 않는 메타데이터 호출)을 한 번 조회해 모델을 고릅니다.
     """
 
     def __init__(self):
-        # Gemini API 설정
-        genai.configure(api_key=settings.gemini_api_key)
-
-        # 사용 가능한 모델 리스트 확인
-        try:
-            available_models = [m.name for m in genai.list_models()
-                                if 'generateContent' in m.supported_generation_methods]
-            print(f"🤖 사용 가능한 Gemini 모델 (generateContent 지원): {available_models[:5]}")
-        except Exception as e:
-            print(f"⚠️ 모델 리스트 확인 실패: {e}")
-            available_models = []
-
-        # 최신 모델 우선 순위로 시도
-        model_options = [
-            'models/gemini-2.5-flash',  # 최신 (로그에서 확인됨)
-            'models/gemini-2.0-flash-exp',  # 실험 버전
-            'models/gemini-2.0-flash',  # 2.0 버전
-            'models/gemini-1.5-flash',  # 1.5 버전
-            'models/gemini-1.5-pro',
-            'models/gemini-pro',
-            'gemini-2.5-flash',  # models/ 없는 버전도 시도
-            'gemini-2.0-flash',
-            'gemini-1.5-flash',
-            'gemini-pro'
-        ]
-
         self.model = None
-        for model_name in model_options:
-            try:
-                print(f"🔍 모델 시도 중: {model_name}")
-                self.model = genai.GenerativeModel(model_name)
-                # 실제로 작동하는지 간단한 테스트
-                test_response = self.model.generate_content("테스트")
-                print(f"✅ 모델 로드 및 테스트 성공: {model_name}")
-                break
-            except Exception as e:
-                print(f"❌ {model_name} 실패: {str(e)[:100]}")
-                continue
-
-        if self.model is None:
+        self.model_name: Optional[str] = None
+        # 여러 스레드가 동시에 모델을 고르지 않도록
+        self._model_lock = threading.Lock()
+        # 스냅샷 버전별 컨텍스트 문자열
+        self._context_cache: Dict = {}
+        # 워커 간 공유 캐시 (빠른 인사이트)
+        self.cache = get_shared_cache()
+
+    def _resolve_model(self):
+        """
+        사용할 모델을 한 번만 고릅니다.
+        프롬프트를 모델마다 보내보는 대신 모델 목록에서 generateContent를 지원하는
+        첫 번째 우선 순위 모델을 선택합니다.
+        """
+        with self._model_lock:
+            if self.model is not None:
+                return self.model
+
+            genai = _genai()
+            available = {
+                model.name
+                for model in genai.list_models()
+                if "generateContent" in getattr(model, "supported_generation_methods", [])
+            }
+            for model_name in MODEL_OPTIONS:
+                full_name = model_name if model_name.startswith("models/") else f"models/{model_name}"
+                if full_name in available:
+                    print(f"✅ 모델 선택: {model_name}")
+                    self.model = genai.GenerativeModel(model_name)
+                    self.model_name = model_name
+                    return self.model
+
             raise Exception("사용 가능한 Gemini 모델을 찾을 수 없습니다.")
 
-    def _prepare_economic_context(self, indicators: Dict) -> str:
-        """
-        경제 지표 데이터를 AI가 이해할 수 있는 형태로 변환
-        """
-        context = "현재 미국 경제 지표:\n\n"
-
-        # 금리
-        if 'interest_rates' in indicators:
-            context += "【금리】\n"
-            for key, data in indicators['interest_rates'].items():
-                context += f"- {data['name']}: {data['value']}% ({data['date']})\n"
-            context += "\n"
-
-        # 물가
-        if 'inflation' in indicators:
-            context += "【물가】\n"
-            for key, data in indicators['inflation'].items():
-                context += f"- {data['name']}: {data['value']} ({data['date']})\n"
-            context += "\n"
-
-        # 고용
-        if 'employment' in indicators:
-            context += "【고용】\n"
-            for key, data in indicators['employment'].items():
-                value_str = f"{data['value']}%" if key == 'UNRATE' else f"{data['value']:,}"
-                context += f"- {data['name']}: {value_str} ({data['date']})\n"
-            context += "\n"
-
-        # GDP
-        if 'gdp' in indicators:
-            context += "【GDP 및 성장】\n"
-            for key, data in indicators['gdp'].items():
-                value_str = f"{data['value']}%" if 'Growth' in data['name'] else f"{data['value']:,}"
-                context += f"- {data['name']}: {value_str} ({data['date']})\n"
-            context += "\n"
-
-        # 경기선행지수
-        if 'leading' in indicators:
-            context += "【경기선행지수】\n"
-            for key, data in indicators['leading'].items():
-                context += f"- {data['name']}: {data['value']} ({data['date']})\n"
-            context += "\n"
+    def _generate(self, prompt: str):
+        """
+        선택된 모델로 콘텐츠를 생성합니다. (실패해도 다른 모델로 다시 보내지 않음)
+        """
+        return self._resolve_model().generate_content(prompt)
+
+    @timed("llm")
+    async def _generate_async(self, prompt: str):
+        """
+        동시 실행 수 제한 안에서 별도 스레드로 생성합니다.
+        (SDK 호출이 블로킹이라 이벤트 루프에서 직접 부르면 다른 요청이 모두 멈춤)
+        """
+        async with get_concurrency_limiter("ai").slot():
+            return await asyncio.to_thread(self._generate, prompt)
+
+    def _prepare_economic_context(self, snapshot: Dict) -> str:
+        """
+        최신 지표 스냅샷을 AI가 이해할 수 있는 형태로 변환
+        시리즈별 요약 특징(변화, 추세, 백분위)으로 압축해서 AI_CONTEXT_TOKEN_BUDGET 안에 맞춥니다.
+        (스냅샷 버전이 같으면 이전에 만든 문자열을 재사용)
+
+        Args:
+            snapshot: IndicatorSnapshot.get() 결과 {version, categories}
+        """
+        version = snapshot.get("version")
+        if version is not None and self._context_cache.get("version") == version:
+            return self._context_cache["context"]
+
+        context = get_context_builder().build(snapshot, settings.ai_context_token_budget)
+        print(f"🧾 AI 컨텍스트 생성: 약 {estimate_tokens(context)} 토큰 (예산 {settings.ai_context_token_budget})")
 
+        if version is not None:
+            self._context_cache = {"version": version, "context": context}
         return context
 
-    async def analyze_economy(self, indicators: Dict) -> Dict:
+    async def analyze_economy(self, snapshot: Dict) -> Dict:
         """
         경제 상황을 종합 분석합니다.
+
+        Args:
+            snapshot: 최신 지표 스냅샷 {version, categories}
         """
         try:
             # 경제 데이터 준비
-            context = self._prepare_economic_context(indicators)
+            context = self._prepare_economic_context(snapshot)
 
             # 👇 2개 섹션만 요청
             prompt = f"""당신은 경제 분석 전문가입니다. 다음 미국 경제 지표를 분석해주세요.
@@ -127,7 +153,7 @@ class GeminiService:
 
             # Gemini API 호출
             print("🤖 Gemini API 호출 중...")
-            response = self.model.generate_content(prompt)
+            response = await self._generate_async(prompt)
 
             # 응답 파싱
             analysis_text = response.text
@@ -185,6 +211,8 @@ class GeminiService:
                 "raw_analysis": analysis_text
             }
 
+        except AdmissionRejected:
+            raise
         except Exception as e:
             print(f"❌ Gemini API 에러: {str(e)}")
             import traceback
@@ -209,16 +237,110 @@ class GeminiService:
             prompt = f"""{indicator_name}가 현재 {current_value}입니다. {change_text}
 이것이 경제에 어떤 의미인지 한 문장으로 간단히 설명해주세요."""
 
-            response = self.model.generate_content(prompt)
+            response = await self._generate_async(prompt)
             return response.text.strip()
 
+        except AdmissionRejected:
+            raise
         except Exception as e:
             print(f"❌ Gemini API 에러: {str(e)}")
             return f"{indicator_name}: {current_value}"
 
+    @staticmethod
+    def _insight_cache_key(series_id: str, data: Dict) -> str:
+        # 값이 바뀌면 키가 달라지므로 이전 인사이트는 자연히 사용되지 않음
+        return f"insight:{series_id}:{data['date']}:{data['value']}:{data.get('previous_value')}"
+
+    async def generate_quick_insights(self, indicators: Dict[str, Dict]) -> Dict[str, str]:
+        """
+        여러 지표의 한 문장 인사이트를 한 번의 LLM 호출로 생성합니다.
+        인사이트는 시리즈 값이 바뀔 때까지 캐시되므로, 바뀐 시리즈만 다시 요청합니다.
+
+        Args:
+            indicators: {series_id: {name, value, date, previous_value}}
+
+        Returns:
+            {series_id: 인사이트 문장}
+        """
+        keys = {series_id: self._insight_cache_key(series_id, data) for series_id, data in indicators.items()}
+
+        async def lookup() -> Dict[str, object]:
+            cached = await asyncio.gather(*[self.cache.get(key) for key in keys.values()])
+            return {series_id: value for series_id, value in zip(keys, cached) if value is not None}
+
+        insights = await lookup()
+        claimed: Dict[str, Dict] = {}
+        if len(insights) < len(indicators):
+            # 잠금은 생성할 시리즈를 표시하는 동안만 보유 (LLM 호출은 잠금 밖에서)
+            # 표시된 시리즈는 다른 요청/워커가 다시 생성하지 않고 값만 보여줌
+            try:
+                async with self.cache.lock("insight:batch", timeout=INSIGHT_LOCK_TIMEOUT):
+                    insights = await lookup()
+                    claimed = {series_id: data for series_id, data in indicators.items() if series_id not in insights}
+                    for series_id in claimed:
+                        await self.cache.set(keys[series_id], INSIGHT_UNAVAILABLE, ttl=settings.insight_failure_ttl)
+            except LockTimeout:
+                print("⚠️ 인사이트 배치 잠금 대기 시간 초과 - 값만 표시")
+
+        if claimed:
+            generated = await self._generate_insight_batch(claimed)
+            for series_id, insight in generated.items():
+                await self.cache.set(keys[series_id], insight, ttl=settings.insight_cache_ttl)
+            insights.update(generated)
+            # 생성에 실패한 시리즈는 표시를 그대로 두어 insight_failure_ttl 동안 다시 요청하지 않음
+            failed = [series_id for series_id in claimed if series_id not in generated]
+            if failed:
+                print(f"⚠️ 인사이트 생성 실패 ({settings.insight_failure_ttl}초 후 재시도): {', '.join(failed)}")
+
+        # 생성 중이거나 실패한 시리즈는 값만 표시
+        return {
+            series_id: insights[series_id] if isinstance(insights.get(series_id), str)
+            else f"{data['name']}: {data['value']}"
+            for series_id, data in indicators.items()
+        }
+
+    async def _generate_insight_batch(self, indicators: Dict[str, Dict]) -> Dict[str, str]:
+        """
+        구조화된 프롬프트 하나로 인사이트를 생성하고 시리즈별로 파싱합니다.
+        """
+        lines = []
+        for series_id, data in indicators.items():
+            line = f"- {series_id} | {data['name']} | 현재 {data['value']} ({data['date']})"
+            if data.get("previous_value") is not None:
+                change = data["value"] - data["previous_value"]
+                line += f" | 이전 {data['previous_value']} ({data['previous_date']}), 변화 {change:+.2f}"
+            lines.append(line)
+
+        prompt = f"""당신은 경제 분석 전문가입니다. 다음 미국 경제 지표 각각에 대해
+경제에 어떤 의미인지 한국어 한 문장으로 간단히 설명해주세요.
+
+{chr(10).join(lines)}
+
+다른 설명 없이 시리즈 ID를 키로 하는 JSON 객체만 출력하세요.
+예: {{"DFF": "한 문장 설명", "UNRATE": "한 문장 설명"}}"""
+
+        try:
+            print(f"🤖 빠른 인사이트 일괄 생성 중... ({len(indicators)}개 지표)")
+            response = await self._generate_async(prompt)
+            text = response.text
+            parsed = json.loads(text[text.index("{"):text.rindex("}") + 1])
+        except AdmissionRejected:
+            raise
+        except Exception as e:
+            print(f"❌ 인사이트 생성/파싱 에러: {str(e)}")
+            return {}
+
+        return {
+            series_id: str(parsed[series_id]).strip()
+            for series_id in indicators
+            if isinstance(parsed.get(series_id), str) and parsed[series_id].strip()
+        }
+
 
+@lru_cache()
 def get_gemini_service() -> GeminiService:
     """
     GeminiService 인스턴스를 반환합니다.
+    프로세스당 하나만 생성해서 선택된 모델을 요청 간에 재사용합니다.
     """
     return GeminiService()
\ No newline at end of file
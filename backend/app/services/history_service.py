@@ -0,0 +1,126 @@
+"""
+히스토리 페이지 서비스
+긴 기간(max, 임의의 start/end)의 시리즈를 커서 페이지 또는 스트림으로 제공합니다.
+
+10년 단위 청크를 최신 청크부터 읽어가며 필요한 만큼만 만들기 때문에
+DFF 일별 데이터(1954년~, 약 25,000개)도 페이지 크기만큼만 메모리에 올립니다.
+커서는 "이 날짜 이전부터 계속"을 담은 불투명 문자열입니다.
+"""
+import base64
+import json
+from datetime import date, timedelta
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from app.services.fred_service import FREDService
+
+# 페이지 크기 기본값 / 최대값 (관측값 또는 리샘플링 버킷 수)
+DEFAULT_PAGE_SIZE = 1000
+MAX_PAGE_SIZE = 10000
+
+
+class CursorError(ValueError):
+    """
+    잘못되었거나 다른 요청의 커서
+    """
+
+
+def encode_cursor(series_id: str, start_date: str, before: str) -> str:
+    """
+    다음 페이지 커서를 만듭니다. (before 날짜보다 이전 관측값부터 계속)
+    """
+    payload = json.dumps({"s": series_id, "st": start_date, "b": before}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, series_id: str, start_date: str) -> str:
+    """
+    커서를 검증하고 before 날짜를 반환합니다.
+
+    Raises:
+        CursorError: 형식이 잘못되었거나 다른 시리즈/시작 날짜로 만든 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        before = payload["b"]
+        date.fromisoformat(before)
+    except (ValueError, KeyError, TypeError):
+        raise CursorError("잘못된 커서입니다.")
+
+    if payload.get("s") != series_id or payload.get("st") != start_date:
+        raise CursorError("다른 요청의 커서입니다. 같은 시리즈와 시작 날짜로 요청해주세요.")
+    return before
+
+
+def day_before(date_str: str) -> str:
+    return (date.fromisoformat(date_str) - timedelta(days=1)).isoformat()
+
+
+async def iter_history(
+        fred_service: FREDService,
+        series_id: str,
+        start_date: str,
+        end_date: Optional[str] = None,
+        freq: Optional[str] = None,
+        agg: str = "last"
+) -> AsyncIterator[List[Dict]]:
+    """
+    관측값을 최신 날짜부터 내림차순 조각으로 만듭니다.
+
+    freq를 지정하면 리샘플링한 버킷을 반환하며, 청크 경계에 걸친 버킷(예: 연말을 넘는 주)은
+    다음 청크까지 모아서 완성된 뒤에 내보냅니다.
+    """
+    if freq is not None:
+        # numpy 기반이라 리샘플링할 때만 로드
+        from app.services.resample_service import resample_observations, to_period_index
+        import numpy as np
+
+    carry: List[Dict] = []
+    async for chunk in fred_service.iter_series_chunks(series_id, start_date, end_date, descending=True):
+        if freq is None:
+            yield chunk
+            continue
+
+        observations = carry + chunk
+        periods = to_period_index(np.array([obs["date"] for obs in observations], dtype="datetime64[D]"), freq)
+        # 내림차순이므로 마지막(가장 오래된) 버킷은 이전 청크에서 이어질 수 있음
+        cut = int(np.searchsorted(-periods, -periods[-1], side="left"))
+        complete, carry = observations[:cut], observations[cut:]
+        if complete:
+            yield resample_observations(complete, freq, agg)
+
+    if carry:
+        yield resample_observations(carry, freq, agg)
+
+
+async def read_page(
+        fred_service: FREDService,
+        series_id: str,
+        start_date: str,
+        end_date: str,
+        limit: int,
+        freq: Optional[str] = None,
+        agg: str = "last"
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    최신 날짜부터 limit개(관측값 또는 버킷)를 읽습니다.
+
+    Returns:
+        (날짜 내림차순 페이지, 다음 페이지의 before 날짜 - 마지막 페이지면 None)
+    """
+    page: List[Dict] = []
+    has_more = False
+
+    history = iter_history(fred_service, series_id, start_date, end_date, freq, agg)
+    try:
+        async for part in history:
+            page.extend(part)
+            if len(page) > limit:
+                has_more = True
+                break
+    finally:
+        await history.aclose()
+
+    page = page[:limit]
+    # 버킷 날짜는 버킷 첫날이므로 그 이전부터 이어 읽으면 버킷이 잘리지 않음
+    return page, (page[-1]["date"] if has_more else None)
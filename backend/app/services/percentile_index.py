@@ -0,0 +1,334 @@
+"""
+히스토리 백분위 인덱스
+최신 값이 과거(10년, 30년, 전체) 대비 어느 수준인지 백분위와 z-score로 계산합니다.
+
+기간별로 값 정렬 배열과 합계/제곱합을 유지하므로
+- 값 하나의 백분위 조회: 이진 탐색 (O(log n))
+- 새 관측값 반영: 정렬 배열 삽입 + 기간을 벗어난 값 제거 (스캔 없음)
+전체 히스토리는 10년 단위 청크(공유 캐시)로 한 번만 읽고, 이후에는 SeriesStore 변경분만 반영합니다.
+"""
+import asyncio
+import time
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from functools import lru_cache
+from math import sqrt
+from typing import Dict, List, Optional, Set
+
+from app.services.fred_service import get_fred_service
+from app.services.series_catalog import get_series_catalog
+from app.services.series_store import SeriesStore, get_series_store
+from app.utils.cache import estimate_size
+from app.utils.date_utils import HISTORY_START
+from app.utils.singleflight import SingleFlight
+
+# 비교 기간 (년, None은 전체 히스토리)
+LOOKBACKS = {
+    "10y": 10,
+    "30y": 30,
+    "full": None
+}
+
+# 로드에 실패했거나 히스토리가 비어 있던 시리즈를 다시 시도하기까지 기다리는 시간 (초)
+LOAD_RETRY_INTERVAL = 600
+
+# 백그라운드 로드 작업 참조 (가비지 컬렉션 방지)
+_background_tasks: Set[asyncio.Task] = set()
+
+
+class LookbackWindow:
+    """
+    기간 하나의 정렬된 값 배열과 합계/제곱합
+    start는 SeriesRankIndex.dates에서 기간이 시작하는 위치입니다.
+    """
+
+    def __init__(self, years: Optional[int]):
+        self.years = years
+        self.start = 0
+        self.sorted_values: List[float] = []
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def add(self, value: float) -> None:
+        insort(self.sorted_values, value)
+        self.total += value
+        self.total_sq += value * value
+
+    def remove(self, value: float) -> None:
+        del self.sorted_values[bisect_left(self.sorted_values, value)]
+        self.total -= value
+        self.total_sq -= value * value
+
+    def rank(self, value: float) -> Optional[Dict]:
+        """
+        value의 백분위(같은 값은 절반만 아래로 계산)와 z-score
+        """
+        n = len(self.sorted_values)
+        if n == 0:
+            return None
+
+        below = bisect_left(self.sorted_values, value)
+        equal = bisect_right(self.sorted_values, value) - below
+        mean = self.total / n
+        variance = max((self.total_sq - self.total * mean) / (n - 1), 0.0) if n > 1 else 0.0
+        std = sqrt(variance)
+
+        return {
+            "percentile": round((below + equal / 2) / n * 100, 1),
+            "z_score": round((value - mean) / std, 2) if std > 0 else None,
+            "mean": round(mean, 4),
+            "std": round(std, 4),
+            "min": self.sorted_values[0],
+            "max": self.sorted_values[-1],
+            "count": n
+        }
+
+
+class SeriesRankIndex:
+    """
+    시리즈 하나의 전체 히스토리와 기간별 정렬 배열
+
+    upsert()로 관측값을 반영하고(새 날짜 삽입 또는 값 수정),
+    최신 값의 기간별 백분위는 값이 바뀔 때만 다시 계산해 둡니다.
+    """
+
+    def __init__(self, series_id: str):
+        self.series_id = series_id
+        self.dates: List[str] = []  # 날짜 오름차순
+        self.values: List[float] = []
+        self.windows = {name: LookbackWindow(years) for name, years in LOOKBACKS.items()}
+        self._context: Optional[Dict] = None
+
+    @property
+    def last_date(self) -> Optional[str]:
+        return self.dates[-1] if self.dates else None
+
+    def upsert(self, points: List[Dict]) -> bool:
+        """
+        관측값을 반영합니다. (대부분 마지막 날짜 뒤에 붙는 append)
+
+        Returns:
+            값이 바뀌었는지 여부
+        """
+        changed = False
+        for point in points:
+            changed = self._upsert(point["date"], point["value"]) or changed
+
+        if changed:
+            self._advance()
+            self._context = self._compute_context()
+        return changed
+
+    def _upsert(self, obs_date: str, value: float) -> bool:
+        i = bisect_left(self.dates, obs_date)
+
+        # 이미 있는 날짜 → 수정된 값만 교체
+        if i < len(self.dates) and self.dates[i] == obs_date:
+            previous = self.values[i]
+            if previous == value:
+                return False
+            self.values[i] = value
+            for window in self.windows.values():
+                if i >= window.start:
+                    window.remove(previous)
+                    window.add(value)
+            return True
+
+        self.dates.insert(i, obs_date)
+        self.values.insert(i, value)
+        for window in self.windows.values():
+            if i < window.start:
+                # 기간 시작 이전 날짜 (기간 밖)
+                window.start += 1
+            else:
+                window.add(value)
+        return True
+
+    def _advance(self) -> None:
+        """
+        최신 날짜 기준 기간을 벗어난 오래된 값을 제거합니다.
+        """
+        latest = date.fromisoformat(self.dates[-1])
+        for window in self.windows.values():
+            if window.years is None:
+                continue
+            try:
+                cutoff = latest.replace(year=latest.year - window.years).isoformat()
+            except ValueError:  # 2월 29일
+                cutoff = latest.replace(year=latest.year - window.years, day=28).isoformat()
+            while window.start < len(self.dates) and self.dates[window.start] < cutoff:
+                window.remove(self.values[window.start])
+                window.start += 1
+
+    def value_at(self, as_of: str) -> Optional[Dict]:
+        """
+        as_of 날짜 이전(포함)의 마지막 관측값
+        """
+        i = bisect_right(self.dates, as_of)
+        return {"date": self.dates[i - 1], "value": self.values[i - 1]} if i else None
+
+    def rank(self, value: float, lookback: str) -> Optional[Dict]:
+        """
+        임의의 값이 기간 히스토리에서 차지하는 위치 (이진 탐색)
+        """
+        window = self.windows[lookback]
+        result = window.rank(value)
+        if result is not None:
+            result["start"] = self.dates[window.start]
+        return result
+
+    def _compute_context(self) -> Dict:
+        value = self.values[-1]
+        return {name: self.rank(value, name) for name in self.windows}
+
+    def context(self) -> Optional[Dict]:
+        """
+        최신 값의 기간별 백분위/z-score (미리 계산된 결과, O(1))
+        """
+        return self._context
+
+
+class PercentileIndexRegistry:
+    """
+    시리즈별 백분위 인덱스 관리자
+
+    - load(): 전체 히스토리를 청크 단위로 한 번 읽어 인덱스 생성
+    - SeriesStore 리스너: 새 관측값/수정된 값만 인덱스에 반영
+    """
+
+    def __init__(self, store: SeriesStore):
+        self.store = store
+        self.catalog = get_series_catalog()
+        self._indexes: Dict[str, SeriesRankIndex] = {}
+        # 로드 실패/빈 히스토리 시리즈 → 실패 시각 (monotonic, LOAD_RETRY_INTERVAL 동안 다시 로드하지 않음)
+        self._failed: Dict[str, float] = {}
+        self._singleflight = SingleFlight()
+        # 인덱스 내용이 바뀔 때마다 증가 (스냅샷 버전 갱신용)
+        self.version = 0
+        store.add_listener(self.on_update)
+
+    def on_update(self, series_id: str, new_points: List[Dict], changed_points: List[Dict]) -> None:
+        """
+        SeriesStore 변경 알림 → 이미 로드한 시리즈에만 변경분 반영
+        """
+        index = self._indexes.get(series_id)
+        if index is None:
+            return
+        if index.upsert(new_points + changed_points):
+            self.version += 1
+
+    async def load(self, fred_service, series_ids: List[str]) -> None:
+        """
+        아직 인덱스가 없는 시리즈의 전체 히스토리를 읽어 인덱스를 만듭니다.
+        (지난 구간 청크는 공유 캐시에 오래 보관되어 다른 워커/재시작 때 재사용)
+        """
+        missing = [series_id for series_id in series_ids if series_id not in self._indexes]
+        # 관측 시작일부터 읽도록 메타데이터가 없는 시리즈는 먼저 가져옴 (HISTORY_START부터의 빈 청크 요청 방지)
+        await self.catalog.enrich(fred_service, [
+            series_id for series_id in missing
+            if not (self.catalog.get(series_id) or {}).get("observation_start")
+        ])
+
+        for series_id in missing:
+            if series_id in self._indexes:
+                continue
+            try:
+                await self._singleflight.do(series_id, lambda: self._load_one(fred_service, series_id))
+            except Exception as e:
+                self._failed[series_id] = time.monotonic()
+                print(f"⚠️ 백분위 인덱스 로드 실패: {str(e)} - {series_id}")
+
+    async def _load_one(self, fred_service, series_id: str) -> None:
+        if series_id in self._indexes:
+            return
+
+        entry = self.catalog.get(series_id) or {}
+        start_date = entry.get("observation_start") or HISTORY_START
+
+        points = []
+        async for chunk in fred_service.iter_series_chunks(series_id, start_date):
+            points.extend(chunk)
+        # 로드하는 동안 저장소에 들어온 최근 값 반영
+        points.extend(self.store.get_history(series_id))
+
+        index = SeriesRankIndex(series_id)
+        index.upsert(points)
+
+        if index.last_date is None:
+            self._failed[series_id] = time.monotonic()
+            print(f"⚠️ 백분위 인덱스 히스토리 없음 ({LOAD_RETRY_INTERVAL}초 후 재시도): {series_id}")
+            return
+        self._failed.pop(series_id, None)
+        self._indexes[series_id] = index
+        self.version += 1
+        print(f"📐 백분위 인덱스 생성: {series_id} ({len(index.dates)}개, {index.dates[0]}~)")
+
+    def ensure_loaded(self, series_ids: List[str]) -> None:
+        """
+        인덱스가 없는 시리즈를 백그라운드에서 로드합니다. (요청은 기다리지 않음)
+        최근에 실패한 시리즈는 LOAD_RETRY_INTERVAL이 지날 때까지 건너뜁니다.
+        """
+        now = time.monotonic()
+        missing = [
+            s for s in series_ids
+            if s not in self._indexes and now - self._failed.get(s, float("-inf")) >= LOAD_RETRY_INTERVAL
+        ]
+        if not missing:
+            return
+
+        async def run():
+            # 요청의 FREDService는 응답 후 닫히므로 별도 인스턴스 사용
+            fred_service = get_fred_service()
+            try:
+                await self.load(fred_service, missing)
+            finally:
+                await fred_service.close()
+
+        task = asyncio.create_task(self._singleflight.do("ensure_loaded", run))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    def memory_usage(self) -> Dict:
+        """
+        인덱스가 차지하는 대략적인 메모리 크기 (시리즈마다 전체 히스토리를 보관하므로 예산 밖에서 보고만 함)
+        """
+        size = 0
+        for index in self._indexes.values():
+            size += estimate_size(index.dates) + estimate_size(index.values)
+            size += sum(estimate_size(window.sorted_values) for window in index.windows.values())
+        return {
+            "series": len(self._indexes),
+            "observations": sum(len(index.dates) for index in self._indexes.values()),
+            "bytes": size,
+            "failed": sorted(self._failed)
+        }
+
+    def context(self, series_id: str, lookback: Optional[str] = None) -> Optional[Dict]:
+        """
+        최신 값의 기간별 백분위/z-score (lookback을 지정하면 그 기간만)
+        """
+        index = self._indexes.get(series_id)
+        if index is None or index.context() is None:
+            return None
+        context = index.context()
+        return {lookback: context[lookback]} if lookback else context
+
+    def rank(self, series_id: str, value: float, lookback: str) -> Optional[Dict]:
+        index = self._indexes.get(series_id)
+        return index.rank(value, lookback) if index else None
+
+    def value_at(self, series_id: str, as_of: str) -> Optional[Dict]:
+        """
+        전체 히스토리에서 as_of 날짜 이전(포함)의 마지막 관측값 (인덱스 로드 전에는 None)
+        """
+        index = self._indexes.get(series_id)
+        return index.value_at(as_of) if index else None
+
+
+@lru_cache()
+def get_percentile_registry() -> PercentileIndexRegistry:
+    """
+    PercentileIndexRegistry 인스턴스를 반환합니다.
+    프로세스당 하나만 생성하며, 생성 시 SeriesStore 리스너로 등록됩니다.
+    """
+    return PercentileIndexRegistry(get_series_store())
@@ -0,0 +1,171 @@
+"""
+요청 프로파일링 서비스
+관리자가 요청한 단일 요청만 프로파일링해서 리포트를 파일로 저장합니다.
+
+- pyinstrument가 설치되어 있으면 async 호출 트리 HTML 리포트 (flame/call tree)
+- 없으면 cProfile 누적 시간 기준 텍스트 리포트
+  (cProfile은 이벤트 루프 스레드 전체를 기록하므로 동시에 처리된 다른 요청도 섞일 수 있음)
+
+리포트는 CACHE_DIR/profiles에 저장되어 어느 워커에서든 조회할 수 있습니다.
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import uuid
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from app.config import get_settings
+from app.services.cache_service import resolve_cache_dir
+
+settings = get_settings()
+
+# 텍스트 리포트에 표시할 함수 수
+PSTATS_LIMIT = 60
+
+# 프로파일러는 워커당 하나만 실행 (cProfile/pyinstrument 모두 동시에 두 개를 켤 수 없음)
+_active_lock = threading.Lock()
+
+
+class ProfilerBusy(RuntimeError):
+    """
+    이 워커에서 이미 다른 요청을 프로파일링 중 (409 응답)
+    """
+
+
+class RequestProfiler:
+    """
+    요청 하나를 프로파일링하는 래퍼 (pyinstrument 우선, 없으면 cProfile)
+    """
+
+    def __init__(self):
+        try:
+            from pyinstrument import Profiler
+            self._profiler = Profiler(async_mode="enabled")
+            self.kind = "pyinstrument"
+        except ImportError:
+            self._profiler = cProfile.Profile()
+            self.kind = "cprofile"
+
+    def start(self) -> None:
+        """
+        Raises:
+            ProfilerBusy: 이 워커에서 다른 요청을 프로파일링 중인 경우
+        """
+        if not _active_lock.acquire(blocking=False):
+            raise ProfilerBusy("다른 요청을 프로파일링 중입니다. 잠시 후 다시 시도하세요.")
+        try:
+            if self.kind == "pyinstrument":
+                self._profiler.start()
+            else:
+                self._profiler.enable()
+        except Exception:
+            _active_lock.release()
+            raise
+
+    def stop(self) -> None:
+        try:
+            if self.kind == "pyinstrument":
+                self._profiler.stop()
+            else:
+                self._profiler.disable()
+        finally:
+            _active_lock.release()
+
+    def render(self) -> str:
+        if self.kind == "pyinstrument":
+            return self._profiler.output_html()
+
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profiler, stream=stream)
+        stats.sort_stats("cumulative").print_stats(PSTATS_LIMIT)
+        stats.sort_stats("cumulative").print_callees(PSTATS_LIMIT // 3)
+        return stream.getvalue()
+
+
+class ProfileStore:
+    """
+    프로파일 리포트 파일 저장소 (최근 profile_keep개만 보관)
+    """
+
+    def __init__(self, directory: str, keep: int):
+        self.directory = directory
+        self.keep = keep
+        os.makedirs(directory, exist_ok=True)
+
+    def save(self, profiler: RequestProfiler, method: str, path: str, status_code: int, total_ms: float) -> str:
+        """
+        리포트와 메타데이터를 저장하고 프로파일 ID를 반환합니다.
+        """
+        profile_id = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        meta = {
+            "id": profile_id,
+            "method": method,
+            "path": path,
+            "status_code": status_code,
+            "total_ms": round(total_ms, 1),
+            "profiler": profiler.kind,
+            "format": "html" if profiler.kind == "pyinstrument" else "text",
+            "created_at": datetime.now().isoformat()
+        }
+
+        with open(self._path(profile_id, "report"), "w", encoding="utf-8") as f:
+            f.write(profiler.render())
+        with open(self._path(profile_id, "json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+        self._prune()
+        return profile_id
+
+    def list(self) -> List[Dict]:
+        """
+        저장된 프로파일 메타데이터 (최신순)
+        """
+        profiles = []
+        for name in sorted(os.listdir(self.directory), reverse=True):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), encoding="utf-8") as f:
+                    profiles.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return profiles
+
+    def get(self, profile_id: str) -> Optional[Dict]:
+        """
+        메타데이터와 리포트 본문을 반환합니다. (없으면 None)
+        """
+        # 경로 조작 방지 (ID는 숫자-16진수 형식만 허용)
+        if not profile_id.replace("-", "").isalnum():
+            return None
+        try:
+            with open(self._path(profile_id, "json"), encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(self._path(profile_id, "report"), encoding="utf-8") as f:
+                return {**meta, "report": f.read()}
+        except (OSError, ValueError):
+            return None
+
+    def _path(self, profile_id: str, extension: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.{extension}")
+
+    def _prune(self) -> None:
+        for meta in self.list()[self.keep:]:
+            for extension in ("json", "report"):
+                try:
+                    os.remove(self._path(meta["id"], extension))
+                except OSError:
+                    pass
+
+
+@lru_cache()
+def get_profile_store() -> ProfileStore:
+    """
+    ProfileStore 인스턴스를 반환합니다.
+    """
+    return ProfileStore(os.path.join(resolve_cache_dir(), "profiles"), settings.profile_keep)
@@ -0,0 +1,236 @@
+"""
+AI 프롬프트 컨텍스트 빌더
+최신 지표 스냅샷을 시리즈별 요약 특징(최신 값, 1개월/12개월 변화, 3/12개월 추세, 10년 백분위)으로
+압축해서 토큰 예산 안의 컨텍스트 문자열로 만듭니다.
+
+원시 히스토리를 넣지 않고 저장소/백분위 인덱스에서 이진 탐색으로 특징만 뽑으므로
+지표 수가 늘어도 프롬프트 크기는 예산을 넘지 않습니다.
+"""
+from datetime import date
+from math import ceil
+from typing import Dict, List, Optional, Tuple
+
+from app.services.percentile_index import PercentileIndexRegistry, get_percentile_registry
+from app.services.series_catalog import get_series_catalog
+from app.services.series_store import SeriesStore, get_series_store
+
+# 프롬프트에 쓰는 카테고리 이름
+CATEGORY_LABELS = {
+    "interest_rates": "금리",
+    "inflation": "물가",
+    "employment": "고용",
+    "gdp": "GDP 및 성장",
+    "leading": "경기선행지수"
+}
+
+# 변화 비교 기간 (개월)
+CHANGE_MONTHS = (1, 3, 12)
+
+# 이 비율(값 대비)보다 작은 변화는 보합으로 표시
+FLAT_RATIO = 0.005
+
+CONTEXT_HEADER = "현재 미국 경제 지표 (1M/12M: 1개월/12개월 전 대비 변화, 추세: 3개월/12개월 방향, 백분위: 최근 10년 중 위치):\n"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 추정 (토크나이저 없이 보수적으로: ASCII 4글자당 1토큰, 한글 등은 글자당 1토큰)
+    """
+    ascii_chars = sum(1 for ch in text if ch.isascii())
+    return ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def is_percent_series(category: str, series_id: str, name: str) -> bool:
+    """
+    값 자체가 %인 시리즈 (변화는 %p로 표시)
+    카탈로그의 FRED 단위(units_short)를 먼저 보고, 메타데이터가 아직 없으면 카테고리/이름으로 추정합니다.
+    """
+    units = ((get_series_catalog().get(series_id) or {}).get("units_short") or "").strip()
+    if units:
+        return "%" in units
+    return category == "interest_rates" or series_id == "UNRATE" or "Growth" in name
+
+
+def format_value(category: str, series_id: str, data: Dict) -> str:
+    """
+    카테고리별 값 표기 (금리/실업률/성장률은 %, 고용·GDP 수준은 천 단위 구분)
+    """
+    value = data["value"]
+    if is_percent_series(category, series_id, data["name"]):
+        return f"{value}%"
+    if category in ("employment", "gdp"):
+        return f"{value:,}"
+    return f"{value}"
+
+
+def months_before(date_str: str, months: int) -> str:
+    d = date.fromisoformat(date_str)
+    year, month = divmod(d.month - 1 - months, 12)
+    year += d.year
+    month += 1
+    # 말일 보정 (예: 3월 31일 → 2월 28일)
+    for day in (d.day, 30, 29, 28):
+        try:
+            return date(year, month, day).isoformat()
+        except ValueError:
+            continue
+    return date(year, month, 28).isoformat()
+
+
+class EconomicContextBuilder:
+    """
+    스냅샷 → 토큰 예산 안의 컨텍스트 문자열
+
+    시리즈마다 전체 줄 → 짧은 줄(최신 값 + 12개월 변화) → 생략 순으로 줄여가며,
+    각 카테고리의 앞쪽(대표) 지표가 가장 오래 남도록 뒤쪽 지표부터 줄입니다.
+    """
+
+    def __init__(self, store: SeriesStore, percentiles: PercentileIndexRegistry):
+        self.store = store
+        self.percentiles = percentiles
+
+    def _value_at(self, series_id: str, as_of: str) -> Optional[Dict]:
+        # 저장소(최근 구간)에 있으면 사용하고, 더 오래된 날짜는 전체 히스토리 인덱스에서 찾음
+        point = self.store.value_at(series_id, as_of)
+        return point if point is not None else self.percentiles.value_at(series_id, as_of)
+
+    def features(self, category: str, series_id: str, data: Dict) -> Dict:
+        """
+        시리즈 하나의 요약 특징 (조회는 모두 이진 탐색)
+        """
+        value = data["value"]
+        percent = is_percent_series(category, series_id, data["name"])
+
+        changes = {}
+        for months in CHANGE_MONTHS:
+            past = self._value_at(series_id, months_before(data["date"], months))
+            if past is None or past["date"] >= data["date"]:
+                changes[months] = None
+                continue
+            diff = value - past["value"]
+            changes[months] = {
+                "diff": diff,
+                "percent": diff / abs(past["value"]) * 100 if past["value"] != 0 else None,
+                "direction": self._direction(diff, value, percent)
+            }
+
+        history = (data.get("history") or {}).get("10y")
+        return {
+            "percent": percent,
+            "changes": changes,
+            "percentile": history["percentile"] if history else None,
+            "z_score": history["z_score"] if history else None
+        }
+
+    @staticmethod
+    def _direction(diff: float, value: float, percent: bool) -> str:
+        # %인 시리즈는 0.05%p, 수준 시리즈는 값의 0.5% 미만 변화를 보합으로 판단
+        tolerance = 0.05 if percent else abs(value) * FLAT_RATIO
+        if abs(diff) < tolerance:
+            return "→"
+        return "↑" if diff > 0 else "↓"
+
+    @staticmethod
+    def _format_change(change: Optional[Dict], percent: bool) -> Optional[str]:
+        if change is None:
+            return None
+        if percent:
+            return f"{change['diff']:+.2f}%p"
+        if change["percent"] is None:
+            return f"{change['diff']:+,.2f}"
+        return f"{change['percent']:+.1f}%"
+
+    def render_line(self, category: str, series_id: str, data: Dict, compact: bool = False) -> str:
+        """
+        시리즈 한 줄 (compact면 최신 값과 12개월 변화만)
+        """
+        features = self.features(category, series_id, data)
+        changes = features["changes"]
+        parts = [f"- {data['name']}: {format_value(category, series_id, data)} ({data['date']})"]
+
+        if compact:
+            yoy = self._format_change(changes[12], features["percent"])
+            if yoy:
+                parts.append(f"12M {yoy}")
+            return " | ".join(parts)
+
+        deltas = [
+            f"{label} {text}"
+            for label, months in (("1M", 1), ("12M", 12))
+            if (text := self._format_change(changes[months], features["percent"]))
+        ]
+        if deltas:
+            parts.append(", ".join(deltas))
+
+        trend = [
+            f"{months}M{changes[months]['direction']}"
+            for months in (3, 12)
+            if changes[months] is not None
+        ]
+        if trend:
+            parts.append(f"추세 {' '.join(trend)}")
+
+        if features["percentile"] is not None:
+            position = f"백분위 {features['percentile']:.0f}"
+            if features["z_score"] is not None:
+                position += f" (z {features['z_score']:+.1f})"
+            parts.append(position)
+
+        return " | ".join(parts)
+
+    def build(self, snapshot: Dict, token_budget: int) -> str:
+        """
+        스냅샷 전체를 token_budget 안의 컨텍스트 문자열로 만듭니다.
+        """
+        # (category, series_id, data, 카테고리 안 순서)
+        entries: List[Tuple[str, str, Dict, int]] = [
+            (category, series_id, data, position)
+            for category, indicators in snapshot["categories"].items()
+            for position, (series_id, data) in enumerate(indicators.items())
+        ]
+        lines = {
+            (category, series_id): self.render_line(category, series_id, data)
+            for category, series_id, data, _ in entries
+        }
+
+        # 줄이는 순서: 카테고리 안 순서가 뒤쪽인 지표부터
+        reduce_order = sorted(range(len(entries)), key=lambda i: (-entries[i][3], -i))
+
+        def render() -> str:
+            context = CONTEXT_HEADER + "\n"
+            dropped = []
+            for category, indicators in snapshot["categories"].items():
+                kept = [lines[(category, s)] for s in indicators if lines.get((category, s))]
+                if not kept:
+                    if indicators:
+                        dropped.append(CATEGORY_LABELS.get(category, category))
+                    continue
+                context += f"【{CATEGORY_LABELS.get(category, category)}】\n" + "\n".join(kept) + "\n"
+                omitted = len(indicators) - len(kept)
+                if omitted:
+                    context += f"(외 {omitted}개 지표 생략)\n"
+                context += "\n"
+            if dropped:
+                context += f"(생략된 카테고리: {', '.join(dropped)})\n"
+            return context
+
+        context = render()
+        for compact in (True, False):
+            for i in reduce_order:
+                if estimate_tokens(context) <= token_budget:
+                    return context
+                category, series_id, data, _ = entries[i]
+                key = (category, series_id)
+                if compact:
+                    lines[key] = self.render_line(category, series_id, data, compact=True)
+                else:
+                    lines[key] = None
+                context = render()
+        return context
+
+
+def get_context_builder() -> EconomicContextBuilder:
+    """
+    EconomicContextBuilder 인스턴스를 반환합니다.
+    """
+    return EconomicContextBuilder(get_series_store(), get_percentile_registry())
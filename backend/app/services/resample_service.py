@@ -0,0 +1,159 @@
+"""
+리샘플링 서비스
+일별/주별/월별/분기별 시리즈를 공통 달력 주기(W/M/Q/A)로 집계합니다.
+날짜를 정수 버킷 번호로 바꾼 뒤 numpy reduceat으로 한 번에 집계합니다.
+(차트 응답 크기 축소, 상관 분석/파생 시리즈의 주기 정렬에 공통 사용)
+"""
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.config import get_settings
+from app.services.series_store import get_series_store
+from app.utils.cache import TTLCache
+from app.utils.timing import timed
+
+settings = get_settings()
+
+# 지원하는 주기
+SUPPORTED_FREQUENCIES = ("W", "M", "Q", "A")
+
+# 지원하는 집계 방식
+SUPPORTED_AGGREGATIONS = ("last", "mean", "sum", "max")
+
+# (시리즈, 기간, 주기, 집계, 데이터 버전) 단위 결과 캐시
+_result_cache = TTLCache(max_entries=512, ttl=settings.cache_ttl, name="derived:resample")
+
+
+def to_period_index(dates: np.ndarray, freq: str) -> np.ndarray:
+    """
+    날짜 배열을 주기별 정수 버킷 번호로 변환합니다.
+
+    Args:
+        dates: datetime64[D] 배열
+        freq: W(주, 월요일 시작), M(월), Q(분기), A(연)
+
+    Returns:
+        int64 버킷 번호 배열
+    """
+    if freq == "W":
+        # 1970-01-01은 목요일 → 3일을 더해 월요일 기준 주 번호
+        return (dates.astype("int64") + 3) // 7
+    if freq == "M":
+        return dates.astype("datetime64[M]").astype("int64")
+    if freq == "Q":
+        return dates.astype("datetime64[M]").astype("int64") // 3
+    if freq == "A":
+        return dates.astype("datetime64[Y]").astype("int64")
+    raise ValueError(f"지원하지 않는 주기입니다: {freq}")
+
+
+def period_start_dates(periods: np.ndarray, freq: str) -> np.ndarray:
+    """
+    버킷 번호를 버킷 첫날(datetime64[D])로 변환합니다. (to_period_index의 역변환)
+    """
+    periods = np.asarray(periods, dtype="int64")
+    if freq == "W":
+        return (periods * 7 - 3).astype("datetime64[D]")
+    if freq == "M":
+        return periods.astype("datetime64[M]").astype("datetime64[D]")
+    if freq == "Q":
+        return (periods * 3).astype("datetime64[M]").astype("datetime64[D]")
+    if freq == "A":
+        return periods.astype("datetime64[Y]").astype("datetime64[D]")
+    raise ValueError(f"지원하지 않는 주기입니다: {freq}")
+
+
+def bucket(dates: np.ndarray, values: np.ndarray, freq: str, agg: str = "last") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    날짜 오름차순 관측값을 주기 버킷별로 집계합니다.
+
+    Returns:
+        (버킷 번호 배열, 집계 값 배열) - 버킷 오름차순
+    """
+    if len(values) == 0:
+        return np.array([], dtype="int64"), values
+
+    periods = to_period_index(dates, freq)
+    # 버킷이 바뀌는 위치 = 각 버킷의 첫 원소
+    starts = np.flatnonzero(np.concatenate(([True], periods[1:] != periods[:-1])))
+
+    if agg == "last":
+        aggregated = values[np.append(starts[1:], len(values)) - 1]
+    elif agg == "sum":
+        aggregated = np.add.reduceat(values, starts)
+    elif agg == "max":
+        aggregated = np.maximum.reduceat(values, starts)
+    elif agg == "mean":
+        aggregated = np.add.reduceat(values, starts) / np.diff(np.append(starts, len(values)))
+    else:
+        raise ValueError(f"지원하지 않는 집계 방식입니다: {agg}")
+
+    return periods[starts], aggregated
+
+
+def resample_arrays(dates: np.ndarray, values: np.ndarray, freq: str, agg: str = "last") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    bucket()과 같지만 버킷 번호 대신 버킷 첫날 날짜를 반환합니다.
+    """
+    periods, aggregated = bucket(dates, values, freq, agg)
+    return period_start_dates(periods, freq), aggregated
+
+
+@timed("transform")
+def resample_observations(observations: List[Dict], freq: str, agg: str = "last") -> List[Dict]:
+    """
+    [{date, value}, ...] (순서 무관) → 버킷 첫날 기준 [{date, value}, ...] 날짜 내림차순
+    """
+    dates = np.array([obs["date"] for obs in observations], dtype="datetime64[D]")
+    values = np.array([obs["value"] for obs in observations], dtype="float64")
+    order = np.argsort(dates, kind="stable")
+
+    bucket_dates, aggregated = resample_arrays(dates[order], values[order], freq, agg)
+    return [
+        {"date": str(date), "value": round(float(value), 4)}
+        for date, value in zip(bucket_dates[::-1], aggregated[::-1])
+    ]
+
+
+def resample_series_data(series_data: Dict, freq: str, agg: str = "last", as_of: Optional[str] = None) -> Dict:
+    """
+    FREDService.get_series() 결과를 리샘플링합니다.
+    (시리즈, 기간, 주기, 집계, 데이터 버전) 단위로 캐시하므로 새 관측값이 없으면 다시 계산하지 않습니다.
+    데이터 버전은 최신 값이면 저장소 버전, as_of(빈티지) 조회면 그 시점에 반영된 마지막 빈티지 날짜입니다.
+    """
+    if not series_data.get("data"):
+        return series_data
+
+    series_id = series_data["series_id"]
+    # 빈티지 값은 SeriesStore가 아니라 빈티지 저장소에서 오므로 저장소 버전과 무관
+    data_version = ("vintage", series_data.get("vintage_date")) if as_of else get_series_store().version(series_id)
+    cache_key = (
+        series_id,
+        series_data.get("start_date"),
+        series_data.get("end_date"),
+        as_of,
+        freq,
+        agg,
+        data_version
+    )
+    # 마감 시간 초과로 대신 반환하는 stale 값은 저장소 버전과 맞지 않으므로 캐시하지 않음
+    if series_data.get("stale"):
+        cache_key = None
+
+    cached = _result_cache.get(cache_key) if cache_key else None
+    if cached is not None:
+        return cached
+
+    data = resample_observations(series_data["data"], freq, agg)
+    result = {
+        **series_data,
+        "data": data,
+        "count": len(data),
+        "native_count": len(series_data["data"]),
+        "freq": freq,
+        "agg": agg
+    }
+    if cache_key:
+        _result_cache.set(cache_key, result)
+    return result
@@ -0,0 +1,263 @@
+"""
+증분 롤링 통계 엔진
+시리즈별로 이동 윈도우 상태(합계, 제곱합, 단조 deque 최솟값/최댓값)와
+최신 변화율을 유지하면서 새 관측값이 들어올 때만 O(새 포인트)로 갱신합니다.
+"""
+from collections import deque
+from datetime import date, timedelta
+from functools import lru_cache
+from math import sqrt
+from typing import Dict, List, Optional, Tuple
+
+from app.services.series_store import SeriesStore, get_series_store
+
+# 기본 이동 윈도우 크기 (관측값 개수)
+DEFAULT_WINDOWS = (3, 12)
+
+# 추세 판단에 사용하는 최근 포인트 수 (DataProcessor.get_trend와 동일)
+TREND_PERIODS = 3
+
+
+class RollingWindow:
+    """
+    고정 크기(관측값 개수) 이동 윈도우
+
+    - 평균/분산: 누적 합계와 제곱합
+    - 최솟값/최댓값: 단조 deque (상각 O(1))
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values: deque = deque()
+        self.total = 0.0
+        self.total_sq = 0.0
+        self._min: deque = deque()  # (index, value) 값 오름차순
+        self._max: deque = deque()  # (index, value) 값 내림차순
+        self._index = 0
+
+    def push(self, value: float) -> None:
+        """
+        새 값을 추가하고 윈도우를 벗어난 값을 제거합니다.
+        """
+        self.values.append(value)
+        self.total += value
+        self.total_sq += value * value
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((self._index, value))
+
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((self._index, value))
+
+        if len(self.values) > self.size:
+            old = self.values.popleft()
+            self.total -= old
+            self.total_sq -= old * old
+
+        # 윈도우 시작 인덱스보다 앞선 후보 제거
+        start = self._index - self.size + 1
+        if self._min[0][0] < start:
+            self._min.popleft()
+        if self._max[0][0] < start:
+            self._max.popleft()
+
+        self._index += 1
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.size
+
+    def stats(self) -> Optional[Dict]:
+        """
+        현재 윈도우 통계를 반환합니다. (윈도우가 다 차지 않았으면 None)
+        """
+        if not self.full:
+            return None
+
+        n = len(self.values)
+        mean = self.total / n
+        variance = max((self.total_sq - self.total * mean) / (n - 1), 0.0) if n > 1 else 0.0
+
+        return {
+            "mean": round(mean, 4),
+            "std": round(sqrt(variance), 4),
+            "min": self._min[0][1],
+            "max": self._max[0][1],
+            "count": n
+        }
+
+
+class SeriesRollingEngine:
+    """
+    시리즈 하나의 롤링 통계 상태
+
+    append()로 오름차순 새 관측값을 넣으면 상태를 갱신하고
+    snapshot()용 결과를 미리 계산해 둡니다.
+    """
+
+    def __init__(self, series_id: str, windows: Tuple[int, ...] = DEFAULT_WINDOWS):
+        self.series_id = series_id
+        self.windows = {size: RollingWindow(size) for size in windows}
+        # 최근 1년 + 1포인트 (YoY 기준점 탐색용)
+        self._year: deque = deque()
+        self._recent: deque = deque(maxlen=TREND_PERIODS)
+        self.last_date: Optional[str] = None
+        self.first_date: Optional[str] = None
+        self._snapshot: Optional[Dict] = None
+
+    def append(self, points: List[Dict]) -> None:
+        """
+        last_date 이후의 새 관측값을 반영합니다. (O(새 포인트))
+
+        Args:
+            points: [{date, value}, ...] 날짜 오름차순
+        """
+        for point in points:
+            if self.last_date is not None and point["date"] <= self.last_date:
+                continue
+
+            value = point["value"]
+            for window in self.windows.values():
+                window.push(value)
+            self._recent.append(point)
+            self._year.append(point)
+            self.last_date = point["date"]
+            if self.first_date is None:
+                self.first_date = point["date"]
+
+        if self.last_date is None:
+            return
+
+        # 1년 전 시점 이전의 포인트는 1개만 남김 (YoY 기준점)
+        cutoff = (date.fromisoformat(self.last_date) - timedelta(days=365)).isoformat()
+        while len(self._year) >= 2 and self._year[1]["date"] <= cutoff:
+            self._year.popleft()
+
+        self._snapshot = self._compute_snapshot(cutoff)
+
+    def _compute_snapshot(self, year_cutoff: str) -> Dict:
+        latest = self._recent[-1]
+
+        change = None
+        if len(self._recent) >= 2:
+            previous = self._recent[-2]
+            diff = latest["value"] - previous["value"]
+            change = {
+                "previous": previous["value"],
+                "previous_date": previous["date"],
+                "change": round(diff, 2),
+                "change_percent": round(diff / previous["value"] * 100, 2) if previous["value"] != 0 else 0
+            }
+
+        yoy = None
+        year_ago = self._year[0]
+        if year_ago["date"] <= year_cutoff:
+            diff = latest["value"] - year_ago["value"]
+            yoy = {
+                "year_ago": year_ago["value"],
+                "year_ago_date": year_ago["date"],
+                "change": round(diff, 2),
+                "change_percent": round(diff / year_ago["value"] * 100, 2) if year_ago["value"] != 0 else 0
+            }
+
+        return {
+            "series_id": self.series_id,
+            "latest": {"date": latest["date"], "value": latest["value"]},
+            "change": change,
+            "yoy": yoy,
+            "trend": self._trend(),
+            "windows": {str(size): window.stats() for size, window in self.windows.items()}
+        }
+
+    def _trend(self) -> str:
+        """
+        최근 TREND_PERIODS개 포인트로 추세 판단 (DataProcessor.get_trend와 같은 규칙)
+        """
+        if len(self._recent) < TREND_PERIODS:
+            return "unknown"
+
+        values = [point["value"] for point in reversed(self._recent)]  # 최신순
+        increases = sum(1 for i in range(len(values) - 1) if values[i] > values[i + 1])
+        decreases = sum(1 for i in range(len(values) - 1) if values[i] < values[i + 1])
+
+        if increases > decreases:
+            return "increasing"
+        elif decreases > increases:
+            return "decreasing"
+        return "stable"
+
+    def snapshot(self) -> Optional[Dict]:
+        """
+        미리 계산된 결과를 반환합니다. (O(1))
+        """
+        return self._snapshot
+
+
+class RollingStatsRegistry:
+    """
+    시리즈별 롤링 엔진 관리자
+    SeriesStore 리스너로 등록되어 refresh 때마다 변경분만 반영합니다.
+    """
+
+    def __init__(self, store: SeriesStore, windows: Tuple[int, ...] = DEFAULT_WINDOWS):
+        self.store = store
+        self.windows = windows
+        self._engines: Dict[str, SeriesRollingEngine] = {}
+        store.add_listener(self.on_update)
+
+    def on_update(self, series_id: str, new_points: List[Dict], changed_points: List[Dict]) -> None:
+        """
+        SeriesStore 변경 알림 처리
+        """
+        engine = self._engines.get(series_id)
+
+        needs_rebuild = (
+            engine is None
+            # 과거 구간 보충 또는 윈도우 안쪽 값 수정 → 최근 구간만 다시 계산
+            or (new_points and engine.last_date and new_points[0]["date"] <= engine.last_date)
+            or any(engine.first_date and point["date"] >= engine.first_date for point in changed_points)
+        )
+
+        if needs_rebuild:
+            self._engines[series_id] = self._build(series_id)
+        else:
+            engine.append(new_points)
+
+    def _build(self, series_id: str) -> SeriesRollingEngine:
+        """
+        저장소의 최근 구간(최대 윈도우 + 1년)으로 엔진을 새로 만듭니다.
+        """
+        engine = SeriesRollingEngine(series_id, self.windows)
+
+        latest = self.store.latest(series_id)
+        if latest is None:
+            return engine
+
+        cutoff = (date.fromisoformat(latest["date"]) - timedelta(days=400)).isoformat()
+        year_points = self.store.get_history(series_id, start_date=cutoff)
+        window_points = self.store.tail(series_id, max(self.windows) + TREND_PERIODS)
+
+        points = window_points if len(window_points) > len(year_points) else year_points
+        engine.append(points)
+        return engine
+
+    def get(self, series_id: str) -> Optional[Dict]:
+        """
+        시리즈의 미리 계산된 롤링 통계를 반환합니다. (O(1))
+        """
+        engine = self._engines.get(series_id)
+        return engine.snapshot() if engine else None
+
+    def series_ids(self) -> List[str]:
+        return list(self._engines.keys())
+
+
+@lru_cache()
+def get_rolling_registry() -> RollingStatsRegistry:
+    """
+    RollingStatsRegistry 인스턴스를 반환합니다.
+    프로세스당 하나만 생성하며, 생성 시 SeriesStore 리스너로 등록됩니다.
+    """
+    return RollingStatsRegistry(get_series_store())
@@ -0,0 +1,63 @@
+"""
+백그라운드 refresh 스케줄러
+주기적으로 모든 지표를 refresh해서 SeriesStore 리스너(롤링 통계, 업데이트 허브)를 갱신합니다.
+"""
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.config import get_settings
+from app.services.alert_service import get_alert_engine
+from app.services.fred_service import get_fred_service
+from app.services.series_catalog import get_series_catalog
+from app.services.snapshot_service import get_indicator_snapshot
+
+settings = get_settings()
+
+scheduler = AsyncIOScheduler()
+
+
+async def refresh_indicators():
+    """
+    카탈로그의 모든 지표의 최근 데이터를 refresh합니다.
+    공유 캐시가 유효하면 FRED 호출 없이 다른 워커가 가져온 데이터를 반영합니다.
+    """
+    catalog = get_series_catalog()
+    fred_service = get_fred_service()
+    try:
+        await catalog.sync()
+        # 다른 워커가 등록한 알림 규칙도 이번 refresh의 새 관측값부터 평가
+        await get_alert_engine().sync()
+        await get_indicator_snapshot().refresh(fred_service, force=True)
+        # 메타데이터가 없는 시리즈(새로 등록 등)는 카탈로그에 채움
+        await catalog.enrich(fred_service)
+    except Exception as e:
+        print(f"❌ refresh 에러: {str(e)}")
+    finally:
+        await fred_service.close()
+
+
+def start_scheduler():
+    """
+    스케줄러를 시작합니다. (refresh_interval이 0이면 비활성화)
+    """
+    if settings.refresh_interval <= 0 or scheduler.running:
+        return
+
+    scheduler.add_job(
+        refresh_indicators,
+        "interval",
+        seconds=settings.refresh_interval,
+        id="refresh_indicators",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True
+    )
+    scheduler.start()
+    print(f"⏰ refresh 스케줄러 시작 (주기: {settings.refresh_interval}초)")
+
+
+def shutdown_scheduler():
+    """
+    스케줄러를 종료합니다.
+    """
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
@@ -0,0 +1,267 @@
+"""
+동적 시리즈 카탈로그
+상수로 정의된 기본 지표 + 런타임에 등록한 시리즈를 관리하고,
+FRED 메타데이터(제목, 주기, 단위, last_updated)를 로컬 인메모리 인덱스로 검색합니다.
+"""
+import re
+import time
+from bisect import bisect_left
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
+
+from app.config import get_settings
+from app.services.cache_service import SharedCache, get_shared_cache
+from app.utils.constants import INDICATOR_CATEGORIES
+
+settings = get_settings()
+
+# 런타임 등록 시리즈를 워커 간 공유하는 캐시 키
+REGISTRY_CACHE_KEY = "catalog:registry"
+
+# 카탈로그 엔트리에 보관하는 FRED 메타데이터 필드
+METADATA_FIELDS = (
+    "title", "frequency", "frequency_short", "units", "units_short",
+    "seasonal_adjustment_short", "last_updated", "observation_start", "observation_end"
+)
+
+_TOKEN_PATTERN = re.compile(r"[0-9a-z]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    검색용 토큰으로 분리합니다. (소문자 영숫자 단위)
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class SeriesCatalog:
+    """
+    시리즈 카탈로그 + 검색 인덱스
+
+    - ID 조회: dict
+    - 키워드 조회: 토큰 → ID 집합 역색인 + 정렬된 토큰 리스트(접두어 검색)
+    - 카테고리 조회: 카테고리 → ID 리스트
+    """
+
+    def __init__(self, cache: SharedCache):
+        self.cache = cache
+        self.version = 0
+        self._entries: Dict[str, Dict] = {}
+        self._registered: Dict[str, Dict] = {}
+        self._tokens: Dict[str, Set[str]] = {}
+        self._sorted_tokens: List[str] = []
+        self._categories: Dict[str, List[str]] = {}
+        self._last_sync = 0.0
+
+        for category, indicators in INDICATOR_CATEGORIES.items():
+            for series_id, name in indicators.items():
+                self._entries[series_id] = {
+                    "series_id": series_id,
+                    "name": name,
+                    "category": category,
+                    "builtin": True
+                }
+        self._rebuild_index()
+
+    # ---------- 인덱스 ----------
+
+    def _rebuild_index(self) -> None:
+        """
+        검색 인덱스를 다시 만듭니다. (등록/메타데이터 변경 시에만 호출)
+        """
+        tokens: Dict[str, Set[str]] = {}
+        categories: Dict[str, List[str]] = {}
+
+        for series_id, entry in self._entries.items():
+            categories.setdefault(entry["category"], []).append(series_id)
+
+            text = " ".join(filter(None, [series_id, entry.get("name"), entry.get("title"), entry["category"]]))
+            for token in tokenize(text):
+                tokens.setdefault(token, set()).add(series_id)
+
+        self._tokens = tokens
+        self._sorted_tokens = sorted(tokens.keys())
+        self._categories = categories
+        self.version += 1
+
+    # ---------- 조회 ----------
+
+    def contains(self, series_id: str) -> bool:
+        return series_id in self._entries
+
+    def get(self, series_id: str) -> Optional[Dict]:
+        return self._entries.get(series_id)
+
+    def name(self, series_id: str) -> str:
+        entry = self._entries.get(series_id)
+        return entry["name"] if entry else series_id
+
+    def category(self, series_id: str) -> Optional[str]:
+        entry = self._entries.get(series_id)
+        return entry["category"] if entry else None
+
+    def categories(self) -> Dict[str, Dict[str, str]]:
+        """
+        {카테고리: {series_id: name}} (INDICATOR_CATEGORIES와 같은 형식)
+        """
+        return {
+            category: {series_id: self._entries[series_id]["name"] for series_id in series_ids}
+            for category, series_ids in self._categories.items()
+        }
+
+    def series_ids(self, category: Optional[str] = None) -> List[str]:
+        if category is None:
+            return list(self._entries.keys())
+        return list(self._categories.get(category, []))
+
+    def entries(self, category: Optional[str] = None) -> List[Dict]:
+        return [self._entries[series_id] for series_id in self.series_ids(category)]
+
+    def search(self, query: str, category: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """
+        ID / 제목 키워드 / 카테고리로 검색합니다.
+        각 토큰은 접두어로 매칭하고, 여러 토큰은 모두 포함하는 시리즈만 반환합니다.
+        """
+        result: Optional[Set[str]] = None
+
+        for token in tokenize(query):
+            matched: Set[str] = set()
+            # 정렬된 토큰 리스트에서 접두어 범위만 탐색
+            pos = bisect_left(self._sorted_tokens, token)
+            while pos < len(self._sorted_tokens) and self._sorted_tokens[pos].startswith(token):
+                matched |= self._tokens[self._sorted_tokens[pos]]
+                pos += 1
+
+            result = matched if result is None else result & matched
+            if not result:
+                return []
+
+        if result is None:
+            result = set(self._entries.keys())
+        if category:
+            result &= set(self._categories.get(category, []))
+
+        query_upper = query.strip().upper()
+        # ID 정확히 일치 → 기본 지표 → ID 순
+        ranked = sorted(result, key=lambda s: (s != query_upper, not self._entries[s].get("builtin"), s))
+        return [self._entries[series_id] for series_id in ranked[:limit]]
+
+    # ---------- 등록 / 동기화 ----------
+
+    async def sync(self, force: bool = False) -> None:
+        """
+        다른 워커가 등록한 시리즈를 공유 캐시에서 반영합니다.
+        (catalog_sync_interval 간격으로만 확인)
+        """
+        now = time.monotonic()
+        if not force and now - self._last_sync < settings.catalog_sync_interval:
+            return
+        self._last_sync = now
+
+        registry = await self.cache.get(REGISTRY_CACHE_KEY) or {}
+        if registry != self._registered:
+            self._apply_registry(registry)
+
+    def _apply_registry(self, registry: Dict[str, Dict]) -> None:
+        # 기존 런타임 등록분 제거 후 다시 반영
+        for series_id in self._registered:
+            if series_id not in registry and not self._entries.get(series_id, {}).get("builtin"):
+                self._entries.pop(series_id, None)
+
+        for series_id, entry in registry.items():
+            if self._entries.get(series_id, {}).get("builtin"):
+                continue
+            self._entries[series_id] = dict(entry)
+
+        self._registered = registry
+        self._rebuild_index()
+
+    async def register(self, series_id: str, category: str, name: Optional[str], metadata: Dict) -> Dict:
+        """
+        시리즈를 런타임에 등록합니다. (재시작/재배포 없이 모든 워커에 반영)
+
+        Args:
+            series_id: FRED 시리즈 ID
+            category: 카테고리 (기존 또는 새 카테고리)
+            name: 표시 이름 (없으면 FRED 제목)
+            metadata: FRED 시리즈 메타데이터
+
+        Returns:
+            등록된 카탈로그 엔트리
+
+        Raises:
+            ValueError: 등록 시리즈 수가 catalog_max_registered를 넘는 경우
+        """
+        entry = {
+            "series_id": series_id,
+            "name": name or metadata.get("title", series_id),
+            "category": category,
+            "builtin": False,
+            "registered_at": datetime.now().isoformat(),
+            **{field: metadata.get(field) for field in METADATA_FIELDS}
+        }
+
+        async with self.cache.lock(REGISTRY_CACHE_KEY):
+            registry = dict(await self.cache.get(REGISTRY_CACHE_KEY) or {})
+            if series_id not in registry and len(registry) >= settings.catalog_max_registered:
+                raise ValueError(f"런타임 등록 시리즈는 최대 {settings.catalog_max_registered}개까지 등록할 수 있습니다.")
+            registry[series_id] = entry
+            await self.cache.set_durable(REGISTRY_CACHE_KEY, registry)
+
+        self._apply_registry(registry)
+        return entry
+
+    async def unregister(self, series_id: str) -> bool:
+        """
+        런타임 등록 시리즈를 제거합니다. (기본 지표는 제거 불가)
+        """
+        async with self.cache.lock(REGISTRY_CACHE_KEY):
+            registry = dict(await self.cache.get(REGISTRY_CACHE_KEY) or {})
+            if series_id not in registry:
+                return False
+            del registry[series_id]
+            await self.cache.set_durable(REGISTRY_CACHE_KEY, registry)
+
+        self._apply_registry(registry)
+        return True
+
+    def update_metadata(self, metadata_by_id: Dict[str, Dict]) -> None:
+        """
+        FRED 메타데이터를 엔트리에 반영합니다. (제목이 바뀐 경우에만 인덱스 재구성)
+
+        Args:
+            metadata_by_id: {series_id: FRED 시리즈 메타데이터}
+        """
+        title_changed = False
+        for series_id, metadata in metadata_by_id.items():
+            entry = self._entries.get(series_id)
+            if entry is None or not metadata:
+                continue
+            title_changed |= entry.get("title") != metadata.get("title")
+            entry.update({field: metadata.get(field) for field in METADATA_FIELDS})
+
+        if title_changed:
+            self._rebuild_index()
+
+    async def enrich(self, fred_service, series_ids: Optional[List[str]] = None) -> None:
+        """
+        메타데이터가 없는 시리즈의 FRED 메타데이터를 가져와 반영합니다.
+        (메타데이터는 공유 캐시에 저장되므로 워커 간 중복 호출 없음)
+        """
+        series_ids = series_ids if series_ids is not None else self.missing_metadata()
+        if not series_ids:
+            return
+        self.update_metadata(await fred_service.get_multiple_series_info(series_ids))
+
+    def missing_metadata(self) -> List[str]:
+        return [series_id for series_id, entry in self._entries.items() if not entry.get("last_updated")]
+
+
+@lru_cache()
+def get_series_catalog() -> SeriesCatalog:
+    """
+    SeriesCatalog 인스턴스를 반환합니다.
+    프로세스당 하나만 생성해서 재사용합니다.
+    """
+    return SeriesCatalog(get_shared_cache())
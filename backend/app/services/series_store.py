@@ -0,0 +1,175 @@
+"""
+시리즈 저장소
+FRED에서 가져온 관측값을 프로세스 내부에 누적하고,
+새로 추가되거나 수정된 관측값만 리스너에게 알려줍니다.
+"""
+import heapq
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+
+from app.utils.cache import TTLCache, estimate_size
+
+# 리스너 시그니처: (series_id, 새 관측값 리스트(오름차순), 수정된 관측값 리스트)
+UpdateListener = Callable[[str, List[Dict], List[Dict]], None]
+
+
+class SeriesStore:
+    """
+    시리즈별 관측값 저장소
+
+    refresh 경로(FREDService.get_series)가 가져온 관측값을 ingest()로 넘기면
+    기존 값과 비교해서 변경분(delta)만 계산하고 리스너에게 전달합니다.
+    """
+
+    def __init__(self):
+        self._values: Dict[str, Dict[str, float]] = {}  # series_id -> {date: value}
+        self._dates: Dict[str, List[str]] = {}  # series_id -> 날짜 오름차순
+        self._versions: Dict[str, int] = {}
+        self._listeners: List[UpdateListener] = []
+        # 같은 캐시 엔트리를 반복해서 비교하지 않도록 처리한 소스 기록
+        self._seen_sources = TTLCache(max_entries=1024, ttl=86400, name="store:sources")
+
+    def add_listener(self, listener: UpdateListener) -> None:
+        """
+        변경분을 받을 리스너를 등록합니다.
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def ingest(
+            self,
+            series_id: str,
+            observations: List[Dict],
+            source: Optional[str] = None
+    ) -> Dict[str, List[Dict]]:
+        """
+        관측값을 저장소에 반영합니다.
+
+        Args:
+            series_id: FRED 시리즈 ID
+            observations: [{date, value}, ...] (정렬 순서 무관)
+            source: 관측값 출처 식별자 (이미 반영한 출처면 비교를 건너뜀)
+
+        Returns:
+            {"new": [...], "changed": [...]} - 날짜 오름차순
+        """
+        if source is not None:
+            if self._seen_sources.get(source):
+                return {"new": [], "changed": []}
+            self._seen_sources.set(source, True)
+
+        values = self._values.setdefault(series_id, {})
+        dates = self._dates.setdefault(series_id, [])
+
+        new_points = []
+        changed_points = []
+        for obs in observations:
+            previous = values.get(obs["date"])
+            if previous is None:
+                new_points.append(obs)
+            elif previous != obs["value"]:
+                changed_points.append(obs)
+            values[obs["date"]] = obs["value"]
+
+        if not new_points and not changed_points:
+            return {"new": [], "changed": []}
+
+        new_points.sort(key=lambda obs: obs["date"])
+        changed_points.sort(key=lambda obs: obs["date"])
+
+        # 대부분 최신 날짜 뒤에 붙는 append → 그 외(과거 구간 보충)에만 병합
+        if new_points:
+            new_dates = [obs["date"] for obs in new_points]
+            if not dates or new_dates[0] > dates[-1]:
+                dates.extend(new_dates)
+            else:
+                dates[:] = list(heapq.merge(dates, new_dates))
+
+        self._versions[series_id] = self._versions.get(series_id, 0) + 1
+
+        for listener in self._listeners:
+            try:
+                listener(series_id, new_points, changed_points)
+            except Exception as e:
+                print(f"❌ 시리즈 리스너 에러: {str(e)} - {series_id}")
+
+        return {"new": new_points, "changed": changed_points}
+
+    def version(self, series_id: str) -> int:
+        """
+        시리즈 데이터 버전 (변경분이 반영될 때마다 1씩 증가)
+        """
+        return self._versions.get(series_id, 0)
+
+    def series_ids(self) -> List[str]:
+        return list(self._dates.keys())
+
+    def latest(self, series_id: str) -> Optional[Dict]:
+        """
+        최신 관측값을 반환합니다.
+        """
+        dates = self._dates.get(series_id)
+        if not dates:
+            return None
+        return {"date": dates[-1], "value": self._values[series_id][dates[-1]]}
+
+    def get_history(
+            self,
+            series_id: str,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        저장된 관측값을 날짜 오름차순으로 반환합니다.
+
+        Args:
+            series_id: FRED 시리즈 ID
+            start_date: 시작 날짜 (포함)
+            end_date: 종료 날짜 (포함)
+        """
+        dates = self._dates.get(series_id, [])
+        values = self._values.get(series_id, {})
+
+        lo = bisect_left(dates, start_date) if start_date else 0
+        hi = bisect_right(dates, end_date) if end_date else len(dates)
+
+        return [{"date": date, "value": values[date]} for date in dates[lo:hi]]
+
+    def value_at(self, series_id: str, as_of: str) -> Optional[Dict]:
+        """
+        as_of 날짜 이전(포함)의 마지막 관측값을 반환합니다. (저장된 구간 밖이면 None)
+        """
+        dates = self._dates.get(series_id, [])
+        i = bisect_right(dates, as_of)
+        if i == 0:
+            return None
+        return {"date": dates[i - 1], "value": self._values[series_id][dates[i - 1]]}
+
+    def tail(self, series_id: str, count: int) -> List[Dict]:
+        """
+        최근 count개의 관측값을 날짜 오름차순으로 반환합니다.
+        """
+        dates = self._dates.get(series_id, [])
+        values = self._values.get(series_id, {})
+        return [{"date": date, "value": values[date]} for date in dates[-count:]] if count > 0 else []
+
+    def memory_usage(self) -> Dict:
+        """
+        저장소가 차지하는 대략적인 메모리 크기
+        리스너가 전체 히스토리에 의존하므로 캐시 예산으로 제거하지 않고 보고만 합니다.
+        """
+        return {
+            "series": len(self._dates),
+            "observations": sum(len(dates) for dates in self._dates.values()),
+            "bytes": estimate_size(self._values) + estimate_size(self._dates)
+        }
+
+
+@lru_cache()
+def get_series_store() -> SeriesStore:
+    """
+    SeriesStore 인스턴스를 반환합니다.
+    프로세스당 하나만 생성해서 재사용합니다.
+    """
+    return SeriesStore()
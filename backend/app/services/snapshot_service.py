@@ -0,0 +1,185 @@
+"""
+최신 지표 스냅샷 서비스
+모든 지표의 최신 값 테이블을 한 곳에서 관리합니다.
+SeriesStore 리스너로 갱신되며, 버전은 테이블 내용의 해시라서
+같은 데이터면 어느 워커에서든 같은 버전이고 값이 바뀌면 버전도 바뀝니다.
+(/summary, /analysis/generate, GeminiService가 같은 스냅샷을 사용)
+"""
+import hashlib
+import json
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from app.config import get_settings
+from app.services.percentile_index import get_percentile_registry
+from app.services.series_catalog import get_series_catalog
+from app.services.series_store import get_series_store
+from app.utils.singleflight import SingleFlight
+
+settings = get_settings()
+
+
+def content_version(table: Dict) -> str:
+    """
+    최신 값 테이블의 내용 해시 (워커/재시작과 무관하게 같은 데이터면 같은 값)
+    """
+    payload = json.dumps(table, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class IndicatorSnapshot:
+    """
+    시리즈별 최신 값 테이블
+
+    - 백그라운드 refresh(또는 다른 요청)가 SeriesStore에 반영하면 리스너로 갱신
+    - 비어 있거나 오래된 경우에만 refresh 한 번 (동시 요청은 SingleFlight로 합침)
+    """
+
+    def __init__(self):
+        self.catalog = get_series_catalog()
+        self.store = get_series_store()
+        self.percentiles = get_percentile_registry()
+        self._latest: Dict[str, List[Dict]] = {}
+        # 내용 해시 (변경 후 처음 조회할 때 계산)
+        self._version: Optional[str] = None
+        self._updated_at: Optional[str] = None
+        self._refreshed_at: Optional[float] = None
+        self._catalog_version = None
+        self._percentile_version = self.percentiles.version
+        # 마지막으로 반영한 FRED last_updated (refresh 때 바뀐 시리즈만 다시 가져오기 위함)
+        self._upstream_updated: Dict[str, str] = {}
+        self._singleflight = SingleFlight()
+
+        # 이미 저장소에 있는 값으로 시작
+        for series_id in self.store.series_ids():
+            self._latest[series_id] = self.store.tail(series_id, 2)
+        self.store.add_listener(self.on_update)
+
+    @property
+    def version(self) -> str:
+        if self._version is None:
+            self._version = content_version(self.categories())
+        return self._version
+
+    def on_update(self, series_id: str, new_points: List[Dict], changed_points: List[Dict]) -> None:
+        """
+        SeriesStore 변경 알림 → 최신 값(또는 직전 값)이 바뀐 경우에만 버전 갱신
+        """
+        points = self.store.tail(series_id, 2)
+        if not points or self._latest.get(series_id) == points:
+            return
+        self._latest[series_id] = points
+        self._bump()
+
+    def _bump(self) -> None:
+        self._version = None
+        self._updated_at = datetime.now().isoformat()
+
+    def _is_stale(self) -> bool:
+        # 백그라운드 refresh가 꺼져 있어도 캐시 TTL보다 오래된 값은 다시 확인
+        return self._refreshed_at is None or time.monotonic() - self._refreshed_at > settings.cache_ttl
+
+    async def refresh(self, fred_service, force: bool = False) -> None:
+        """
+        스냅샷에 없는 시리즈(또는 오래된 경우 전체)를 가져옵니다.
+        공유 캐시를 거치므로 다른 워커가 이미 가져왔다면 FRED 호출은 없습니다.
+
+        먼저 FRED last_updated를 한 번에 확인해서, 마지막 반영 이후 갱신 시각이 바뀐 시리즈만
+        관측값을 가져옵니다. (월별/분기별 지표가 대부분이라 보통 몇 개만 다시 받음)
+        """
+        async def run():
+            if force or self._is_stale():
+                targets = self.catalog.series_ids()
+            else:
+                targets = [s for s in self.catalog.series_ids() if s not in self._latest]
+
+            if targets:
+                upstream = await fred_service.get_last_updated(targets)
+                changed = [
+                    series_id for series_id in targets
+                    if series_id not in self._latest
+                    or upstream[series_id] is None
+                    or upstream[series_id] != self._upstream_updated.get(series_id)
+                ]
+                print(f"🔎 refresh 대상: {len(changed)}/{len(targets)}개 시리즈 (FRED last_updated 기준)")
+
+                if changed:
+                    results = await fred_service.get_multiple_series(changed, upstream_updated=upstream)
+                    for series_id in changed:
+                        # 가져오기에 실패한 시리즈는 다음 refresh에서 다시 시도
+                        if upstream[series_id] and not results[series_id].get("error"):
+                            self._upstream_updated[series_id] = upstream[series_id]
+
+            self._refreshed_at = time.monotonic()
+
+        await self._singleflight.do("refresh", run)
+
+    async def get(self, fred_service, lookback: Optional[str] = None) -> Dict:
+        """
+        현재 스냅샷을 반환합니다. (필요할 때만 refresh)
+
+        Args:
+            fred_service: FREDService 인스턴스
+            lookback: 백분위 비교 기간 (10y, 30y, full - 없으면 모두)
+
+        Returns:
+            {
+                "version": 스냅샷 버전 (내용 해시),
+                "updated_at": 마지막 변경 시각,
+                "categories": {category: {series_id: {name, value, date, previous_value, previous_date, history}}}
+            }
+        """
+        await self.catalog.sync()
+
+        # 새로 등록된 시리즈가 있으면 채워넣음
+        catalog_changed = self._catalog_version != self.catalog.version
+        if catalog_changed or self._is_stale():
+            await self.refresh(fred_service)
+            if catalog_changed:
+                self._catalog_version = self.catalog.version
+                self._bump()
+
+        # 히스토리 백분위 인덱스는 백그라운드에서 로드 (로드되면 버전 증가)
+        self.percentiles.ensure_loaded(self.catalog.series_ids())
+        if self._percentile_version != self.percentiles.version:
+            self._percentile_version = self.percentiles.version
+            self._bump()
+
+        return {
+            "version": self.version,
+            "updated_at": self._updated_at,
+            "categories": self.categories(lookback)
+        }
+
+    def categories(self, lookback: Optional[str] = None) -> Dict[str, Dict[str, Dict]]:
+        """
+        카탈로그 카테고리 구조에 맞춘 최신 값 테이블
+        history: 최신 값의 기간별 백분위/z-score (인덱스 로드 전에는 None)
+        """
+        result = {}
+        for category, series_dict in self.catalog.categories().items():
+            result[category] = {}
+            for series_id, name in series_dict.items():
+                points = self._latest.get(series_id)
+                if points:
+                    previous = points[0] if len(points) > 1 else None
+                    result[category][series_id] = {
+                        "name": name,
+                        "value": points[-1]["value"],
+                        "date": points[-1]["date"],
+                        "previous_value": previous["value"] if previous else None,
+                        "previous_date": previous["date"] if previous else None,
+                        "history": self.percentiles.context(series_id, lookback)
+                    }
+        return result
+
+
+@lru_cache()
+def get_indicator_snapshot() -> IndicatorSnapshot:
+    """
+    IndicatorSnapshot 인스턴스를 반환합니다.
+    프로세스당 하나만 생성하며, 생성 시 SeriesStore 리스너로 등록됩니다.
+    """
+    return IndicatorSnapshot()
@@ -0,0 +1,122 @@
+"""
+실시간 업데이트 허브
+SeriesStore 변경분을 구독 중인 클라이언트(SSE/WebSocket)에게 전달합니다.
+"""
+import asyncio
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set
+
+from app.services.rolling_stats import get_rolling_registry
+from app.services.series_catalog import get_series_catalog
+from app.services.series_store import get_series_store
+
+# 구독자별 대기 메시지 최대 개수 (넘치면 resync 요청)
+SUBSCRIPTION_QUEUE_SIZE = 256
+
+
+def resolve_series_ids(
+        series: Optional[Iterable[str]] = None,
+        categories: Optional[Iterable[str]] = None
+) -> Set[str]:
+    """
+    구독 대상 시리즈 ID 집합을 만듭니다. (둘 다 없으면 전체)
+    """
+    catalog = get_series_catalog()
+
+    series_ids = {s.upper() for s in series or [] if catalog.contains(s.upper())}
+    for category in categories or []:
+        series_ids.update(catalog.series_ids(category))
+
+    if not series and not categories:
+        return set(catalog.series_ids())
+    return series_ids
+
+
+class Subscription:
+    """
+    클라이언트 한 명의 구독 정보와 메시지 큐
+    """
+
+    def __init__(self, series_ids: Set[str]):
+        self.series_ids = series_ids
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIPTION_QUEUE_SIZE)
+
+    def push(self, message: Dict) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # 클라이언트가 너무 느림 → 쌓인 메시지를 버리고 전체 재조회 요청
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": "resync"})
+
+
+class UpdateHub:
+    """
+    구독 관리 및 변경분 브로드캐스트
+    """
+
+    def __init__(self):
+        self._subscriptions: List[Subscription] = []
+        self.registry = get_rolling_registry()
+        self.catalog = get_series_catalog()
+        get_series_store().add_listener(self.on_update)
+
+    def subscribe(self, series_ids: Set[str]) -> Subscription:
+        subscription = Subscription(series_ids)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def summary(self, series_id: str) -> Optional[Dict]:
+        """
+        시리즈의 요약 정보 (롤링 엔진의 최신 값/변화)
+        """
+        stats = self.registry.get(series_id)
+        if stats is None:
+            return None
+        return {
+            "name": self.catalog.name(series_id),
+            "category": self.catalog.category(series_id),
+            "value": stats["latest"]["value"],
+            "date": stats["latest"]["date"],
+            "change": stats["change"],
+            "trend": stats["trend"]
+        }
+
+    def on_update(self, series_id: str, new_points: List[Dict], changed_points: List[Dict]) -> None:
+        """
+        SeriesStore 변경 알림 → 해당 시리즈 구독자에게만 변경분 전달
+        """
+        targets = [s for s in self._subscriptions if series_id in s.series_ids]
+        if not targets:
+            return
+
+        message = {
+            "type": "update",
+            "series_id": series_id,
+            "category": self.catalog.category(series_id),
+            "new": new_points,
+            "changed": changed_points,
+            "summary": self.summary(series_id),
+            "sent_at": datetime.now().isoformat()
+        }
+        for subscription in targets:
+            subscription.push(message)
+
+
+@lru_cache()
+def get_update_hub() -> UpdateHub:
+    """
+    UpdateHub 인스턴스를 반환합니다.
+    프로세스당 하나만 생성하며, 생성 시 SeriesStore 리스너로 등록됩니다.
+    """
+    return UpdateHub()
@@ -0,0 +1,231 @@
+"""
+빈티지(ALFRED real-time) 저장소
+발표 이후 수정(revision)되는 시리즈의 과거 빈티지를 델타 형태로 저장하고,
+"D 시점에 알려진 X의 값"을 upstream 호출 없이 조회합니다.
+
+저장 형식 (시리즈당 JSON 파일 1개):
+    {
+        "series_id": "PAYEMS",
+        "synced_through": "2024-12-06",          # 이 날짜까지의 빈티지를 모두 반영
+        "vintages": ["2019-01-04", ...],         # 빈티지 날짜 (오름차순, 중복 없음)
+        "observations": {
+            "2018-12-01": [[0, 150123.0], [3, 150180.0]]   # [빈티지 인덱스, 값] - 값이 바뀐 빈티지만 저장
+        }
+    }
+"""
+import json
+import os
+import tempfile
+from bisect import bisect_left, bisect_right, insort
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from app.config import get_settings
+from app.services.cache_service import resolve_cache_dir
+
+settings = get_settings()
+
+# ALFRED 최초 real-time 날짜
+EARLIEST_REALTIME = "1776-07-04"
+
+
+class SeriesVintages:
+    """
+    시리즈 하나의 빈티지 인덱스
+
+    관측 날짜마다 (빈티지 날짜 리스트, 값 리스트)를 유지하며
+    직전 빈티지와 값이 다를 때만 새 항목을 추가합니다. (델타 저장)
+    """
+
+    def __init__(self, series_id: str):
+        self.series_id = series_id
+        self.synced_through: Optional[str] = None
+        self.vintage_dates: List[str] = []
+        # 관측 날짜 → ([빈티지 날짜...], [값...])  (None은 해당 빈티지에서 삭제됨)
+        self.revisions: Dict[str, tuple] = {}
+        self.obs_dates: List[str] = []
+
+    def add(self, obs_date: str, vintage_date: str, value: Optional[float]) -> bool:
+        """
+        관측값 한 건을 반영합니다.
+
+        Returns:
+            새 델타가 저장되었는지 여부
+        """
+        history = self.revisions.get(obs_date)
+        if history is None:
+            if value is None:
+                return False
+            self.revisions[obs_date] = ([vintage_date], [value])
+            insort(self.obs_dates, obs_date)
+        else:
+            dates, values = history
+            pos = bisect_right(dates, vintage_date)
+            # 직전 빈티지와 같은 값이면 저장하지 않음
+            if pos > 0 and values[pos - 1] == value:
+                return False
+            if pos > 0 and dates[pos - 1] == vintage_date:
+                values[pos - 1] = value
+            else:
+                dates.insert(pos, vintage_date)
+                values.insert(pos, value)
+
+        pos = bisect_left(self.vintage_dates, vintage_date)
+        if pos == len(self.vintage_dates) or self.vintage_dates[pos] != vintage_date:
+            self.vintage_dates.insert(pos, vintage_date)
+        return True
+
+    def value_as_of(self, obs_date: str, as_of: str) -> Optional[float]:
+        """
+        as_of 시점에 알려진 obs_date의 값 (이진 탐색)
+        """
+        history = self.revisions.get(obs_date)
+        if history is None:
+            return None
+        dates, values = history
+        pos = bisect_right(dates, as_of)
+        return values[pos - 1] if pos > 0 else None
+
+    def vintage_as_of(self, as_of: str) -> Optional[str]:
+        """
+        as_of 시점에 반영된 마지막 빈티지 날짜 (as_of 조회 결과의 버전)
+        """
+        pos = bisect_right(self.vintage_dates, as_of)
+        return self.vintage_dates[pos - 1] if pos > 0 else None
+
+    def series_as_of(
+            self,
+            as_of: str,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        as_of 시점에 알려진 관측값 목록 (날짜 내림차순, get_series와 동일)
+        """
+        lo = bisect_left(self.obs_dates, start_date) if start_date else 0
+        hi = bisect_right(self.obs_dates, end_date) if end_date else len(self.obs_dates)
+
+        result = []
+        for obs_date in reversed(self.obs_dates[lo:hi]):
+            # 관측 날짜 이전의 빈티지에는 존재할 수 없음
+            if obs_date > as_of:
+                continue
+            value = self.value_as_of(obs_date, as_of)
+            if value is not None:
+                result.append({"date": obs_date, "value": value})
+        return result
+
+    def revision_history(self, obs_date: str) -> List[Dict]:
+        """
+        관측 날짜 하나의 수정 이력
+        """
+        dates, values = self.revisions.get(obs_date, ([], []))
+        return [{"vintage_date": d, "value": v} for d, v in zip(dates, values)]
+
+    def to_dict(self) -> Dict:
+        index = {date: i for i, date in enumerate(self.vintage_dates)}
+        return {
+            "series_id": self.series_id,
+            "synced_through": self.synced_through,
+            "vintages": self.vintage_dates,
+            "observations": {
+                obs_date: [[index[d], v] for d, v in zip(*self.revisions[obs_date])]
+                for obs_date in self.obs_dates
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SeriesVintages":
+        vintages = cls(data["series_id"])
+        vintages.synced_through = data.get("synced_through")
+        vintages.vintage_dates = data.get("vintages", [])
+        for obs_date, deltas in data.get("observations", {}).items():
+            vintages.revisions[obs_date] = (
+                [vintages.vintage_dates[i] for i, _ in deltas],
+                [v for _, v in deltas]
+            )
+        vintages.obs_dates = sorted(vintages.revisions.keys())
+        return vintages
+
+
+class VintageStore:
+    """
+    빈티지 저장소 (디스크 영속화 + 메모리 인덱스)
+    파일은 os.replace로 원자적으로 교체하므로 여러 워커가 함께 읽을 수 있습니다.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._series: Dict[str, SeriesVintages] = {}
+        self._mtimes: Dict[str, float] = {}
+
+    def _path(self, series_id: str) -> str:
+        return os.path.join(self.directory, f"{series_id}.json")
+
+    def load(self, series_id: str) -> SeriesVintages:
+        """
+        메모리 인덱스를 반환합니다. 다른 워커가 파일을 갱신했으면 다시 읽습니다.
+        """
+        path = self._path(series_id)
+        try:
+            mtime = os.path.getmtime(path)
+        except FileNotFoundError:
+            return self._series.setdefault(series_id, SeriesVintages(series_id))
+
+        if series_id not in self._series or self._mtimes.get(series_id) != mtime:
+            with open(path, "r", encoding="utf-8") as f:
+                self._series[series_id] = SeriesVintages.from_dict(json.load(f))
+            self._mtimes[series_id] = mtime
+
+        return self._series[series_id]
+
+    def save(self, series_id: str) -> None:
+        """
+        시리즈 빈티지를 디스크에 저장합니다.
+        """
+        vintages = self._series[series_id]
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(vintages.to_dict(), f, separators=(",", ":"))
+            os.replace(tmp_path, self._path(series_id))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._mtimes[series_id] = os.path.getmtime(self._path(series_id))
+
+    def ingest_realtime_rows(self, series_id: str, rows: List[Dict], synced_through: str) -> int:
+        """
+        ALFRED real-time 관측값 행을 델타로 반영합니다.
+
+        Args:
+            series_id: FRED 시리즈 ID
+            rows: [{date, value, realtime_start, realtime_end}, ...] (FRED 원본 형식)
+            synced_through: 이번 동기화로 반영된 마지막 real-time 날짜
+
+        Returns:
+            새로 저장된 델타 개수
+        """
+        vintages = self.load(series_id)
+
+        # 빈티지 순서대로 적용해야 직전 값과 비교한 델타가 올바름
+        rows = sorted(rows, key=lambda row: (row["realtime_start"], row["date"]))
+
+        added = 0
+        for row in rows:
+            value = None if row["value"] == "." else float(row["value"])
+            if vintages.add(row["date"], row["realtime_start"], value):
+                added += 1
+
+        vintages.synced_through = max(vintages.synced_through or "", synced_through)
+        return added
+
+
+@lru_cache()
+def get_vintage_store() -> VintageStore:
+    """
+    VintageStore 인스턴스를 반환합니다.
+    """
+    return VintageStore(settings.vintage_dir or os.path.join(resolve_cache_dir(), "vintages"))
@@ -0,0 +1,217 @@
+"""
+Admission control 유틸리티
+비용이 큰 엔드포인트의 동시 실행 수와 클라이언트별 요청 빈도를 제한합니다.
+
+- ConcurrencyLimiter: 동시 실행 수 + 제한된 대기열 (가득 차면 즉시 거절)
+- RateLimiter: 클라이언트별 토큰 버킷
+- 거절 시 AdmissionRejected → main.py에서 429 + Retry-After로 변환
+
+제한은 워커(프로세스) 단위입니다.
+제한이 없는 엔드포인트(차트 등)는 이 풀을 거치지 않으므로 비싼 요청에 밀리지 않습니다.
+"""
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from fastapi import Request
+
+from app.config import get_settings
+
+settings = get_settings()
+
+# 오래 요청이 없던 클라이언트 버킷 정리 주기 (초)
+BUCKET_PRUNE_INTERVAL = 300
+
+
+class AdmissionRejected(Exception):
+    """
+    요청을 받아들일 수 없음 (429 응답)
+    """
+
+    def __init__(self, detail: str, retry_after: int):
+        super().__init__(detail)
+        self.detail = detail
+        self.retry_after = max(1, retry_after)
+
+
+class ConcurrencyLimiter:
+    """
+    동시 실행 수 제한기
+
+    max_concurrent개까지 바로 실행하고, 그 이상은 max_queue개까지 도착 순서대로 대기합니다.
+    대기열이 가득 찼거나 queue_timeout 안에 차례가 오지 않으면 AdmissionRejected를 발생시킵니다.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._running = 0
+        self._waiting = 0
+        # 평균 처리 시간 (Retry-After 추정용, 지수 이동 평균)
+        self._avg_duration = 1.0
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    def _estimate_wait(self) -> int:
+        rounds = (self._waiting // self.max_concurrent) + 1
+        return math.ceil(self._avg_duration * rounds)
+
+    async def acquire(self) -> float:
+        """
+        실행 슬롯을 얻습니다. 반환한 시작 시각을 release()에 넘겨야 합니다.
+        """
+        # 대기 중인 요청은 await 전에 바로 집계되므로 동시에 몰려도 정확히 제한됨
+        if self._running + self._waiting >= self.max_concurrent + self.max_queue:
+            raise AdmissionRejected(f"{self.name} 요청이 많습니다. 잠시 후 다시 시도해주세요.", self._estimate_wait())
+
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise AdmissionRejected(f"{self.name} 대기 시간이 초과되었습니다.", self._estimate_wait())
+        finally:
+            self._waiting -= 1
+
+        self._running += 1
+        return time.monotonic()
+
+    def release(self, started: float) -> None:
+        self._running -= 1
+        self._semaphore.release()
+        self._avg_duration = 0.8 * self._avg_duration + 0.2 * (time.monotonic() - started)
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        실행 슬롯을 얻은 뒤 블록을 실행합니다.
+
+        사용 예시:
+            async with limiter.slot():
+                ...
+        """
+        started = await self.acquire()
+        try:
+            yield
+        finally:
+            self.release(started)
+
+    def stats(self) -> Dict:
+        return {
+            "running": self._running,
+            "waiting": self._waiting,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue
+        }
+
+
+class RateLimiter:
+    """
+    클라이언트별 토큰 버킷
+
+    분당 per_minute개 요청을 허용하며, 최대 burst개까지 몰아서 보낼 수 있습니다.
+    """
+
+    def __init__(self, name: str, per_minute: int, burst: int = None):
+        self.name = name
+        self.rate = per_minute / 60.0
+        self.burst = burst or per_minute
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._last_prune = time.monotonic()
+
+    def check(self, client: str) -> None:
+        """
+        요청 하나를 소비합니다. 토큰이 없으면 AdmissionRejected를 발생시킵니다.
+        """
+        now = time.monotonic()
+        self._prune(now)
+
+        tokens, updated = self._buckets.get(client, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated) * self.rate)
+
+        if tokens < 1:
+            self._buckets[client] = (tokens, now)
+            raise AdmissionRejected(
+                f"{self.name} 요청 한도를 초과했습니다. (분당 {round(self.rate * 60)}회)",
+                math.ceil((1 - tokens) / self.rate)
+            )
+
+        self._buckets[client] = (tokens - 1, now)
+
+    def _prune(self, now: float) -> None:
+        # 버킷이 가득 찼을 시간이 지난 클라이언트는 제거
+        if now - self._last_prune < BUCKET_PRUNE_INTERVAL:
+            return
+        self._last_prune = now
+        full_after = self.burst / self.rate
+        self._buckets = {
+            client: (tokens, updated)
+            for client, (tokens, updated) in self._buckets.items()
+            if now - updated < full_after
+        }
+
+
+def client_id(request: Request) -> str:
+    """
+    요청한 클라이언트 식별자
+
+    X-Forwarded-For의 앞쪽 항목은 클라이언트가 마음대로 넣을 수 있으므로,
+    신뢰 프록시(trusted_proxy_hops개)가 오른쪽에 덧붙인 항목만 사용합니다.
+    (설정이 없거나 항목이 모자라면 연결 주소)
+    """
+    hops = settings.trusted_proxy_hops
+    forwarded = request.headers.get("x-forwarded-for")
+    if hops > 0 and forwarded:
+        entries = [entry.strip() for entry in forwarded.split(",")]
+        if len(entries) >= hops and entries[-hops]:
+            return entries[-hops]
+    return request.client.host if request.client else "unknown"
+
+
+@lru_cache()
+def get_concurrency_limiter(name: str) -> ConcurrencyLimiter:
+    """
+    이름별 ConcurrencyLimiter (ai: Gemini 호출, export: 대용량 내보내기)
+    """
+    limits = {
+        "ai": (settings.ai_max_concurrent, settings.ai_queue_size),
+        "export": (settings.export_max_concurrent, settings.export_queue_size)
+    }
+    max_concurrent, max_queue = limits[name]
+    return ConcurrencyLimiter(name, max_concurrent, max_queue, settings.admission_queue_timeout)
+
+
+@lru_cache()
+def get_rate_limiter(name: str) -> RateLimiter:
+    """
+    이름별 RateLimiter
+    """
+    per_minute = {
+        "ai": settings.ai_rate_limit,
+        "export": settings.export_rate_limit
+    }[name]
+    return RateLimiter(name, per_minute)
+
+
+def rate_limit(name: str):
+    """
+    라우트 의존성: 클라이언트별 요청 빈도 제한
+
+    사용 예시:
+        @router.post("/generate", dependencies=[Depends(rate_limit("ai"))])
+    """
+    def dependency(request: Request) -> None:
+        get_rate_limiter(name).check(client_id(request))
+
+    return dependency
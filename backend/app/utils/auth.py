@@ -0,0 +1,29 @@
+"""
+관리자 인증 유틸리티
+ADMIN_TOKEN이 설정된 경우에만 관리자 기능(프로파일링, 관리 엔드포인트)을 사용할 수 있습니다.
+"""
+import secrets
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """
+    관리자 토큰 확인 (ADMIN_TOKEN이 비어 있으면 항상 False)
+    """
+    if not settings.admin_token or not token:
+        return False
+    return secrets.compare_digest(token, settings.admin_token)
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    라우트 의존성: X-Admin-Token 헤더가 관리자 토큰과 일치해야 함
+    """
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="관리자 토큰이 필요합니다.")
@@ -0,0 +1,237 @@
+"""
+프로세스 내부 캐시 유틸리티
+계산 결과(상관관계 등)처럼 워커 간 공유가 필요 없는 값을 캐싱합니다.
+
+모든 TTLCache는 엔트리별 대략적인 바이트 크기를 기록하고 하나의 MemoryBudget을 공유합니다.
+전체 합계가 예산(CACHE_MEMORY_BUDGET_MB)을 넘으면 캐시 계층과 상관없이
+가장 오래 사용하지 않은 엔트리부터 제거합니다.
+"""
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Hashable, List, Optional
+
+# 긴 리스트는 일부 원소만 재서 전체 크기를 추정
+SIZE_SAMPLE = 32
+
+# 예산과 모든 캐시가 함께 쓰는 잠금 (to_thread로 실행되는 계산에서도 캐시를 사용하므로)
+_lock = threading.RLock()
+
+
+def estimate_size(value: Any) -> int:
+    """
+    값의 대략적인 메모리 크기(바이트)를 추정합니다.
+
+    dict/list/tuple은 재귀적으로 더하고, 원소가 많은 리스트는 SIZE_SAMPLE개를 골라 평균으로 추정합니다.
+    numpy 배열은 버퍼 크기(nbytes)를 반영합니다.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        # 데이터를 소유한 배열은 getsizeof에 버퍼가 포함되고, view는 포함되지 않음
+        return max(sys.getsizeof(value), nbytes)
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        items = list(value.items())
+        if len(items) > SIZE_SAMPLE:
+            step = len(items) / SIZE_SAMPLE
+            sample = [items[int(i * step)] for i in range(SIZE_SAMPLE)]
+            sampled = sum(_key_size(k) + estimate_size(v) for k, v in sample)
+            return size + sampled * len(items) // SIZE_SAMPLE
+        return size + sum(_key_size(k) + estimate_size(v) for k, v in items)
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = list(value)
+        if len(items) > SIZE_SAMPLE:
+            step = len(items) / SIZE_SAMPLE
+            sampled = sum(estimate_size(items[int(i * step)]) for i in range(SIZE_SAMPLE))
+            return size + sampled * len(items) // SIZE_SAMPLE
+        return size + sum(estimate_size(item) for item in items)
+
+    return size
+
+
+def _key_size(key: Any) -> int:
+    # "date", "value" 같은 식별자형 키는 intern되어 모든 dict가 공유하므로 제외
+    if isinstance(key, str) and key.isidentifier():
+        return 0
+    return estimate_size(key)
+
+
+class MemoryBudget:
+    """
+    여러 TTLCache가 공유하는 전역 메모리 예산
+
+    각 캐시는 엔트리 크기를 charge()/discharge()로 보고하고,
+    합계가 max_bytes를 넘으면 모든 캐시 중 마지막 사용 시각이 가장 오래된 엔트리를 제거합니다.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self._caches: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+    def register(self, cache: "TTLCache") -> None:
+        self._caches.add(cache)
+
+    def caches(self) -> List["TTLCache"]:
+        return sorted(self._caches, key=lambda cache: cache.name)
+
+    def charge(self, size: int) -> None:
+        self.used_bytes += size
+
+    def discharge(self, size: int) -> None:
+        self.used_bytes -= size
+
+    def enforce(self) -> int:
+        """
+        예산을 넘은 만큼 전역 LRU 순서로 엔트리를 제거합니다.
+
+        Returns:
+            제거한 엔트리 수
+        """
+        evicted = 0
+        with _lock:
+            while self.used_bytes > self.max_bytes:
+                # 각 캐시의 LRU 엔트리 중 가장 오래된 것
+                candidates = [cache for cache in self._caches if len(cache)]
+                if not candidates:
+                    break
+                oldest = min(candidates, key=lambda cache: cache.oldest_access())
+                oldest.evict_oldest()
+                evicted += 1
+        return evicted
+
+    def stats(self) -> Dict:
+        return {
+            "budget_bytes": self.max_bytes,
+            "used_bytes": self.used_bytes,
+            "layers": [cache.stats() for cache in self.caches()]
+        }
+
+
+@lru_cache()
+def get_memory_budget() -> MemoryBudget:
+    """
+    프로세스 전역 MemoryBudget 인스턴스를 반환합니다.
+    """
+    from app.config import get_settings
+    return MemoryBudget(get_settings().cache_memory_budget_mb * 1024 * 1024)
+
+
+class TTLCache:
+    """
+    TTL + LRU 캐시
+
+    최대 엔트리 수를 넘으면 가장 오래 사용하지 않은 엔트리부터 제거합니다.
+    엔트리 크기는 전역 MemoryBudget에 합산되며, 예산을 넘으면 다른 캐시의 엔트리와 함께 LRU로 제거됩니다.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: int = 3600, name: str = "default"):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.name = name
+        # key -> (value, 만료 시각, 크기, 마지막 사용 시각)
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._budget = get_memory_budget()
+        self._budget.register(self)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        캐시된 값을 반환합니다. (없거나 만료되면 None)
+        """
+        with _lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            value, expires_at, size, _ = item
+            now = time.time()
+            if expires_at <= now:
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries[key] = (value, expires_at, size, time.monotonic())
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        값을 저장합니다.
+        """
+        size = estimate_size(key) + estimate_size(value)
+        # 혼자서 예산을 넘는 값은 캐시하지 않음
+        if size > self._budget.max_bytes:
+            return
+
+        expires_at = time.time() + (ttl if ttl is not None else self.ttl)
+        with _lock:
+            self._remove(key)
+            self._entries[key] = (value, expires_at, size, time.monotonic())
+            self._bytes += size
+            self._budget.charge(size)
+
+            while len(self._entries) > self.max_entries:
+                self.evict_oldest()
+
+        self._budget.enforce()
+
+    def delete(self, key: Hashable) -> None:
+        with _lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with _lock:
+            self._budget.discharge(self._bytes)
+            self._entries.clear()
+            self._bytes = 0
+
+    def oldest_access(self) -> float:
+        """
+        LRU 엔트리의 마지막 사용 시각 (비어 있으면 inf)
+        """
+        for item in self._entries.values():
+            return item[3]
+        return float("inf")
+
+    def evict_oldest(self) -> None:
+        """
+        가장 오래 사용하지 않은 엔트리를 제거합니다.
+        """
+        with _lock:
+            if not self._entries:
+                return
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        item = self._entries.pop(key, None)
+        if item is not None:
+            self._bytes -= item[2]
+            self._budget.discharge(item[2])
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,51 @@
+"""
+날짜 관련 유틸리티
+"""
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import HTTPException
+
+# 기간 문자열 → 일 수
+PERIOD_DAYS = {
+    "1m": 30,
+    "3m": 90,
+    "6m": 180,
+    "1y": 365,
+    "3y": 365 * 3,
+    "5y": 365 * 5,
+    "10y": 365 * 10,
+    "20y": 365 * 20
+}
+
+# 전체 히스토리 기간
+MAX_PERIOD = "max"
+
+# 관측 시작일을 모를 때 사용하는 전체 히스토리 시작 날짜
+HISTORY_START = "1900-01-01"
+
+
+def get_date_range(period: str):
+    """
+    기간 문자열을 날짜 범위로 변환합니다. (max는 HISTORY_START부터)
+    """
+    end_date = datetime.now().strftime("%Y-%m-%d")
+    if period == MAX_PERIOD:
+        return HISTORY_START, end_date
+
+    days = PERIOD_DAYS.get(period, 365)
+    start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+    return start_date, end_date
+
+
+def validate_date(value: Optional[str], name: str) -> None:
+    """
+    YYYY-MM-DD 형식 날짜 파라미터 검증 (라우트용, 잘못되면 400)
+    """
+    if value is None:
+        return
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{name}는 YYYY-MM-DD 형식이어야 합니다: {value}")
@@ -0,0 +1,104 @@
+"""
+import 시간 리포트
+`python -X importtime`으로 app.main을 새 프로세스에서 import해서
+오래 걸리는 모듈과, 시작 시 로드되면 안 되는 무거운 모듈을 확인합니다.
+
+사용법 (backend 디렉토리에서):
+    python -m app.utils.import_report
+    python -m app.utils.import_report --budget-ms 1500 --top 30
+
+예산을 넘거나 무거운 모듈이 시작 시 로드되면 종료 코드 1을 반환하므로
+CI에서 시작 시간 회귀를 잡는 데 사용할 수 있습니다.
+"""
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# 시작 시 import되면 안 되는 모듈 (필요한 코드 경로에서만 로드)
+HEAVY_MODULES = [
+    "pandas",
+    "numpy",
+    "google.generativeai",
+    "pyarrow"
+]
+
+DEFAULT_BUDGET_MS = 2000
+DEFAULT_TARGET = "app.main"
+
+
+def measure_imports(target: str = DEFAULT_TARGET) -> Dict[str, Tuple[int, int]]:
+    """
+    target 모듈을 새 인터프리터에서 import하고 모듈별 (self, cumulative) 시간(μs)을 반환합니다.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{target} import 실패:\n{result.stderr[-2000:]}")
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def build_report(
+        timings: Dict[str, Tuple[int, int]],
+        target: str = DEFAULT_TARGET,
+        budget_ms: int = DEFAULT_BUDGET_MS,
+        top: int = 20
+) -> Dict:
+    """
+    측정 결과를 요약합니다. (전체 시간, 느린 모듈, 로드된 무거운 모듈, 예산 초과 여부)
+    """
+    total_ms = timings.get(target, (0, 0))[1] / 1000
+    slowest: List[Tuple[str, float]] = sorted(
+        ((name, cumulative / 1000) for name, (_, cumulative) in timings.items()),
+        key=lambda item: item[1],
+        reverse=True
+    )[:top]
+    heavy_loaded = [module for module in HEAVY_MODULES if module in timings]
+
+    return {
+        "target": target,
+        "total_ms": round(total_ms, 1),
+        "budget_ms": budget_ms,
+        "slowest": [(name, round(ms, 1)) for name, ms in slowest],
+        "heavy_loaded": heavy_loaded,
+        "ok": total_ms <= budget_ms and not heavy_loaded
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="app.main import 시간 리포트")
+    parser.add_argument("--target", default=DEFAULT_TARGET, help="측정할 모듈")
+    parser.add_argument("--budget-ms", type=int, default=DEFAULT_BUDGET_MS, help="허용 import 시간 (ms)")
+    parser.add_argument("--top", type=int, default=20, help="표시할 느린 모듈 수")
+    args = parser.parse_args()
+
+    report = build_report(measure_imports(args.target), args.target, args.budget_ms, args.top)
+
+    print(f"📦 {report['target']} import: {report['total_ms']}ms (예산 {report['budget_ms']}ms)")
+    print("-" * 60)
+    for name, ms in report["slowest"]:
+        print(f"{ms:>10.1f}ms  {name}")
+    print("-" * 60)
+
+    if report["heavy_loaded"]:
+        print(f"❌ 시작 시 로드된 무거운 모듈: {', '.join(report['heavy_loaded'])}")
+    if report["total_ms"] > report["budget_ms"]:
+        print("❌ import 시간 예산 초과")
+    if report["ok"]:
+        print("✅ 시작 시간 예산 통과")
+
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+Single-flight 유틸리티
+같은 키로 동시에 들어온 비동기 작업을 하나로 합쳐 한 번만 실행합니다.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+# 실행하던 쪽이 취소되었을 때 기다리던 쪽에 전달하는 표시 (기다리던 쪽 중 하나가 이어서 실행)
+_LEADER_CANCELLED = object()
+
+
+class SingleFlight:
+    """
+    프로세스 내부 중복 호출 병합기
+
+    같은 키의 작업이 이미 실행 중이면 새로 실행하지 않고
+    진행 중인 작업의 결과(또는 예외)를 함께 기다립니다.
+    실행하던 요청이 취소되면(클라이언트 연결 끊김 등) 기다리던 요청 중 하나가 이어서 실행합니다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def in_flight(self, key: str) -> bool:
+        """해당 키의 작업이 실행 중인지 확인합니다."""
+        return key in self._inflight
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        키 단위로 작업을 한 번만 실행하고 결과를 공유합니다.
+
+        Args:
+            key: 중복 판단 키
+            func: 실행할 코루틴 함수 (인자 없음)
+
+        Returns:
+            작업 결과
+        """
+        while True:
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            # 이미 실행 중인 작업 결과를 기다림 (취소가 전파되지 않도록 shield)
+            result = await asyncio.shield(future)
+            if result is not _LEADER_CANCELLED:
+                return result
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            # 실행하던 요청만 취소하고, 기다리던 요청은 그중 하나가 이어서 실행
+            if not future.done():
+                future.set_result(_LEADER_CANCELLED)
+            raise
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                # 기다리는 쪽이 없어도 "exception was never retrieved" 경고가 나지 않도록
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
@@ -0,0 +1,99 @@
+"""
+요청 단위 타이밍 span 유틸리티
+요청 처리 중 구간별 소요 시간을 모아 Server-Timing 헤더로 반환합니다.
+
+사용 예시:
+    with span("get_series"):
+        ...
+
+    @timed("transform")
+    def calculate_change(...):
+        ...
+"""
+import asyncio
+import functools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional
+
+from fastapi.responses import JSONResponse
+
+# 현재 요청의 span 누적값 {이름: [합계 ms, 횟수]} (요청 밖에서는 None)
+_current_spans: ContextVar[Optional[Dict[str, list]]] = ContextVar("timing_spans", default=None)
+
+
+def start_request_timing() -> Dict[str, list]:
+    """
+    새 요청의 span 저장소를 만듭니다. (미들웨어에서 호출)
+    같은 dict 객체를 공유하므로 하위 태스크/스레드에서 기록한 span도 모입니다.
+    """
+    spans: Dict[str, list] = {}
+    _current_spans.set(spans)
+    return spans
+
+
+@contextmanager
+def span(name: str):
+    """
+    블록 실행 시간을 현재 요청의 name span에 더합니다. (요청 밖에서는 아무것도 하지 않음)
+    """
+    spans = _current_spans.get()
+    if spans is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - started) * 1000
+        total = spans.setdefault(name, [0.0, 0])
+        total[0] += elapsed
+        total[1] += 1
+
+
+def timed(name: str) -> Callable:
+    """
+    함수(동기/비동기) 전체를 span으로 감싸는 데코레이터
+    """
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def format_server_timing(spans: Dict[str, list], total_ms: float) -> str:
+    """
+    Server-Timing 헤더 값을 만듭니다.
+    예: get_series;dur=12.3;desc="x3", llm;dur=2100.5, total;dur=2130.1
+    """
+    entries = []
+    for name, (elapsed, count) in spans.items():
+        entry = f"{name};dur={elapsed:.1f}"
+        if count > 1:
+            entry += f';desc="x{count}"'
+        entries.append(entry)
+    entries.append(f"total;dur={total_ms:.1f}")
+    return ", ".join(entries)
+
+
+class TimedJSONResponse(JSONResponse):
+    """
+    JSON 직렬화 시간을 serialize span으로 기록하는 기본 응답 클래스
+    """
+
+    def render(self, content) -> bytes:
+        with span("serialize"):
+            return super().render(content)
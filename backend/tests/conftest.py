@@ -0,0 +1,13 @@
+"""
+테스트 공통 설정
+API 키 없이 import할 수 있도록 환경 변수를 채우고, 공유 캐시는 메모리 백엔드를 사용합니다.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("FRED_API_KEY", "test")
+os.environ.setdefault("GEMINI_API_KEY", "test")
+os.environ.setdefault("CACHE_BACKEND", "memory")
+os.environ.setdefault("REFRESH_INTERVAL", "0")
@@ -0,0 +1,30 @@
+import pytest
+from starlette.requests import Request
+
+from app.utils import admission
+from app.utils.admission import AdmissionRejected, RateLimiter, client_id
+
+
+def make_request(forwarded=None, host="10.0.0.2"):
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "headers": headers, "client": (host, 50000)})
+
+
+def test_spoofed_leading_entry_does_not_get_new_bucket(monkeypatch):
+    monkeypatch.setattr(admission.settings, "trusted_proxy_hops", 1)
+    limiter = RateLimiter("ai", per_minute=1)
+
+    limiter.check(client_id(make_request("1.1.1.1, 203.0.113.7")))
+    # 앞쪽 항목을 바꿔도 프록시가 덧붙인 주소는 같으므로 같은 버킷
+    with pytest.raises(AdmissionRejected):
+        limiter.check(client_id(make_request("9.9.9.9, 203.0.113.7")))
+
+
+def test_forwarded_header_is_ignored_without_trusted_proxies(monkeypatch):
+    monkeypatch.setattr(admission.settings, "trusted_proxy_hops", 0)
+    assert client_id(make_request("1.1.1.1")) == "10.0.0.2"
+
+    monkeypatch.setattr(admission.settings, "trusted_proxy_hops", 2)
+    assert client_id(make_request("1.1.1.1, 203.0.113.7, 10.0.0.9")) == "203.0.113.7"
+    # 프록시 수보다 항목이 적으면 연결 주소
+    assert client_id(make_request("203.0.113.7")) == "10.0.0.2"
@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import alert_service
+from app.services.alert_service import (
+    LOCAL_RECEIVER_URL,
+    RULES_CACHE_KEY,
+    AlertEngine,
+    ThresholdEvaluator,
+    validate_webhook_url
+)
+from app.services.cache_service import MemoryCacheBackend, SharedCache
+from app.services.series_store import SeriesStore
+from app.utils.cache import get_memory_budget
+
+RULE = {"series_id": "T10Y2Y", "kind": "threshold", "op": "<", "threshold": 0, "webhook_url": LOCAL_RECEIVER_URL}
+
+
+def points(*pairs):
+    return [{"date": day, "value": value} for day, value in pairs]
+
+
+def test_first_feed_only_primes_state():
+    evaluator = ThresholdEvaluator("<", 0)
+
+    # 등록 시점에 이미 조건을 만족해도 알림 없음
+    assert evaluator.feed(points(("2024-01-01", 0.5), ("2024-02-01", -0.1))) == []
+    assert evaluator.primed and evaluator.active is True
+
+    events = evaluator.feed(points(("2024-02-01", 0.3), ("2024-03-01", 0.2), ("2024-04-01", -0.2)))
+    # 이미 반영한 날짜는 건너뛰고, 조건이 바뀌는 순간만 알림
+    assert [(e["date"], e["status"]) for e in events] == [("2024-03-01", "resolved"), ("2024-04-01", "triggered")]
+
+
+async def deliver(*engines):
+    await asyncio.sleep(0)
+    await asyncio.gather(*[task for engine in engines for task in list(engine._deliveries)])
+
+
+def test_new_points_are_evaluated_and_delivered_once_across_workers():
+    cache = SharedCache(MemoryCacheBackend())
+
+    async def run():
+        # 같은 공유 캐시를 쓰는 두 워커
+        stores = [SeriesStore(), SeriesStore()]
+        engines = [AlertEngine(store, cache) for store in stores]
+        for store in stores:
+            store.ingest("T10Y2Y", points(("2024-01-01", 0.4), ("2024-02-01", 0.3)))
+
+        rule = await engines[0].add_rule(RULE)
+        await engines[1].sync(force=True)
+
+        for store in stores:
+            store.ingest("T10Y2Y", points(("2024-03-01", -0.1)))
+        await deliver(*engines)
+        return rule, engines
+
+    rule, engines = asyncio.run(run())
+    for engine in engines:
+        assert [(e["date"], e["status"]) for e in engine.events()] == [("2024-03-01", "triggered")]
+    received = engines[0].receiver.received() + engines[1].receiver.received()
+    assert [(r["rule_id"], r["date"]) for r in received] == [(rule["id"], "2024-03-01")]
+
+
+def test_revised_history_rebuilds_state_without_alerting():
+    cache = SharedCache(MemoryCacheBackend())
+
+    async def run():
+        store = SeriesStore()
+        engine = AlertEngine(store, cache)
+        store.ingest("T10Y2Y", points(("2024-01-01", 0.4), ("2024-02-01", 0.3)))
+        rule = await engine.add_rule(RULE)
+
+        # 과거 값 수정 → 상태만 다시 계산 (수정된 과거 값으로는 알림 없음)
+        store.ingest("T10Y2Y", points(("2024-02-01", -0.5)))
+        assert engine.events() == []
+        assert engine.rules()[0]["state"]["active"] is True
+
+        # 다시 만든 상태 기준으로 새 관측값 평가
+        store.ingest("T10Y2Y", points(("2024-03-01", 0.1)))
+        await deliver(engine)
+        return rule, engine
+
+    rule, engine = asyncio.run(run())
+    assert [(e["date"], e["status"]) for e in engine.events()] == [("2024-03-01", "resolved")]
+    assert [r["status"] for r in engine.receiver.received()] == ["resolved"]
+
+
+def test_rules_survive_memory_budget_eviction(monkeypatch):
+    cache = SharedCache(MemoryCacheBackend())
+
+    async def run():
+        engine = AlertEngine(SeriesStore(), cache)
+        rule = await engine.add_rule(RULE)
+
+        budget = get_memory_budget()
+        monkeypatch.setattr(budget, "max_bytes", 0)
+        budget.enforce()
+        return rule, await cache.get(RULES_CACHE_KEY)
+
+    rule, rules = asyncio.run(run())
+    assert list(rules) == [rule["id"]]
+
+
+@pytest.mark.parametrize("url", [
+    "ftp://example.com/hook",
+    "http://localhost:8000/api/alerts/receiver",
+    "http://127.0.0.1/hook",
+    "http://10.0.0.5/hook",
+    "http://169.254.169.254/latest/meta-data",
+    "http://[::1]/hook"
+])
+def test_internal_webhooks_are_rejected(url):
+    with pytest.raises(ValueError):
+        asyncio.run(validate_webhook_url(url))
+
+
+def test_public_and_allowlisted_webhooks_are_accepted(monkeypatch):
+    asyncio.run(validate_webhook_url("https://93.184.216.34/hook"))
+
+    monkeypatch.setattr(alert_service.settings, "alert_webhook_hosts", ["hooks.internal"])
+    asyncio.run(validate_webhook_url("http://hooks.internal/alert"))
+    with pytest.raises(ValueError):
+        asyncio.run(validate_webhook_url("https://93.184.216.34/hook"))
+
+
+def test_rule_routes_require_admin_token():
+    client = TestClient(app)
+    assert client.get("/api/alerts").status_code == 403
+    assert client.get("/api/alerts/events").status_code == 403
+    assert client.post("/api/alerts", json=RULE).status_code == 403
+    assert client.delete("/api/alerts/abc").status_code == 403
@@ -0,0 +1,46 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.services.cache_service import FileCacheBackend, LockTimeout, MemoryCacheBackend, SharedCache
+
+
+def test_lock_times_out_while_held():
+    async def scenario():
+        cache = SharedCache(MemoryCacheBackend(), lock_lease=30, poll_interval=0.01)
+        async with cache.lock("k"):
+            with pytest.raises(LockTimeout):
+                async with cache.lock("k", timeout=0.05):
+                    pass
+
+    asyncio.run(scenario())
+
+
+def test_lease_is_renewed_while_block_runs():
+    async def scenario():
+        backend = MemoryCacheBackend()
+        cache = SharedCache(backend, lock_lease=1, poll_interval=0.01)
+
+        async with cache.lock("sync"):
+            # lease(1초)보다 오래 걸리는 작업 중에도 다른 쪽이 잠금을 가져가지 못해야 함
+            await asyncio.sleep(1.5)
+            assert await backend.acquire_lock("sync", 1) is None
+
+        # 블록이 끝나면 해제
+        assert await backend.acquire_lock("sync", 1) is not None
+
+    asyncio.run(scenario())
+
+
+def test_file_cache_purges_off_the_event_loop(tmp_path):
+    backend = FileCacheBackend(str(tmp_path))
+    threads = []
+    backend.purge_expired = lambda: threads.append(threading.current_thread())
+
+    async def scenario():
+        for i in range(100):
+            await backend.set(f"k{i}", i, ttl=60)
+
+    asyncio.run(scenario())
+    assert len(threads) == 1 and threads[0] is not threading.main_thread()
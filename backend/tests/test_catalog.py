@@ -0,0 +1,30 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import series_catalog
+from app.services.cache_service import MemoryCacheBackend, SharedCache
+from app.services.series_catalog import SeriesCatalog
+
+
+def test_registration_is_capped(monkeypatch):
+    monkeypatch.setattr(series_catalog.settings, "catalog_max_registered", 1)
+    catalog = SeriesCatalog(SharedCache(MemoryCacheBackend()))
+
+    async def run():
+        await catalog.register("UNEMPLOY", "employment", None, {"title": "Unemployed"})
+        # 이미 등록된 시리즈를 다시 등록(수정)하는 것은 허용
+        await catalog.register("UNEMPLOY", "employment", "실업자 수", {"title": "Unemployed"})
+        with pytest.raises(ValueError):
+            await catalog.register("CIVPART", "employment", None, {"title": "Participation"})
+
+    asyncio.run(run())
+    assert catalog.contains("UNEMPLOY") and not catalog.contains("CIVPART")
+
+
+def test_registration_requires_admin_token():
+    client = TestClient(app)
+    assert client.post("/api/catalog/series", json={"series_id": "UNEMPLOY", "category": "employment"}).status_code == 403
+    assert client.delete("/api/catalog/series/UNEMPLOY").status_code == 403
@@ -0,0 +1,43 @@
+import asyncio
+
+from app.services.fred_service import FREDService
+
+
+def make_service():
+    service = FREDService()
+
+    async def get_series(series_id, start_date, end_date):
+        if series_id == "OK":
+            return {"series_id": series_id, "data": [{"date": "2024-01-01", "value": 1.0}], "count": 1}
+        if series_id == "HTTP":
+            return {"series_id": series_id, "data": [], "count": 0, "error": "HTTP 500"}
+        if series_id == "RAISE":
+            raise RuntimeError("boom")
+        if series_id == "CANCEL":
+            raise asyncio.CancelledError()
+        await asyncio.sleep(0.3)
+        return {"series_id": series_id, "data": [], "count": 0}
+
+    async def no_stale(series_id, start_date, end_date):
+        return None
+
+    service.get_series = get_series
+    service.get_stale_series = no_stale
+    return service
+
+
+def test_errors_without_fallback_are_failed_not_pending():
+    service = make_service()
+
+    async def run():
+        result = await service.get_multiple_series_within(
+            ["OK", "HTTP", "RAISE", "CANCEL", "SLOW"], "2024-01-01", "2024-12-31", 0.1
+        )
+        await service._background
+        return result
+
+    results, status = asyncio.run(run())
+    assert status == {"stale": [], "pending": ["SLOW"], "failed": ["HTTP", "RAISE", "CANCEL"]}
+    assert results["OK"]["count"] == 1
+    assert results["RAISE"]["error"] == "boom"
+    assert results["SLOW"]["pending"] is True
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from app.services.correlation_service import apply_transform, correlation_matrix, lagged_correlations
+
+
+def test_correlation_matches_numpy_without_gaps():
+    rng = np.random.default_rng(0)
+    matrix = rng.normal(size=(60, 3)).cumsum(axis=0)
+
+    np.testing.assert_allclose(correlation_matrix(matrix), np.corrcoef(matrix, rowvar=False), atol=1e-10)
+
+
+def test_pct_keeps_undefined_returns_as_nan():
+    matrix = np.array([[1.0, 2.0], [0.0, 4.0], [3.0, 8.0], [6.0, 4.0]])
+    pct = apply_transform(matrix, "pct")
+
+    # 0에서의 변화율은 계산할 수 없음 → 0이 아니라 NaN
+    assert np.isnan(pct[1, 0])
+    assert pct[1, 1] == 100.0
+
+
+def test_correlation_drops_missing_rows_pairwise():
+    rng = np.random.default_rng(1)
+    matrix = rng.normal(size=(80, 3))
+    matrix[[3, 10, 11, 40], 0] = np.nan
+    matrix[[20, 50], 2] = np.nan
+
+    expected = pd.DataFrame(matrix).corr().to_numpy()
+    np.testing.assert_allclose(correlation_matrix(matrix), expected, atol=1e-10)
+
+
+def test_lagged_correlation_matches_shifted_pairs():
+    rng = np.random.default_rng(2)
+    x = rng.normal(size=100)
+    matrix = np.column_stack([x, np.roll(x, 3) + rng.normal(scale=0.1, size=100)])
+    matrix[7, 0] = np.nan
+
+    lagged = lagged_correlations(matrix, max_lag=5)
+    frame = pd.DataFrame(matrix)
+    for lag in range(-5, 6):
+        expected = frame[0].corr(frame[1].shift(-lag))
+        assert abs(lagged[lag + 5, 0, 1] - expected) < 1e-10
+    assert np.nanargmax(lagged[:, 0, 1]) == 3 + 5
+
+
+def test_constant_column_correlates_as_zero():
+    matrix = np.column_stack([np.full(10, 5.0), np.arange(10.0)])
+    corr = correlation_matrix(matrix)
+    assert corr[0, 1] == 0.0
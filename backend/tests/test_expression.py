@@ -0,0 +1,38 @@
+from app.services.expression_service import compute_expression, lookback_days, parse_expression
+
+FREQUENCIES = {"GDP": "Q", "DFF": "D", "PAYEMS": "M"}
+
+QUARTERS = [
+    {"date": date, "value": 100.0 + i}
+    for i, date in enumerate(["2023-01-01", "2023-04-01", "2023-07-01", "2023-10-01",
+                              "2024-01-01", "2024-04-01", "2024-07-01"])
+]
+
+
+def parse(expression):
+    return parse_expression(expression, FREQUENCIES.__contains__)
+
+
+def test_lag_longer_than_series_is_empty():
+    parsed = parse("lag(GDP, 10) + 1")
+    assert compute_expression(parsed, {"GDP": QUARTERS}, "2023-01-01") == []
+
+    parsed = parse("lag(GDP, 7)")
+    assert compute_expression(parsed, {"GDP": QUARTERS}, "2023-01-01") == []
+
+    parsed = parse("lag(GDP, 6)")
+    assert compute_expression(parsed, {"GDP": QUARTERS}, "2023-01-01") == [{"date": "2024-07-01", "value": 100.0}]
+
+
+def test_lookback_follows_series_frequency():
+    def extra(expression):
+        return lookback_days(parse(expression).tree, FREQUENCIES.get)
+
+    assert extra("lag(GDP, 10)") == 920
+    assert extra("ma(PAYEMS, 12)") == 372
+    assert extra("ma(DFF, 20)") == 30
+    # 주기가 다른 시리즈 연산은 더 긴 주기 기준, resample 뒤에는 변환된 주기 기준
+    assert extra("lag(DFF - GDP, 4)") == 368
+    assert extra("ma(resample(DFF, M), 3)") == 93
+    # 주기를 모르면 월별로 간주
+    assert lookback_days(parse("lag(GDP, 2)").tree, lambda series_id: None) == 62
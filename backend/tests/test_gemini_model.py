@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import gemini_service
+from app.services.gemini_service import GeminiService
+
+
+class FakeGenAI:
+    def __init__(self, available, fail=False):
+        self.available = available
+        self.fail = fail
+        self.list_calls = 0
+        self.prompts = []
+
+    def list_models(self):
+        self.list_calls += 1
+        return [
+            SimpleNamespace(name=name, supported_generation_methods=["generateContent"])
+            for name in self.available
+        ]
+
+    def GenerativeModel(self, name):
+        genai = self
+
+        class Model:
+            def generate_content(self, prompt):
+                genai.prompts.append((name, prompt))
+                if genai.fail:
+                    raise RuntimeError("quota")
+                return SimpleNamespace(text="ok")
+
+        return Model()
+
+
+def test_model_is_resolved_once_without_sending_prompts(monkeypatch):
+    fake = FakeGenAI(["models/gemini-1.5-flash", "models/gemini-2.0-flash"])
+    monkeypatch.setattr(gemini_service, "_genai", lambda: fake)
+    service = GeminiService()
+
+    assert service._generate("a").text == "ok"
+    assert service._generate("b").text == "ok"
+
+    assert service.model_name == "models/gemini-2.0-flash"
+    assert fake.list_calls == 1
+    assert fake.prompts == [("models/gemini-2.0-flash", "a"), ("models/gemini-2.0-flash", "b")]
+
+
+def test_failed_generation_is_not_retried_on_other_models(monkeypatch):
+    fake = FakeGenAI(["models/gemini-2.5-flash", "models/gemini-1.5-flash"], fail=True)
+    monkeypatch.setattr(gemini_service, "_genai", lambda: fake)
+    service = GeminiService()
+
+    with pytest.raises(RuntimeError):
+        service._generate("prompt")
+    assert len(fake.prompts) == 1
@@ -0,0 +1,62 @@
+import asyncio
+import math
+from datetime import date, timedelta
+
+import pytest
+
+from app.services.history_service import day_before, iter_history, read_page
+from app.services.resample_service import resample_observations
+
+START, END = "2008-12-15", "2021-01-10"
+
+
+def daily_observations():
+    day, end, result = date.fromisoformat(START), date.fromisoformat(END), []
+    while day <= end:
+        # 주말은 관측값 없음 (일별 영업일 시리즈처럼)
+        if day.weekday() < 5:
+            result.append({"date": day.isoformat(), "value": round(5 + math.sin(day.toordinal() / 40) * 2, 3)})
+        day += timedelta(days=1)
+    return result
+
+
+class FakeFred:
+    """
+    FREDService.iter_series_chunks처럼 10년 단위 달력 청크를 최신 청크부터 내림차순으로 반환
+    """
+
+    def __init__(self, observations):
+        self.observations = observations
+
+    async def iter_series_chunks(self, series_id, start_date, end_date=None, descending=False):
+        end_date = end_date or END
+        for year in (2020, 2010, 2000):
+            chunk = [
+                obs for obs in reversed(self.observations)
+                if f"{year}-01-01" <= obs["date"] <= f"{year + 9}-12-31" and start_date <= obs["date"] <= end_date
+            ]
+            if chunk:
+                yield chunk
+
+
+@pytest.mark.parametrize("agg", ["last", "mean", "sum", "max"])
+def test_weekly_pages_match_full_resample(agg):
+    observations = daily_observations()
+    fred = FakeFred(observations)
+    expected = resample_observations(observations, "W", agg)
+
+    async def pages():
+        result, end_date = [], END
+        while True:
+            page, before = await read_page(fred, "DFF", START, end_date, 50, "W", agg)
+            result.extend(page)
+            if before is None:
+                return result
+            end_date = day_before(before)
+
+    async def streamed():
+        return [bucket async for part in iter_history(fred, "DFF", START, END, "W", agg) for bucket in part]
+
+    # 연말(2009/2010, 2019/2020)에 걸친 주도 잘리지 않고 한 버킷으로 합쳐져야 함
+    assert asyncio.run(pages()) == expected
+    assert asyncio.run(streamed()) == expected
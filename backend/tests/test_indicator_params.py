@@ -0,0 +1,23 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_invalid_as_of_is_rejected():
+    response = client.get("/api/indicators/series/PAYEMS", params={"as_of": "not-a-date"})
+    assert response.status_code == 400
+
+
+def test_invalid_revision_date_is_rejected():
+    response = client.get("/api/indicators/series/PAYEMS/revisions", params={"date": "2024-13-40"})
+    assert response.status_code == 400
+
+
+def test_invalid_export_dates_are_rejected_before_streaming():
+    response = client.get("/api/export", params={"series": "DFF", "start": "abc"})
+    assert response.status_code == 400
+
+    response = client.get("/api/export", params={"series": "DFF", "start": "2024-02-01", "end": "2024-01-01"})
+    assert response.status_code == 400
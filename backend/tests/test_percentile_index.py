@@ -0,0 +1,65 @@
+import asyncio
+
+from app.services import percentile_index
+from app.services.percentile_index import PercentileIndexRegistry
+from app.services.series_store import SeriesStore
+
+
+class FakeFred:
+    def __init__(self):
+        self.info_requests = []
+        self.chunk_starts = []
+
+    async def get_multiple_series_info(self, series_ids):
+        self.info_requests.append(list(series_ids))
+        return {series_id: {"title": series_id, "observation_start": "1948-01-01"} for series_id in series_ids}
+
+    async def iter_series_chunks(self, series_id, start_date, end_date=None, descending=False):
+        self.chunk_starts.append(start_date)
+        yield [{"date": "1948-01-01", "value": 3.4}, {"date": "1948-02-01", "value": 3.8}]
+
+
+def test_load_reads_history_from_observation_start():
+    registry = PercentileIndexRegistry(SeriesStore())
+    registry.catalog.get("UNRATE").pop("observation_start", None)
+    fred = FakeFred()
+
+    asyncio.run(registry.load(fred, ["UNRATE"]))
+    # 메타데이터를 먼저 가져와서 HISTORY_START가 아닌 관측 시작일부터 읽음
+    assert fred.info_requests == [["UNRATE"]]
+    assert fred.chunk_starts == ["1948-01-01"]
+    assert registry.value_at("UNRATE", "1948-03-01") == {"date": "1948-02-01", "value": 3.8}
+
+    # 이미 로드했거나 메타데이터가 있으면 다시 요청하지 않음
+    asyncio.run(registry.load(fred, ["UNRATE"]))
+    assert fred.info_requests == [["UNRATE"]]
+
+
+class EmptyFred(FakeFred):
+    async def iter_series_chunks(self, series_id, start_date, end_date=None, descending=False):
+        self.chunk_starts.append(start_date)
+        return
+        yield
+
+    async def close(self):
+        pass
+
+
+def test_empty_history_is_not_reloaded_until_retry_interval(monkeypatch):
+    registry = PercentileIndexRegistry(SeriesStore())
+    fred = EmptyFred()
+    monkeypatch.setattr(percentile_index, "get_fred_service", lambda: fred)
+
+    async def ensure_twice():
+        for _ in range(2):
+            registry.ensure_loaded(["UNRATE"])
+            await asyncio.gather(*percentile_index._background_tasks)
+
+    asyncio.run(ensure_twice())
+    # 빈 히스토리는 실패로 기록되어 다음 요청에서 다시 읽지 않음
+    assert len(fred.chunk_starts) == 1
+    assert registry.memory_usage()["failed"] == ["UNRATE"]
+
+    monkeypatch.setattr(percentile_index, "LOAD_RETRY_INTERVAL", 0)
+    asyncio.run(ensure_twice())
+    assert len(fred.chunk_starts) == 3
@@ -0,0 +1,18 @@
+import pytest
+
+from app.services.profiling_service import ProfilerBusy, RequestProfiler
+
+
+def test_second_profiler_is_rejected_until_first_stops():
+    first = RequestProfiler()
+    first.start()
+    try:
+        with pytest.raises(ProfilerBusy):
+            RequestProfiler().start()
+    finally:
+        first.stop()
+
+    second = RequestProfiler()
+    second.start()
+    second.stop()
+    assert second.render()
@@ -0,0 +1,21 @@
+from app.services.prompt_context import format_value, is_percent_series
+from app.services.series_catalog import get_series_catalog
+
+
+def test_units_from_catalog_decide_percent_series(monkeypatch):
+    catalog = get_series_catalog()
+    # 런타임 등록된 % 단위 시리즈 (이름/카테고리로는 알 수 없음)
+    monkeypatch.setitem(catalog._entries, "CIVPART", {
+        "series_id": "CIVPART", "name": "경제활동참가율", "category": "employment", "units_short": "%"
+    })
+    monkeypatch.setitem(catalog.get("PAYEMS"), "units_short", "Thous. of Persons")
+
+    assert is_percent_series("employment", "CIVPART", "경제활동참가율")
+    assert format_value("employment", "CIVPART", {"name": "경제활동참가율", "value": 62.5}) == "62.5%"
+    assert not is_percent_series("employment", "PAYEMS", "Nonfarm Payrolls Growth")
+
+
+def test_heuristic_is_used_without_units(monkeypatch):
+    monkeypatch.setitem(get_series_catalog().get("UNRATE"), "units_short", None)
+    assert is_percent_series("employment", "UNRATE", "Unemployment Rate")
+    assert not is_percent_series("employment", "UNKNOWN", "Level")
@@ -0,0 +1,60 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from app.services.cache_service import MemoryCacheBackend, SharedCache
+from app.services.gemini_service import GeminiService
+
+INDICATORS = {
+    "DFF": {"name": "Federal Funds Rate", "value": 4.33, "date": "2025-01-01", "previous_value": None},
+    "UNRATE": {"name": "Unemployment Rate", "value": 4.1, "date": "2025-01-01", "previous_value": None}
+}
+
+
+def make_service(generate):
+    service = GeminiService()
+    service.cache = SharedCache(MemoryCacheBackend())
+    service.prompts = []
+
+    def fake_generate(prompt):
+        service.prompts.append(prompt)
+        return generate(prompt)
+
+    service._generate = fake_generate
+    return service
+
+
+def test_failed_batch_is_not_requested_again():
+    def fail(prompt):
+        raise RuntimeError("quota")
+
+    service = make_service(fail)
+
+    async def run():
+        first = await service.generate_quick_insights(INDICATORS)
+        second = await service.generate_quick_insights(INDICATORS)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second == {"DFF": "Federal Funds Rate: 4.33", "UNRATE": "Unemployment Rate: 4.1"}
+    assert len(service.prompts) == 1
+
+
+def test_concurrent_requests_do_not_wait_for_generation():
+    def slow(prompt):
+        time.sleep(0.3)
+        return SimpleNamespace(text='{"DFF": "금리 유지", "UNRATE": "고용 안정"}')
+
+    service = make_service(slow)
+
+    async def run():
+        leader = asyncio.create_task(service.generate_quick_insights(INDICATORS))
+        await asyncio.sleep(0.1)
+        # 생성 중인 배치는 잠금을 기다리지 않고 값만 받음
+        waiting = await asyncio.wait_for(service.generate_quick_insights(INDICATORS), timeout=0.15)
+        return await leader, waiting, await service.generate_quick_insights(INDICATORS)
+
+    leader, waiting, cached = asyncio.run(run())
+    assert leader == cached == {"DFF": "금리 유지", "UNRATE": "고용 안정"}
+    assert waiting["DFF"] == "Federal Funds Rate: 4.33"
+    assert len(service.prompts) == 1
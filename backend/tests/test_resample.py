@@ -0,0 +1,21 @@
+from app.services.resample_service import resample_series_data
+
+
+def vintage_data(vintage_date, values):
+    return {
+        "series_id": "PAYEMS",
+        "data": [{"date": f"2024-0{month}-01", "value": value} for month, value in zip((3, 2, 1), values)],
+        "start_date": "2024-01-01",
+        "end_date": "2024-03-31",
+        "as_of": "2024-06-01",
+        "vintage_date": vintage_date
+    }
+
+
+def test_vintage_resample_is_keyed_by_vintage():
+    first = resample_series_data(vintage_data("2024-05-03", [3.0, 2.0, 1.0]), "Q", "mean", "2024-06-01")
+    # 같은 as_of라도 반영된 빈티지가 다르면 (예: 동기화 후) 다시 계산
+    revised = resample_series_data(vintage_data("2024-05-31", [6.0, 2.0, 1.0]), "Q", "mean", "2024-06-01")
+
+    assert first["data"] == [{"date": "2024-01-01", "value": 2.0}]
+    assert revised["data"] == [{"date": "2024-01-01", "value": 3.0}]
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from app.utils.singleflight import SingleFlight
+
+
+def test_joiners_share_result():
+    async def scenario():
+        flight = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*[flight.do("k", work) for _ in range(5)])
+        return results, calls
+
+    results, calls = asyncio.run(scenario())
+    assert results == [42] * 5
+    assert len(calls) == 1
+
+
+def test_cancelled_leader_hands_over_to_joiner():
+    async def scenario():
+        flight = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        joiners = [asyncio.create_task(flight.do("k", work)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        return await asyncio.gather(*joiners), calls
+
+    results, calls = asyncio.run(scenario())
+    assert results == ["done"] * 3
+    # 취소된 실행 1번 + 이어받은 실행 1번
+    assert len(calls) == 2
+
+
+def test_leader_exception_reaches_joiners():
+    async def scenario():
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        return await asyncio.gather(*[flight.do("k", work) for _ in range(3)], return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, ValueError) for r in results)
@@ -0,0 +1,18 @@
+from app.services.series_store import get_series_store
+from app.services.snapshot_service import IndicatorSnapshot
+
+
+def test_version_is_derived_from_content():
+    store = get_series_store()
+    store.ingest("UNRATE", [{"date": "2024-01-01", "value": 3.7}, {"date": "2024-02-01", "value": 3.9}])
+
+    # 서로 다른 워커처럼 독립적으로 만든 스냅샷도 같은 데이터면 같은 버전
+    first, second = IndicatorSnapshot(), IndicatorSnapshot()
+    first._bump()
+    first._bump()
+    assert first.version == second.version
+
+    before = first.version
+    store.ingest("UNRATE", [{"date": "2024-03-01", "value": 3.8}])
+    assert first.version != before
+    assert first.version == second.version
@@ -0,0 +1,15 @@
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.main import app
+
+
+def test_websocket_task_errors_are_logged(capsys):
+    client = TestClient(app)
+    with client.websocket_connect("/api/stream/ws") as websocket:
+        websocket.send_text("not json")
+        with pytest.raises(WebSocketDisconnect):
+            websocket.receive_json()
+
+    assert "⚠️ WebSocket 구독 에러: JSONDecodeError" in capsys.readouterr().out
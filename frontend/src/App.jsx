@@ -15,11 +15,46 @@ function App() {
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState(null);
     const [lastUpdated, setLastUpdated] = useState(null);
+    const [insights, setInsights] = useState({});
 
     useEffect(() => {
         loadData();
     }, []);
 
+    // 폴링 대신 서버 push로 변경된 지표만 반영
+    useEffect(() => {
+        const unsubscribe = api.subscribeUpdates({}, (message) => {
+            if (message.type === 'resync') {
+                loadData();
+                return;
+            }
+            if (message.type !== 'update' || !message.summary) return;
+
+            const { category, series_id: seriesId, summary: item } = message;
+            setSummary((prev) => {
+                if (!prev?.summary?.[category]) return prev;
+                return {
+                    ...prev,
+                    summary: {
+                        ...prev.summary,
+                        [category]: {
+                            ...prev.summary[category],
+                            [seriesId]: {
+                                ...prev.summary[category][seriesId],
+                                name: item.name,
+                                value: item.value,
+                                date: item.date
+                            }
+                        }
+                    }
+                };
+            });
+            setLastUpdated(message.sent_at);
+        });
+
+        return unsubscribe;
+    }, []);
+
     const loadData = async () => {
         try {
             setLoading(true);
@@ -29,6 +64,11 @@ function App() {
             setSummary(summaryData);
             setLastUpdated(summaryData.updated_at);
 
+            // 인사이트는 AI 응답을 기다리지 않고 도착하면 카드에 표시
+            api.getInsights()
+                .then((data) => setInsights(data.insights))
+                .catch((err) => console.error('인사이트 로드 에러:', err));
+
         } catch (err) {
             setError(err.message);
             console.error('데이터 로드 에러:', err);
@@ -49,6 +89,8 @@ function App() {
                 value: dff.value,
                 unit: '%',
                 date: dff.date,
+                history: dff.history?.['10y'],
+                insight: insights.DFF?.insight,
                 icon: '💰',
                 color: 'blue'
             });
@@ -61,6 +103,8 @@ function App() {
                 value: cpi.value,
                 unit: '',
                 date: cpi.date,
+                history: cpi.history?.['10y'],
+                insight: insights.CPIAUCSL?.insight,
                 icon: '📈',
                 color: 'orange'
             });
@@ -73,6 +117,8 @@ function App() {
                 value: unrate.value,
                 unit: '%',
                 date: unrate.date,
+                history: unrate.history?.['10y'],
+                insight: insights.UNRATE?.insight,
                 icon: '💼',
                 color: 'green'
             });
@@ -85,6 +131,8 @@ function App() {
                 value: growth.value,
                 unit: '%',
                 date: growth.date,
+                history: growth.history?.['10y'],
+                insight: insights.A191RL1Q225SBEA?.insight,
                 icon: '📊',
                 color: 'purple'
             });
@@ -97,6 +145,8 @@ function App() {
                 value: sentiment.value,
                 unit: '',
                 date: sentiment.date,
+                history: sentiment.history?.['10y'],
+                insight: insights.UMCSENT?.insight,
                 icon: '🔮',
                 color: 'indigo'
             });
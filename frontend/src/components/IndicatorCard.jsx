@@ -1,6 +1,6 @@
 import { TrendingUp, TrendingDown, Minus } from 'lucide-react';
 
-function IndicatorCard({ title, value, unit = '', change, changePercent, date, icon, color = 'blue' }) {
+function IndicatorCard({ title, value, unit = '', change, changePercent, date, history, insight, icon, color = 'blue' }) {
     const getTrendIcon = () => {
         if (!change) return <Minus className="w-4 h-4 sm:w-5 sm:h-5" />;
         if (change > 0) return <TrendingUp className="w-4 h-4 sm:w-5 sm:h-5" />;
@@ -63,10 +63,23 @@ function IndicatorCard({ title, value, unit = '', change, changePercent, date, i
                 </div>
             )}
 
+            {/* 과거 10년 대비 위치 */}
+            {history && (
+                <p className="text-xs text-gray-600 mt-2">
+                    10년 중 {history.percentile}번째 백분위
+                    {history.z_score !== null && ` · z ${history.z_score > 0 ? '+' : ''}${history.z_score}`}
+                </p>
+            )}
+
             {/* 날짜 */}
             {date && (
                 <p className="text-xs text-gray-500 mt-2">{date}</p>
             )}
+
+            {/* AI 인사이트 */}
+            {insight && (
+                <p className="text-xs text-gray-600 mt-2 leading-relaxed">{insight}</p>
+            )}
         </div>
     );
 }
@@ -116,6 +116,42 @@ export const api = {
         }
     },
 
+    /**
+     * 지표 변경분 구독 (Server-Sent Events)
+     * 새로 추가되거나 수정된 관측값만 push로 받습니다.
+     *
+     * @param {Object} options - { series: [...], categories: [...] } (생략 시 전체)
+     * @param {Function} onMessage - 메시지 콜백 ({type: 'subscribed' | 'update' | 'resync', ...})
+     * @returns {Function} 구독 해제 함수
+     */
+    subscribeUpdates: ({ series = [], categories = [] } = {}, onMessage) => {
+        const params = new URLSearchParams();
+        if (series.length) params.set('series', series.join(','));
+        if (categories.length) params.set('categories', categories.join(','));
+
+        const source = new EventSource(`${API_BASE_URL}/api/stream/sse?${params.toString()}`);
+        ['subscribed', 'update', 'resync'].forEach((type) => {
+            source.addEventListener(type, (event) => onMessage(JSON.parse(event.data)));
+        });
+        source.onerror = (error) => console.error('업데이트 스트림 에러:', error);
+
+        return () => source.close();
+    },
+
+    /**
+     * 지표별 한 문장 인사이트 (모든 지표를 한 번의 AI 호출로 생성, 값이 바뀔 때까지 캐시)
+     */
+    getInsights: async (series = []) => {
+        try {
+            const response = await apiClient.get('/api/analysis/insights', {
+                params: series.length ? { series: series.join(',') } : {}
+            });
+            return response.data;
+        } catch (error) {
+            handleApiError(error, '인사이트를 가져오는데 실패했습니다.');
+        }
+    },
+
     generateAnalysis: async () => {
         try {
             const response = await apiClient.post('/api/analysis/generate');